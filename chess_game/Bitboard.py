@@ -0,0 +1,587 @@
+# Author: Cooper Thompson
+# GitHub username: coopthompson
+# Date: October 18th, 2026
+# Description: Bitboard representation of a ChessVar position. Every player and
+#              piece type gets its own 64-bit integer with one bit per square,
+#              which lets the ChessVar class answer its questions with a few
+#              integer operations instead of walking a grid of objects.
+
+import sys
+
+from .TableCache import load_tables
+from .MoveTables import (
+    FULL_BOARD, KNIGHT_MASKS, KING_MASKS, PAWN_ATTACK_MASKS, PAWN_PUSH_MASKS, ROOK_MASKS,
+    BISHOP_MASKS, QUEEN_MASKS, BETWEEN, rook_attacks, bishop_attacks, queen_attacks
+)
+
+WHITE = 0
+BLACK = 1
+PLAYERS = ("White", "Black")
+
+PAWN = 0
+KNIGHT = 1
+BISHOP = 2
+ROOK = 3
+QUEEN = 4
+KING = 5
+PIECE_TYPES = ("Pawn", "Knight", "Bishop", "Rook", "Queen", "King")
+
+# A piece code combines the player and the piece type (player * 6 + piece type) so a
+# single small integer can describe what is standing on a square.
+EMPTY = -1
+
+BACK_RANK = (ROOK, KNIGHT, BISHOP, QUEEN, KING, BISHOP, KNIGHT, ROOK)
+
+# Lookup tables between square indexes and square names in both directions.
+SQUARE_NAMES = tuple(column + row for row in "12345678" for column in "abcdefgh")
+SQUARE_INDEXES = dict((name, index) for index, name in enumerate(SQUARE_NAMES))
+
+# The squares each sliding piece type could reach from every square on an empty board, indexed
+# by piece type. Only the Rook, Bishop, and Queen entries are used.
+SLIDER_MASKS = (None, None, BISHOP_MASKS, ROOK_MASKS, QUEEN_MASKS, None)
+
+# How many bytes one 64-bit number (a bitboard or a hash) takes up in memory.
+BITBOARD_BYTES = sys.getsizeof(FULL_BOARD)
+
+# Zobrist keys: a random 64-bit number for every piece code on every square, plus one for Black
+# being the player to move. XOR-ing together the keys of everything in a position gives a number
+# that identifies the position, and moving a piece only needs the keys of the squares it touched.
+# A fixed seed keeps the keys (and so the position keys) the same every time the program runs.
+def build_zobrist_keys():
+    """
+    Works out the Zobrist keys and returns them in a dictionary. This is only needed when they
+    aren't in the cache (see the TableCache module).
+    """
+    # random is only imported here since importing it takes longer than reading the keys from
+    # the cache.
+    import random
+    zobrist_random = random.Random(20231119)
+    pieces = tuple(tuple(zobrist_random.getrandbits(64) for square in range(64)) for code in range(12))
+    return {"ZOBRIST_PIECES": pieces, "ZOBRIST_BLACK_TO_MOVE": zobrist_random.getrandbits(64)}
+
+
+_zobrist_keys = load_tables("zobrist_keys", 1, build_zobrist_keys)
+ZOBRIST_PIECES = _zobrist_keys["ZOBRIST_PIECES"]
+ZOBRIST_BLACK_TO_MOVE = _zobrist_keys["ZOBRIST_BLACK_TO_MOVE"]
+
+
+def piece_code(player, piece_type):
+    """
+    Takes a player (WHITE or BLACK) and a piece type and returns the piece code for them
+    """
+    return player * 6 + piece_type
+
+
+def code_player(code):
+    """
+    Returns the player that owns the piece described by a piece code
+    """
+    return code // 6
+
+
+def code_type(code):
+    """
+    Returns the piece type of the piece described by a piece code
+    """
+    return code % 6
+
+
+def encode_move(square_from, square_to):
+    """
+    Takes a starting square and an end square (as indexes) and returns the move between them
+    packed into a single integer. The starting square is kept in the lowest 6 bits and the end
+    square in the 6 bits above them.
+    """
+    return square_from | square_to << 6
+
+
+def move_from(move):
+    """
+    Returns the starting square index of a move made by encode_move
+    """
+    return move & 63
+
+
+def move_to(move):
+    """
+    Returns the end square index of a move made by encode_move
+    """
+    return move >> 6
+
+
+def move_names(move):
+    """
+    Takes a move made by encode_move and returns its starting and end square names as a tuple,
+    ready to be passed to ChessVar's make_move
+    """
+    return SQUARE_NAMES[move & 63], SQUARE_NAMES[move >> 6]
+
+
+class InvalidSquareError(ValueError):
+    """
+    Raised when something passed in as a square is not one of the 64 squares on the board
+    """
+
+
+def square_index(name):
+    """
+    Takes a square name such as "e2" and returns its index on the bitboards. Squares are
+    numbered from a1 (0) to h8 (63), moving along the files first and then up the ranks.
+    Raises InvalidSquareError if the name isn't one of the 64 squares.
+    """
+    index = SQUARE_INDEXES.get(name) if isinstance(name, str) else None
+    if index is None:
+        raise InvalidSquareError(repr(name) + " is not a square, squares are named a1 to h8")
+    return index
+
+
+def square_name(index):
+    """
+    Takes a square index and returns its name, the reverse of square_index
+    """
+    return SQUARE_NAMES[index]
+
+
+def parse_square(square):
+    """
+    Takes a square given either as an index (0 to 63) or as a name ("a1" to "h8") and returns its
+    index. This is how ChessVar reads the squares passed to it, so each square is only converted
+    once. Raises InvalidSquareError for anything else.
+    """
+    if isinstance(square, int) and not isinstance(square, bool):
+        if 0 <= square < 64:
+            return square
+        raise InvalidSquareError(repr(square) + " is not a square, square indexes go from 0 to 63")
+    return square_index(square)
+
+
+class Bitboard:
+    """
+    Represents the pieces on a chess board as twelve 64-bit integers, one for every
+    combination of player and piece type, along with occupancy masks for each player and
+    for the whole board. Used by the ChessVar class to store its position and to check if
+    a proposed move can occur.
+    """
+    def __init__(self):
+        """
+        Initialises a Bitboard holding the starting position. Takes no parameters. A list
+        of the piece code on each square is kept next to the bitboards so that finding the
+        piece on a particular square does not require checking all twelve of them. The number
+        of pieces of every type and the number of piece types each player has run out of are
+        also kept up to date as pieces are placed and removed, so the ChessVar class can tell
+        if someone has won without looking at the board. The attack maps (see get_attacks_from)
+        are only made the first time they are asked for.
+        """
+        self._pieces = [0] * 12
+        self._occupied = [0, 0]
+        self._all = 0
+        self._squares = [EMPTY] * 64
+        self._counts = [0] * 12
+        self._missing_types = [6, 6]
+        self._hash = 0
+        self._attack_maps = None
+        self._attacked = [None, None]
+
+        for column in range(8):
+            self.put_piece(piece_code(WHITE, BACK_RANK[column]), column)
+            self.put_piece(piece_code(WHITE, PAWN), 8 + column)
+            self.put_piece(piece_code(BLACK, PAWN), 48 + column)
+            self.put_piece(piece_code(BLACK, BACK_RANK[column]), 56 + column)
+
+    def copy(self):
+        """
+        Returns a new Bitboard holding the same position as this one. The attack maps aren't
+        copied, so the copy only keeps them up to date once they are asked for on it.
+        """
+        board = Bitboard.__new__(Bitboard)
+        board._pieces = self._pieces[:]
+        board._occupied = self._occupied[:]
+        board._all = self._all
+        board._squares = self._squares[:]
+        board._counts = self._counts[:]
+        board._missing_types = self._missing_types[:]
+        board._hash = self._hash
+        board._attack_maps = None
+        board._attacked = [None, None]
+        return board
+
+    def get_pieces(self, player, piece_type):
+        """
+        Returns the bitboard for a particular player and piece type
+        """
+        return self._pieces[piece_code(player, piece_type)]
+
+    def get_piece_bitboards(self):
+        """
+        Returns a list of all twelve bitboards, indexed by piece code
+        """
+        return self._pieces[:]
+
+    def get_counts(self):
+        """
+        Returns a list of the number of pieces on the board for every piece code
+        """
+        return self._counts[:]
+
+    def set_pieces(self, bitboards):
+        """
+        Takes twelve bitboards, indexed by piece code, and replaces every piece on the board with
+        the pieces they describe. Raises ValueError if two of them share a square.
+        """
+        if len(bitboards) != 12:
+            raise ValueError("Expected 12 bitboards, got " + str(len(bitboards)))
+        for square in range(64):
+            self.remove_piece(square)
+        occupied = 0
+        for code in range(12):
+            bitboard = bitboards[code]
+            if bitboard & occupied:
+                raise ValueError("Two pieces can't share a square")
+            occupied |= bitboard
+            while bitboard:
+                lowest = bitboard & -bitboard
+                self.put_piece(code, lowest.bit_length() - 1)
+                bitboard ^= lowest
+
+    def get_occupied(self, player=None):
+        """
+        Returns the squares occupied by the given player, or by either player if no player
+        is given
+        """
+        if player is None:
+            return self._all
+        return self._occupied[player]
+
+    def get_memory_size(self):
+        """
+        Returns roughly how many bytes of memory the Bitboard takes up: the object, its lists, and
+        the 64-bit numbers in them. Small numbers like the piece codes on the squares are shared by
+        Python and aren't counted. Only looks at a fixed number of things, so it is always quick.
+        """
+        size = sys.getsizeof(self) + sys.getsizeof(self.__dict__)
+        for items in (self._pieces, self._occupied, self._squares, self._counts, self._missing_types,
+                      self._attacked):
+            size += sys.getsizeof(items)
+        # The twelve piece bitboards, the two occupancy masks, the whole board, and the hash.
+        size += BITBOARD_BYTES * 16
+        if self._attack_maps is not None:
+            size += sys.getsizeof(self._attack_maps) + BITBOARD_BYTES * 64
+        return size
+
+    def get_hash(self):
+        """
+        Returns the Zobrist hash of the pieces on the board (which player is to move is not part
+        of it). It is updated every time a piece is placed or removed.
+        """
+        return self._hash
+
+    def piece_at(self, square):
+        """
+        Returns the piece code of the piece on a square, or EMPTY if there is nothing there
+        """
+        return self._squares[square]
+
+    def put_piece(self, code, square):
+        """
+        Places the piece described by code on an empty square
+        """
+        bit = 1 << square
+        self._pieces[code] |= bit
+        self._occupied[code // 6] |= bit
+        self._all |= bit
+        self._squares[square] = code
+        self._counts[code] += 1
+        if self._counts[code] == 1:
+            self._missing_types[code // 6] -= 1
+        self._hash ^= ZOBRIST_PIECES[code][square]
+        if self._attack_maps is not None:
+            self._update_attack_maps(square)
+
+    def remove_piece(self, square):
+        """
+        Removes whatever piece is on a square and returns its piece code (EMPTY if the square
+        was already empty)
+        """
+        code = self._squares[square]
+        if code != EMPTY:
+            mask = FULL_BOARD ^ (1 << square)
+            self._pieces[code] &= mask
+            self._occupied[code // 6] &= mask
+            self._all &= mask
+            self._squares[square] = EMPTY
+            self._counts[code] -= 1
+            if self._counts[code] == 0:
+                self._missing_types[code // 6] += 1
+            self._hash ^= ZOBRIST_PIECES[code][square]
+            if self._attack_maps is not None:
+                self._update_attack_maps(square)
+        return code
+
+    def get_count(self, player, piece_type):
+        """
+        Returns how many pieces of a particular type the given player has on the board
+        """
+        return self._counts[piece_code(player, piece_type)]
+
+    def move_piece(self, square_from, square_to):
+        """
+        Moves the piece on square_from to square_to, capturing anything standing there, and returns
+        the piece code of the captured piece (EMPTY if nothing was captured)
+        """
+        captured = self.remove_piece(square_to)
+        self.put_piece(self.remove_piece(square_from), square_to)
+        return captured
+
+    def count_types(self, player):
+        """
+        Returns how many of the six piece types the given player still has on the board
+        """
+        return 6 - self._missing_types[player]
+
+    def counts_match_board(self):
+        """
+        Counts the pieces on every square of the board from scratch and returns True if the
+        result agrees with the counts that are kept up to date as pieces move. Only used to
+        double-check those counts since it has to look at all 64 squares.
+        """
+        counts = [0] * 12
+        for code in self._squares:
+            if code != EMPTY:
+                counts[code] += 1
+        missing_types = [0, 0]
+        for code in range(12):
+            if counts[code] == 0:
+                missing_types[code // 6] += 1
+            if counts[code] != self._pieces[code].bit_count():
+                return False
+        return counts == self._counts and missing_types == self._missing_types
+
+    def is_valid_move(self, square_from, square_to):
+        """
+        Takes a starting square and an end square (as indexes) and returns True if the piece
+        on the starting square is allowed to move to the end square according to how that
+        piece moves and what is standing in its way. Whose turn it is and whether the game
+        is over are left for the ChessVar class to check.
+        """
+        code = self._squares[square_from]
+        if code == EMPTY:
+            return False
+        player = code // 6
+        piece_type = code % 6
+        to_bit = 1 << square_to
+
+        if piece_type == PAWN:
+            if PAWN_ATTACK_MASKS[player][square_from] & to_bit:
+                return bool(self._occupied[1 - player] & to_bit)
+            if self._all & to_bit:
+                return False
+            pushes = PAWN_PUSH_MASKS[player][square_from]
+            if not pushes & to_bit:
+                return False
+            # Every other forward square of the pawn has to be empty, just like the squares
+            # returned by Pawn.path_to_move.
+            return not (pushes ^ to_bit) & self._all
+
+        if self._occupied[player] & to_bit:
+            return False
+        if piece_type == KNIGHT:
+            return bool(KNIGHT_MASKS[square_from] & to_bit)
+        if piece_type == KING:
+            return bool(KING_MASKS[square_from] & to_bit)
+        # A Rook, Bishop, or Queen can reach the end square if it is on one of the piece's lines
+        # and every square in between is empty.
+        if not SLIDER_MASKS[piece_type][square_from] & to_bit:
+            return False
+        return not BETWEEN[square_from][square_to] & self._all
+
+    def get_move_targets(self, square):
+        """
+        Returns a bitboard of every square the piece on the given square is allowed to move to,
+        following the same rules as is_valid_move. A pawn can capture on its forward diagonals,
+        and it can only move forward at all while every one of its forward squares is empty.
+        """
+        code = self._squares[square]
+        if code == EMPTY:
+            return 0
+        player = code // 6
+        if code % 6 == PAWN:
+            targets = PAWN_ATTACK_MASKS[player][square] & self._occupied[1 - player]
+            pushes = PAWN_PUSH_MASKS[player][square]
+            if not pushes & self._all:
+                targets |= pushes
+            return targets
+        return self.get_attacks(square) & (FULL_BOARD ^ self._occupied[player])
+
+    def generate_moves_from(self, square):
+        """
+        Returns a list of every move (made by encode_move) the piece on the given square is
+        allowed to make
+        """
+        moves = []
+        targets = self.get_move_targets(square)
+        while targets:
+            lowest = targets & -targets
+            moves.append(square | (lowest.bit_length() - 1) << 6)
+            targets ^= lowest
+        return moves
+
+    def generate_moves(self, player):
+        """
+        Returns a list of every move (made by encode_move) the given player's pieces are allowed
+        to make
+        """
+        moves = []
+        pieces = self._occupied[player]
+        while pieces:
+            lowest = pieces & -pieces
+            square = lowest.bit_length() - 1
+            targets = self.get_move_targets(square)
+            while targets:
+                target = targets & -targets
+                moves.append(square | (target.bit_length() - 1) << 6)
+                targets ^= target
+            pieces ^= lowest
+        return moves
+
+    def get_attacked(self, player):
+        """
+        Returns a bitboard of every square attacked by at least one of the given player's pieces
+        """
+        attacked = 0
+        pieces = self._occupied[player]
+        while pieces:
+            lowest = pieces & -pieces
+            attacked |= self.get_attacks(lowest.bit_length() - 1)
+            pieces ^= lowest
+        return attacked
+
+    def get_attacks(self, square):
+        """
+        Returns a bitboard of every square the piece on the given square attacks, taking the
+        pieces in the way of a Rook, Bishop, or Queen into account. Squares holding pieces of
+        either player are included. A Pawn attacks its two forward diagonals only, and an empty
+        square attacks nothing.
+        """
+        code = self._squares[square]
+        if code == EMPTY:
+            return 0
+        piece_type = code % 6
+        if piece_type == PAWN:
+            return PAWN_ATTACK_MASKS[code // 6][square]
+        if piece_type == KNIGHT:
+            return KNIGHT_MASKS[square]
+        if piece_type == KING:
+            return KING_MASKS[square]
+        if piece_type == ROOK:
+            return rook_attacks(square, self._all)
+        if piece_type == BISHOP:
+            return bishop_attacks(square, self._all)
+        return queen_attacks(square, self._all)
+
+    def get_attacks_from(self, square):
+        """
+        Returns the same bitboard as get_attacks, read from the attack maps. The first call to
+        this or the other methods using the attack maps works out the attacks of every piece, and
+        after that only the pieces a change affects are worked out again as pieces are placed and
+        removed: the piece itself and the Rooks, Bishops, and Queens whose lines reach its square.
+        """
+        if self._attack_maps is None:
+            self._build_attack_maps()
+        return self._attack_maps[square]
+
+    def get_attacked_squares(self, player):
+        """
+        Returns the same bitboard as get_attacked, worked out from the attack maps. It is kept
+        until the next piece is placed or removed.
+        """
+        if self._attack_maps is None:
+            self._build_attack_maps()
+        attacked = self._attacked[player]
+        if attacked is None:
+            attack_maps = self._attack_maps
+            attacked = 0
+            pieces = self._occupied[player]
+            while pieces:
+                lowest = pieces & -pieces
+                attacked |= attack_maps[lowest.bit_length() - 1]
+                pieces ^= lowest
+            self._attacked[player] = attacked
+        return attacked
+
+    def get_attackers(self, square, player=None):
+        """
+        Returns a bitboard of the pieces of the given player (or of both players if no player is
+        given) that attack a square, read from the attack maps
+        """
+        if self._attack_maps is None:
+            self._build_attack_maps()
+        attack_maps = self._attack_maps
+        bit = 1 << square
+        attackers = 0
+        pieces = self._all if player is None else self._occupied[player]
+        while pieces:
+            lowest = pieces & -pieces
+            if attack_maps[lowest.bit_length() - 1] & bit:
+                attackers |= lowest
+            pieces ^= lowest
+        return attackers
+
+    def is_capture_defended(self, square_from, square_to):
+        """
+        Takes a move (as square indexes) and returns True if the opponent of the player making it
+        attacks square_to once it is made, so they could take back the piece that moved there. As
+        well as the opponent's pieces attacking square_to now, this counts any Rook, Bishop, or
+        Queen whose line to square_to is only blocked by the piece that moves.
+        """
+        code = self._squares[square_from]
+        if code == EMPTY:
+            return False
+        opponent = 1 - code // 6
+        if self.get_attacked_squares(opponent) & (1 << square_to):
+            return True
+        from_bit = 1 << square_from
+        for piece_type in (BISHOP, ROOK, QUEEN):
+            sliders = self._pieces[piece_code(opponent, piece_type)]
+            while sliders:
+                lowest = sliders & -sliders
+                square = lowest.bit_length() - 1
+                if (self._attack_maps[square] & from_bit and SLIDER_MASKS[piece_type][square] & (1 << square_to)
+                        and BETWEEN[square][square_to] & self._all == from_bit):
+                    return True
+                sliders ^= lowest
+        return False
+
+    def drop_attack_maps(self):
+        """
+        Forgets the attack maps, so placing and removing pieces stops keeping them up to date
+        until they are asked for again. Searches call this, since keeping the maps up to date
+        slows down every move they make.
+        """
+        self._attack_maps = None
+        self._attacked = [None, None]
+
+    def _build_attack_maps(self):
+        """
+        Works out the attacks of every piece on the board for the attack maps
+        """
+        self._attack_maps = [self.get_attacks(square) for square in range(64)]
+        self._attacked = [None, None]
+
+    def _update_attack_maps(self, square):
+        """
+        Brings the attack maps up to date after a piece was placed on or removed from a square.
+        Only a Rook, Bishop, or Queen that attacks the square can have had one of its lines
+        lengthened or shortened.
+        """
+        attack_maps = self._attack_maps
+        pieces = self._pieces
+        bit = 1 << square
+        sliders = (pieces[2] | pieces[3] | pieces[4] | pieces[8] | pieces[9] | pieces[10]) & ~bit
+        while sliders:
+            lowest = sliders & -sliders
+            slider = lowest.bit_length() - 1
+            if attack_maps[slider] & bit:
+                attack_maps[slider] = self.get_attacks(slider)
+            sliders ^= lowest
+        attack_maps[square] = self.get_attacks(square)
+        self._attacked = [None, None]
@@ -1,1249 +1,933 @@
-# Author: Cooper Thompson
-# GitHub username: coopthompson
-# Date: November 19th, 2023
-# Description: Create a chess program with a ChessVar class and other
-#              classes. White goes first and whoever captures all pieces
-#              of a certain type wins.
-
-
-class Space:
-    """
-    Represents a space on a chess board. A number of these will be created by
-    the ChessVar class and each of these will have its own chess piece and its
-    corresponding class (Pawn, King, Queen, etc.) assigned to it.
-    """
-    def __init__(self, player, piece_type):
-        """
-        Initializes a new chess piece with a specific player and a specific piece_type object
-        Its parameters are the player that owns the piece and the type of piece that it is.
-        """
-        self._player = player
-        self._piece_type = piece_type
-
-    def get_piece_object(self):
-        """
-        Returns the piece type
-        """
-        return self._piece_type
-
-    def get_player(self):
-        """
-        Returns the player that owns the piece
-        """
-        return self._player
-
-
-class Rook:
-    """
-    Represents a Rook object with a specific location. Interacts with the Space class
-    directly (it is initialized within a Space object) and the ChessVar class (the ChessVar
-    class will check its various properties like location and player owner and assign it a new
-    location if a move is deemed possible).
-    """
-    def __init__(self, location):
-        """
-        Initialises a Rook object with a specific location. The only parameter is the location.
-        The type of piece is also declared but nothing that is passed is used to declare it.
-        """
-        self._location = location
-        self._type = "Rook"
-
-    def get_type(self):
-        """
-        Returns the type
-        """
-        return self._type
-
-    def get_location(self):
-        """
-        Returns the location
-        """
-        return self._location
-
-    def potential_moves(self):
-        """
-        Takes no parameters and returns all potential moves from current position
-        This will be used in the ChessVar class's make_move method to check if a proposed move
-        can occur.
-        """
-        x_axis = ["a", "b", "c", "d", "e", "f", "g", "h"]
-        y_axis = ["8", "7", "6", "5", "4", "3", "2", "1"]
-        moves = []
-        location = self.get_location()
-
-        # Add a value to a list depending on which direction the Rook is traveling (North, South, East, West)
-        # and if the move is legal.
-        for column in x_axis:
-            if location[0] == column:
-                continue
-            else:
-                moves.append(column + location[1])
-
-        for row in y_axis:
-            if location[1] == row:
-                continue
-            else:
-                moves.append(location[0] + row)
-
-        return moves
-
-    def path_to_move(self, end):
-        """
-        This takes one parameter which is the place the piece will eventually end up.
-        It returns a list of the spaces that the piece will pass through to eventually get
-        to the specified end point. This is used in the ChessVar class's method, make_move
-        to determine if a space in its path is occupied by something, and it will thus not be
-        able to move through that space. Used by Rook, Bishop, Queen, and Pawn (first turn of
-        movement only).
-        """
-        path = []
-        moves = self.potential_moves()
-        start = self.get_location()
-        # Check the path taken from the start point to the end point and append those spaces to a list
-        if start[1] == end[1] and start[0] > end[0]:
-            for move in moves:
-                if move == end:  # Excludes the end value because that has already been tested.
-                    continue
-                # Depending on the path taken, we only want certain values. This one wants values where the
-                # letter value is greater than the end letter value and less than the starting letter value
-                elif end[0] < move[0] < start[0]:
-                    path.append(move)
-        elif start[1] == end[1] and start[0] < end[0]:
-            for move in moves:
-                if move == end:
-                    continue
-                elif end[0] > move[0] > start[0]:
-                    path.append(move)
-        elif start[0] == end[0] and start[1] < end[1]:
-            for move in moves:
-                if move == end:
-                    continue
-                elif end[1] > move[1] > start[1]:
-                    path.append(move)
-        else:
-            for move in moves:
-                if move == end:
-                    continue
-                elif end[1] < move[1] < start[1]:
-                    path.append(move)
-
-        return path
-
-
-class Knight:
-    """
-    Represents a Knight object with a specific location. Interacts with the Space class
-    directly (it is initialized within a Space object) and the ChessVar class (the ChessVar
-    class will check its various properties like location and player owner and assign it a new
-    location if a move is deemed possible).
-    """
-    def __init__(self, location):
-        """
-        Initialises a Knight object with a specific location. The only parameter is the location.
-        The type of piece is also declared but nothing that is passed is used to declare it.
-        """
-        self._location = location
-        self._type = "Knight"
-
-    def get_type(self):
-        """
-        Returns the type
-        """
-        return self._type
-
-    def get_location(self):
-        """
-        Returns the location
-        """
-        return self._location
-
-    def potential_moves(self):
-        """
-        Takes no parameters and returns all potential moves from current position
-        This will be used in the ChessVar class's make_move method to check if a proposed move
-        can occur.
-        """
-
-        moves = []
-        x_axis = ["a", "b", "c", "d", "e", "f", "g", "h"]
-        y_axis = ["8", "7", "6", "5", "4", "3", "2", "1"]
-        location = self.get_location()
-
-        letter_value = x_axis.index(location[0])
-        number_value = y_axis.index(location[1])
-
-        start_letter_value = letter_value
-        start_number_value = number_value
-
-        # A knight could, at maximum, have 8 legal moves depending on where on the board it is.
-        # This method appends all the moves that are legal (not off the board) to a list.
-        # Check every variation of adding and subtracting one and 2 to the letter and number values.
-        letter_value += 1
-        number_value += 2
-
-        if letter_value > 7 or number_value > 7:
-            letter_value = start_letter_value
-            number_value = start_number_value
-        else:
-            letter_value = x_axis[letter_value]
-            number_value = y_axis[number_value]
-            final_value = letter_value + number_value
-            moves.append(final_value)
-            letter_value = start_letter_value
-            number_value = start_number_value
-
-        letter_value -= 1
-        number_value += 2
-        if letter_value < 0 or number_value > 7:
-            letter_value = start_letter_value
-            number_value = start_number_value
-        else:
-            letter_value = x_axis[letter_value]
-            number_value = y_axis[number_value]
-            final_value = letter_value + number_value
-            moves.append(final_value)
-            letter_value = start_letter_value
-            number_value = start_number_value
-
-        letter_value += 1
-        number_value -= 2
-        if letter_value > 7 or number_value < 0:
-            letter_value = start_letter_value
-            number_value = start_number_value
-        else:
-            letter_value = x_axis[letter_value]
-            number_value = y_axis[number_value]
-            final_value = letter_value + number_value
-            moves.append(final_value)
-            letter_value = start_letter_value
-            number_value = start_number_value
-
-        letter_value -= 1
-        number_value -= 2
-        if letter_value < 0 or number_value < 0:
-            letter_value = start_letter_value
-            number_value = start_number_value
-        else:
-            letter_value = x_axis[letter_value]
-            number_value = y_axis[number_value]
-            final_value = letter_value + number_value
-            moves.append(final_value)
-            letter_value = start_letter_value
-            number_value = start_number_value
-
-        letter_value += 2
-        number_value += 1
-        if letter_value > 7 or number_value > 7:
-            letter_value = start_letter_value
-            number_value = start_number_value
-        else:
-            letter_value = x_axis[letter_value]
-            number_value = y_axis[number_value]
-            final_value = letter_value + number_value
-            moves.append(final_value)
-            letter_value = start_letter_value
-            number_value = start_number_value
-
-        letter_value -= 2
-        number_value += 1
-        if letter_value < 0 or number_value > 7:
-            letter_value = start_letter_value
-            number_value = start_number_value
-        else:
-            letter_value = x_axis[letter_value]
-            number_value = y_axis[number_value]
-            final_value = letter_value + number_value
-            moves.append(final_value)
-            letter_value = start_letter_value
-            number_value = start_number_value
-
-        letter_value += 2
-        number_value -= 1
-        if letter_value > 7 or number_value < 0:
-            letter_value = start_letter_value
-            number_value = start_number_value
-        else:
-            letter_value = x_axis[letter_value]
-            number_value = y_axis[number_value]
-            final_value = letter_value + number_value
-            letter_value = start_letter_value
-            number_value = start_number_value
-            moves.append(final_value)
-
-        letter_value -= 2
-        number_value -= 1
-        if letter_value < 0 or number_value < 0:
-            return moves
-        else:
-            letter_value = x_axis[letter_value]
-            number_value = y_axis[number_value]
-            final_value = letter_value + number_value
-            moves.append(final_value)
-            return moves
-
-
-class Bishop:
-    """
-    Represents a Bishop with a specific location. Interacts with the Space class
-    directly (it is initialized within a Space object) and the ChessVar class (the ChessVar
-    class will check its various properties like location and player owner and assign it a new
-    location if a move is deemed possible).
-    """
-    def __init__(self, location):
-        """
-        Initialises a Bishop object with a specific location. The only parameter is the location.
-        The type of piece is also declared but nothing that is passed is used to declare it.
-        """
-        self._location = location
-        self._type = "Bishop"
-
-    def get_type(self):
-        """
-        Returns the type
-        """
-        return self._type
-
-    def get_location(self):
-        """
-        Returns the location
-        """
-        return self._location
-
-    def potential_moves(self):
-        """
-        Takes no parameters and returns all potential moves from current position
-        This will be used in the ChessVar class's make_move method to check if a proposed move
-        can occur.
-        """
-
-        moves = []
-        x_axis = ["a", "b", "c", "d", "e", "f", "g", "h"]
-        y_axis = ["8", "7", "6", "5", "4", "3", "2", "1"]
-        location = self.get_location()
-
-        letter_value = x_axis.index(location[0])
-        number_value = y_axis.index(location[1])
-        start_letter_value = letter_value
-        start_number_value = number_value
-
-        letter_value = start_letter_value
-        number_value = start_number_value
-
-        # Checks the four potential directions a bishop can travel and appends all legal moves to a list
-        # Directions are NorthWest, NorthEast, SouthWest, and SouthEast
-        for i in range(8):
-            letter_value += 1
-            number_value += 1
-            if letter_value > 7 or number_value > 7:
-                continue
-            else:
-                current_letter = x_axis[letter_value]
-                current_number = y_axis[number_value]
-                final_value = current_letter + current_number
-                moves.append(final_value)
-
-        letter_value = start_letter_value
-        number_value = start_number_value
-
-        for i in range(8):
-            letter_value -= 1
-            number_value -= 1
-            if letter_value < 0 or number_value < 0:
-                continue
-            else:
-                current_letter = x_axis[letter_value]
-                current_number = y_axis[number_value]
-                final_value = current_letter + current_number
-                moves.append(final_value)
-
-        letter_value = start_letter_value
-        number_value = start_number_value
-
-        for i in range(8):
-            letter_value += 1
-            number_value -= 1
-            if letter_value > 7 or number_value < 0:
-                continue
-            else:
-                current_letter = x_axis[letter_value]
-                current_number = y_axis[number_value]
-                final_value = current_letter + current_number
-                moves.append(final_value)
-
-        letter_value = start_letter_value
-        number_value = start_number_value
-
-        for i in range(8):
-            letter_value -= 1
-            number_value += 1
-            if letter_value < 0 or number_value > 7:
-                continue
-            else:
-                current_letter = x_axis[letter_value]
-                current_number = y_axis[number_value]
-                final_value = current_letter + current_number
-                moves.append(final_value)
-
-        return moves
-
-    def path_to_move(self, end):
-        """
-        This takes one parameter which is the place the piece will eventually end up.
-        It returns a list of the spaces that the piece will pass through to eventually get
-        to the specified end point. This is used in the ChessVar class's method, make_move
-        to determine if a space in its path is occupied by something, and it will thus not be
-        able to move through that space. Used by Rook, Bishop, Queen, and Pawn (first turn of
-        movement only).
-        """
-        path = []
-        moves = self.potential_moves()
-        start = self.get_location()
-        # Checks the path from the start point to the end point similarly to the Rook except using diagonal
-        # movement rather than vertical and horizontal.
-        if start[0] < end[0] and start[1] < end[1]:
-            for move in moves:
-                if move == end:
-                    continue
-                elif move[0] > end[0] and move[1] > end[1]:
-                    continue
-                elif move[0] > start[0] and move[1] > start[1]:
-                    path.append(move)
-
-        elif start[0] > end[0] and start[1] < end[1]:
-            for move in moves:
-                if move == end:
-                    continue
-                elif move[0] < end[0] and move[1] > end[1]:
-                    continue
-                elif move[0] < start[0] and move[1] > start[1]:
-                    path.append(move)
-
-        elif start[0] > end[0] and start[1] > end[1]:
-            for move in moves:
-                if move == end:
-                    continue
-                elif move[0] < end[0] and move[1] < end[1]:
-                    continue
-                elif move[0] < start[0] and move[1] < start[1]:
-                    path.append(move)
-
-        else:
-            for move in moves:
-                if move == end:
-                    continue
-                elif move[0] > end[0] and move[1] < end[1]:
-                    continue
-                elif move[0] > start[0] and move[1] < start[1]:
-                    path.append(move)
-
-        return path
-
-
-class Queen:
-    """
-    Represents a Queen object with a specific location. Interacts with the Space class
-    directly (it is initialized within a Space object) and the ChessVar class (the ChessVar
-    class will check its various properties like location and player owner and assign it a new
-    location if a move is deemed possible).
-    """
-    def __init__(self, location):
-        """
-        Initialises a Queen object with a specific location. The only parameter is the location.
-        The type of piece is also declared but nothing that is passed is used to declare it.
-        """
-        self._location = location
-        self._type = "Queen"
-
-    def get_type(self):
-        """
-        Returns the type
-        """
-        return self._type
-
-    def get_location(self):
-        """
-        Returns the location
-        """
-        return self._location
-
-    def potential_moves(self):
-        """
-        Takes no parameters and returns all potential moves from current position
-        This will be used in the ChessVar class's make_move method to check if a proposed move
-        can occur.
-        """
-        x_axis = ["a", "b", "c", "d", "e", "f", "g", "h"]
-        y_axis = ["8", "7", "6", "5", "4", "3", "2", "1"]
-        moves = []
-        location = self.get_location()
-
-        # Combines both movement rules for Bishop and Rook and appends all legal moves to its list.
-        for column in x_axis:
-            if location[0] == column:
-                continue
-            else:
-                moves.append(column + location[1])
-
-        for row in y_axis:
-            if location[1] == row:
-                continue
-            else:
-                moves.append(location[0] + row)
-
-        letter_value = x_axis.index(location[0])
-        number_value = y_axis.index(location[1])
-        start_letter_value = letter_value
-        start_number_value = number_value
-
-        letter_value = start_letter_value
-        number_value = start_number_value
-
-        for i in range(8):
-            letter_value += 1
-            number_value += 1
-            if letter_value > 7 or number_value > 7:
-                continue
-            else:
-                current_letter = x_axis[letter_value]
-                current_number = y_axis[number_value]
-                final_value = current_letter + current_number
-                moves.append(final_value)
-
-        letter_value = start_letter_value
-        number_value = start_number_value
-
-        for i in range(8):
-            letter_value -= 1
-            number_value -= 1
-            if letter_value < 0 or number_value < 0:
-                continue
-            else:
-                current_letter = x_axis[letter_value]
-                current_number = y_axis[number_value]
-                final_value = current_letter + current_number
-                moves.append(final_value)
-
-        letter_value = start_letter_value
-        number_value = start_number_value
-
-        for i in range(8):
-            letter_value += 1
-            number_value -= 1
-            if letter_value > 7 or number_value < 0:
-                continue
-            else:
-                current_letter = x_axis[letter_value]
-                current_number = y_axis[number_value]
-                final_value = current_letter + current_number
-                moves.append(final_value)
-
-        letter_value = start_letter_value
-        number_value = start_number_value
-
-        for i in range(8):
-            letter_value -= 1
-            number_value += 1
-            if letter_value < 0 or number_value > 7:
-                continue
-            else:
-                current_letter = x_axis[letter_value]
-                current_number = y_axis[number_value]
-                final_value = current_letter + current_number
-                moves.append(final_value)
-
-        return moves
-
-    def path_to_move(self, end):
-        """
-        This takes one parameter which is the place the piece will eventually end up.
-        It returns a list of the spaces that the piece will pass through to eventually get
-        to the specified end point. This is used in the ChessVar class's method, make_move
-        to determine if a space in its path is occupied by something, and it will thus not be
-        able to move through that space. Used by Rook, Bishop, Queen, and Pawn (first turn of
-        movement only).
-        """
-        path = []
-        moves = self.potential_moves()
-        start = self.get_location()
-        if start[1] == end[1] and start[0] > end[0]:
-            for move in moves:
-                if move == end:
-                    continue
-                elif end[0] < move[0] < start[0] and move[1] == start[1]:
-                    path.append(move)
-        elif start[1] == end[1] and start[0] < end[0]:
-            for move in moves:
-                if move == end:
-                    continue
-                elif end[0] > move[0] > start[0] and move[1] == start[1]:
-                    path.append(move)
-        elif start[0] == end[0] and start[1] < end[1]:
-            for move in moves:
-                if move == end:
-                    continue
-                elif end[1] > move[1] > start[1] and move[0] == start[0]:
-                    path.append(move)
-        elif start[0] == end[0] and start[1] > end[1]:
-            for move in moves:
-                if move == end:
-                    continue
-                elif end[1] < move[1] < start[1] and move[0] == start[0]:
-                    path.append(move)
-        elif start[0] < end[0] and start[1] < end[1]:
-            for move in moves:
-                if move == end:
-                    continue
-                elif move[0] > end[0] and move[1] > end[1]:
-                    continue
-                elif move[0] > start[0] and move[1] > start[1]:
-                    path.append(move)
-
-        elif start[0] > end[0] and start[1] < end[1]:
-            for move in moves:
-                if move == end:
-                    continue
-                elif move[0] < end[0] and move[1] > end[1]:
-                    continue
-                elif move[0] < start[0] and move[1] > start[1]:
-                    path.append(move)
-
-        elif start[0] > end[0] and start[1] > end[1]:
-            for move in moves:
-                if move == end:
-                    continue
-                elif move[0] < end[0] and move[1] < end[1]:
-                    continue
-                elif move[0] < start[0] and move[1] < start[1]:
-                    path.append(move)
-
-        else:
-            for move in moves:
-                if move == end:
-                    continue
-                elif move[0] > end[0] and move[1] < end[1]:
-                    continue
-                elif move[0] > start[0] and move[1] < start[1]:
-                    path.append(move)
-
-        return path
-
-
-class King:
-    """
-    Represents a King object with a specific location. Interacts with the Space class
-    directly (it is initialized within a Space object) and the ChessVar class (the ChessVar
-    class will check its various properties like location and player owner and assign it a new
-    location if a move is deemed possible).
-    """
-    def __init__(self, location):
-        """
-        Initialises a King object with a specific location. The only parameter is the location.
-        The type of piece is also declared but nothing that is passed is used to declare it.
-        """
-        self._location = location
-        self._type = "King"
-
-    def get_type(self):
-        """
-        Returns the type
-        """
-        return self._type
-
-    def get_location(self):
-        """
-        Returns the location
-        """
-        return self._location
-
-    def potential_moves(self):
-        """
-        Takes no parameters and returns all potential moves from current position
-        This will be used in the ChessVar class's make_move method to check if a proposed move
-        can occur.
-        """
-        x_axis = ["a", "b", "c", "d", "e", "f", "g", "h"]
-        y_axis = ["8", "7", "6", "5", "4", "3", "2", "1"]
-        moves = []
-        location = self.get_location()
-
-        letter_value = x_axis.index(location[0])
-        number_value = y_axis.index(location[1])
-        start_letter_value = letter_value
-        start_number_value = number_value
-
-        # Like a knight, a king also has, at maximum, 8 legal moves at a given time. It might be less
-        # but never more. Add and subtract 1 to both the letter and number values in every combination.
-        current_letter = letter_value + 1
-        current_number = number_value + 1
-
-        if current_letter > 7 or current_number > 7:  # 7 and 0 are both bounds to ensure we don't go off the board
-            letter_value = start_letter_value
-            number_value = start_number_value
-        else:
-            final_value = x_axis[current_letter] + y_axis[current_number]
-            moves.append(final_value)
-            letter_value = start_letter_value
-            number_value = start_number_value
-
-        current_letter = letter_value - 1
-        current_number = number_value + 1
-
-        if current_letter < 0 or current_number > 7:
-            letter_value = start_letter_value
-            number_value = start_number_value
-        else:
-            final_value = x_axis[current_letter] + y_axis[current_number]
-            moves.append(final_value)
-            letter_value = start_letter_value
-            number_value = start_number_value
-
-        current_letter = letter_value + 1
-        current_number = number_value - 1
-
-        if current_letter > 7 or current_number < 0:
-            letter_value = start_letter_value
-            number_value = start_number_value
-        else:
-            final_value = x_axis[current_letter] + y_axis[current_number]
-            moves.append(final_value)
-            letter_value = start_letter_value
-            number_value = start_number_value
-
-        current_letter = letter_value - 1
-        current_number = number_value - 1
-
-        if current_letter < 0 or current_number < 0:
-            letter_value = start_letter_value
-            number_value = start_number_value
-        else:
-            final_value = x_axis[current_letter] + y_axis[current_number]
-            moves.append(final_value)
-            letter_value = start_letter_value
-            number_value = start_number_value
-
-        current_letter = letter_value + 0
-        current_number = number_value + 1
-
-        if current_number > 7:
-            letter_value = start_letter_value
-            number_value = start_number_value
-        else:
-            final_value = x_axis[current_letter] + y_axis[current_number]
-            moves.append(final_value)
-            letter_value = start_letter_value
-            number_value = start_number_value
-
-        current_letter = letter_value - 1
-        current_number = number_value + 0
-
-        if current_letter < 0:
-            letter_value = start_letter_value
-            number_value = start_number_value
-        else:
-            final_value = x_axis[current_letter] + y_axis[current_number]
-            moves.append(final_value)
-            letter_value = start_letter_value
-            number_value = start_number_value
-
-        current_letter = letter_value + 1
-        current_number = number_value + 0
-
-        if current_letter > 7:
-            letter_value = start_letter_value
-            number_value = start_number_value
-        else:
-            final_value = x_axis[current_letter] + y_axis[current_number]
-            moves.append(final_value)
-            letter_value = start_letter_value
-            number_value = start_number_value
-
-        current_letter = letter_value + 0
-        current_number = number_value - 1
-
-        if current_number < 0:
-            return moves
-        else:
-            final_value = x_axis[current_letter] + y_axis[current_number]
-            moves.append(final_value)
-            return moves
-
-
-class Pawn:
-    """
-    Represents a Pawn object with a specific location. Interacts with the Space class
-    directly (it is initialized within a Space object) and the ChessVar class (the ChessVar
-    class will check its various properties like location and player owner and assign it a new
-    location if a move is deemed possible).
-    """
-    def __init__(self, location, player):
-        """
-        Initialises a Pawn object with a specific location. The Pawn has two parameters, location
-        and player, because the player is required to determine where it will be allowed to move.
-        The Pawn is the only piece that can't move backwards. The type of piece is also declared
-        but nothing that is passed is used to declare it.
-        """
-        self._location = location
-        self._type = "Pawn"
-        self._player = player
-        # Pawn has a dedicated player value because it cannot move backwards, and it is important to
-        # track which direction it can move.
-
-    def get_type(self):
-        """
-        Returns the type
-        """
-        return self._type
-
-    def get_location(self):
-        """
-        Returns the location
-        """
-        return self._location
-
-    def potential_moves(self):
-        """
-        Consider possible moves for a pawn whether its turn 1, or not and
-        whether it is White or Black. Takes no parameters and returns all potential moves
-        from current position. This will be used in the ChessVar class's make_move method
-        to check if a proposed move can occur.
-        """
-        moves = []
-        location = self.get_location()
-
-        letter_value = location[0]
-        number_value = int(location[1])
-        start_number_value = number_value
-
-        # Since a pawn cannot move backwards, it will only be at row 2 (or row 7 if its black) before it has
-        # made any moves yet. This allows me to control the pawn into only moving 2 spaces on its first move.
-        if self._player == "Black":
-            if number_value == 7:
-                number_value -= 2
-                moves.append(letter_value + str(number_value))
-                number_value = start_number_value
-                number_value -= 1
-                moves. append(letter_value + str(number_value))
-
-                return moves
-
-            number_value -= 1
-            moves.append(letter_value + str(number_value))
-            return moves
-
-        else:
-            if number_value == 2:
-                number_value += 2
-                moves.append(letter_value + str(number_value))
-                number_value = start_number_value
-                number_value += 1
-                moves.append(letter_value + str(number_value))
-                return moves
-
-            number_value += 1
-            moves.append(letter_value + str(number_value))
-            return moves
-
-    def potential_attacks(self):
-        """
-        Consider possible attacks for a pawn whether it is White or Black. Takes no parameters
-        and returns all potential attacks that a pawn could make from its current position. This will
-        also interact with the ChessVar class's make_move object to see if a proposed attack is feasible.
-        """
-
-        x_axis = ["a", "b", "c", "d", "e", "f", "g", "h"]
-        y_axis = ["8", "7", "6", "5", "4", "3", "2", "1"]
-        moves = []
-        location = self.get_location()
-
-        letter_value = x_axis.index(location[0])
-        number_value = y_axis.index(location[1])
-
-        start_letter_value = letter_value
-
-        # The Pawn needs a separate method for attacking because it moves and attacks in two different ways.
-        if self._player == "Black":
-            letter_value += 1
-            number_value += 1
-
-            if letter_value > 7 or number_value > 7:
-                moves = []
-            else:
-                moves.append(x_axis[letter_value] + y_axis[number_value])
-
-            letter_value = start_letter_value
-
-            letter_value -= 1
-            if letter_value < 0 or number_value > 7:
-                return moves
-            else:
-                moves.append(x_axis[letter_value] + y_axis[number_value])
-                return moves
-        else:
-            letter_value += 1
-            number_value -= 1
-            if letter_value > 7 or number_value < 0:
-                moves = []
-            else:
-                moves.append(x_axis[letter_value] + y_axis[number_value])
-
-            letter_value = start_letter_value
-
-            letter_value -= 1
-            if letter_value < 0 or number_value < 0:
-                return moves
-            else:
-                moves.append(x_axis[letter_value] + y_axis[number_value])
-                return moves
-
-    def path_to_move(self, end):
-        """
-        This takes one parameter which is the place the piece will eventually end up.
-        It returns a list of the spaces that the piece will pass through to eventually get
-        to the specified end point. This is used in the ChessVar class's method, make_move
-        to determine if a space in its path is occupied by something, and it will thus not be
-        able to move through that space. Used by Rook, Bishop, Queen, and Pawn (first turn of
-        movement only).
-        """
-        path = []
-        moves = self.potential_moves()
-        player = self._player
-
-        # The Pawn needs this method for its first movement if it moves two spaces
-        if player == "White":
-            for move in moves:
-                if move == end:
-                    continue
-                else:
-                    path.append(move)
-        else:
-            for move in moves:
-                if move == end:
-                    continue
-                else:
-                    path.append(move)
-
-        return path
-
-
-class Empty:
-    """
-    Represents an empty space. This Empty object is stored in a Space class and those
-    Space objects will be checked by the ChessVar class to see if there is anything within
-    the space. If a space is empty, it will have little functionality other than being a
-    place-holder for when/if a piece moves there.
-    """
-    def __init__(self, location):
-        """
-        Initialises an object of class Empty with a specific location
-        """
-        self._location = location
-        self._type = "None"
-
-    def get_type(self):
-        """
-        Returns the type
-        """
-        return self._type
-
-    def get_location(self):
-        """
-        Returns the location
-        """
-        return self._location
-
-
-class ChessVar:
-    """
-    Represents a game of chess. Interacts with all other classes, either directly or indirectly.
-    creates and changes the Space and various chess piece classes when using make_move. Checks the
-    current state of the board with get_board_state.
-    """
-    def __init__(self):
-        """
-        Initialises a game of chess with a specific board and turn number. Takes no parameters and
-        initialises a game_board object and turn_number that starts at 0 and increments as the game
-        progresses.
-        """
-        self._turn_number = 0
-        self._game_board = [
-            [
-                Space("Black", Rook("a8")),
-                Space("Black", Knight("b8")),
-                Space("Black", Bishop("c8")),
-                Space("Black", Queen("d8")),
-                Space("Black", King("e8")),
-                Space("Black", Bishop("f8")),
-                Space("Black", Knight("g8")),
-                Space("Black", Rook("h8"))
-            ],
-            [
-                Space("Black", Pawn("a7", "Black")),
-                Space("Black", Pawn("b7", "Black")),
-                Space("Black", Pawn("c7", "Black")),
-                Space("Black", Pawn("d7", "Black")),
-                Space("Black", Pawn("e7", "Black")),
-                Space("Black", Pawn("f7", "Black")),
-                Space("Black", Pawn("g7", "Black")),
-                Space("Black", Pawn("h7", "Black"))
-            ],
-            [
-                Space("None", Empty("a6")),
-                Space("None", Empty("b6")),
-                Space("None", Empty("c6")),
-                Space("None", Empty("d6")),
-                Space("None", Empty("e6")),
-                Space("None", Empty("f6")),
-                Space("None", Empty("g6")),
-                Space("None", Empty("h6"))
-            ],
-            [
-                Space("None", Empty("a5")),
-                Space("None", Empty("b5")),
-                Space("None", Empty("c5")),
-                Space("None", Empty("d5")),
-                Space("None", Empty("e5")),
-                Space("None", Empty("f5")),
-                Space("None", Empty("g5")),
-                Space("None", Empty("h5"))
-            ],
-            [
-                Space("None", Empty("a4")),
-                Space("None", Empty("b4")),
-                Space("None", Empty("c4")),
-                Space("None", Empty("d4")),
-                Space("None", Empty("e4")),
-                Space("None", Empty("f4")),
-                Space("None", Empty("g4")),
-                Space("None", Empty("h4"))
-            ],
-            [
-                Space("None", Empty("a3")),
-                Space("None", Empty("b3")),
-                Space("None", Empty("c3")),
-                Space("None", Empty("d3")),
-                Space("None", Empty("e3")),
-                Space("None", Empty("f3")),
-                Space("None", Empty("g3")),
-                Space("None", Empty("h3"))
-            ],
-            [
-                Space("White", Pawn("a2", "White")),
-                Space("White", Pawn("b2", "White")),
-                Space("White", Pawn("c2", "White")),
-                Space("White", Pawn("d2", "White")),
-                Space("White", Pawn("e2", "White")),
-                Space("White", Pawn("f2", "White")),
-                Space("White", Pawn("g2", "White")),
-                Space("White", Pawn("h2", "White"))
-            ],
-            [
-                Space("White", Rook("a1")),
-                Space("White", Knight("b1")),
-                Space("White", Bishop("c1")),
-                Space("White", Queen("d1")),
-                Space("White", King("e1")),
-                Space("White", Bishop("f1")),
-                Space("White", Knight("g1")),
-                Space("White", Rook("h1"))
-            ]
-        ]
-
-    def get_board_state(self):
-        """
-        Returns the current board state
-        """
-        return self._game_board
-
-    def print_board(self):
-        """
-        Prints out the current board state to the console including x-axis and y-axis
-        """
-        x_axis = ["a", "b", "c", "d", "e", "f", "g", "h"]
-        y_axis = ["8", "7", "6", "5", "4", "3", "2", "1"]
-
-        x_string = "   ".join(x_axis)
-        print("   " + x_string)  # Empty space to account for y-axis labels
-
-        board_state = self.get_board_state()
-
-        for i in range(len(board_state)):
-            row_array = []
-            row = board_state[i]
-            for space in row:
-                space_value = ""
-                if space.get_player() == "None":
-                    space_value += "E "  # E stands for empty
-                    row_array.append(space_value)
-                    continue
-                elif space.get_player() == "Black":
-                    space_value += "B"
-                else:
-                    space_value += "W"  # This means the player is White
-
-                if space.get_piece_object().get_type() == "Rook":
-                    space_value += "R"
-                    row_array.append(space_value)
-                elif space.get_piece_object().get_type() == "Knight":
-                    space_value += "H"
-                    row_array.append(space_value)
-                elif space.get_piece_object().get_type() == "Bishop":
-                    space_value += "B"
-                    row_array.append(space_value)
-                elif space.get_piece_object().get_type() == "Queen":
-                    space_value += "Q"
-                    row_array.append(space_value)
-                elif space.get_piece_object().get_type() == "King":
-                    space_value += "K"
-                    row_array.append(space_value)
-                else:
-                    space_value += "P"  # This piece is a pawn
-                    row_array.append(space_value)
-
-            row_string = "  ".join(row_array)
-            print(y_axis[i] + "  " + row_string)
-
-    def update_board(self, player, piece_type, move_to, move_from):
-        """
-        Updates the current board state after a move has been made. This means it will change the
-        board to reflect a move that was just made, changing a piece and such, it will also check the
-        get_game_state method to ensure no one has one the game yet.
-        """
-        board = self.get_board_state()
-        x_axis = ["a", "b", "c", "d", "e", "f", "g", "h"]
-        y_axis = ["8", "7", "6", "5", "4", "3", "2", "1"]
-        piece_column = x_axis.index(move_to[0])
-        piece_row = y_axis.index(move_to[1])
-        empty_column = x_axis.index(move_from[0])
-        empty_row = y_axis.index(move_from[1])
-
-        if piece_type == "Pawn":
-            piece_moving = Space(player, Pawn(move_to, player))
-        elif piece_type == "King":
-            piece_moving = Space(player, King(move_to))
-        elif piece_type == "Queen":
-            piece_moving = Space(player, Queen(move_to))
-        elif piece_type == "Rook":
-            piece_moving = Space(player, Rook(move_to))
-        elif piece_type == "Bishop":
-            piece_moving = Space(player, Bishop(move_to))
-        else:
-            piece_moving = Space(player, Knight(move_to))
-
-        # Replace the spot moved to with a new Space object (with piece object inside) and leave an empty space
-        # in the spot the piece moved from.
-        board[piece_row][piece_column] = piece_moving
-        board[empty_row][empty_column] = Space("None", Empty(move_from))
-        self.get_game_state()
-
-    def get_game_state(self):
-        """
-        Returns UNFINISHED, BLACK_WON, or WHITE_WON depending on the state of the board.
-        It does so by checking the pieces left on the board and if one player has none of a particular
-        piece type, it declares the other player the winner.
-        """
-        pieces_left = []
-        black_count = 0
-        white_count = 0
-        board = self.get_board_state()
-        for row in board:
-            for space in row:
-                player = space.get_player()
-                piece = space.get_piece_object().get_type()
-                piece_tuple = (player, piece)
-                if piece_tuple not in pieces_left:
-                    pieces_left.append(piece_tuple)
-
-        if len(pieces_left) < 13:
-            for tup in pieces_left:
-                if tup[0] == "Black":
-                    black_count += 1
-                elif tup[0] == "White":
-                    white_count += 1
-                else:
-                    continue
-
-            if black_count > white_count:
-                return "BLACK_WON"
-            else:
-                return "WHITE_WON"
-        else:
-            return "UNFINISHED"
-
-    def make_move(self, square_from, square_to):
-        """
-        Takes the starting square (square_from) and the end square (square_to) as
-        parameters. It determines, through use of the player, potential_moves
-        (or potential_attacks for Pawn), path_to_moves (if the piece in question has
-        this), and more to determine if a particular move is allowed. If a move is
-        allowed, the method returns True and otherwise, returns False
-        """
-        x_axis = ["a", "b", "c", "d", "e", "f", "g", "h"]
-        y_axis = ["8", "7", "6", "5", "4", "3", "2", "1"]
-        board = self.get_board_state()
-        column_from = x_axis.index(square_from[0])
-        row_from = y_axis.index(square_from[1])
-        column_to = x_axis.index(square_to[0])
-        row_to = y_axis.index(square_to[1])
-        from_space = board[row_from][column_from]
-        to_space = board[row_to][column_to]
-        from_piece = from_space.get_piece_object()
-        from_type = from_piece.get_type()
-
-        if from_space.get_player() == "None":
-            return False
-        else:
-            move_set = from_piece.potential_moves()
-
-        if self.get_game_state() != "UNFINISHED":
-            return False
-
-        # White moves only on even turns, Black moves only on odd.
-        if self._turn_number % 2 == 0 and from_space.get_player() == "Black":
-            return False
-        elif self._turn_number % 2 != 0 and from_space.get_player() == "White":
-            return False
-        else:
-
-            if from_type == "Pawn":
-                attack_set = from_piece.potential_attacks()
-                if square_to in attack_set:
-                    if to_space.get_player() == from_space.get_player() or to_space.get_player() == "None":
-                        return False
-                    else:  # Check this
-                        self.update_board(from_space.get_player(), from_type, square_to, square_from)
-                        self._turn_number += 1
-                        return True
-                elif to_space.get_player() != "None":
-                    return False
-
-            if square_to in move_set:
-                if to_space.get_player() == from_space.get_player():
-                    return False
-                else:
-                    # The King and Knight don't have the path_to_move method. The king only moves one square at a time
-                    # and the Knight jumps.
-                    if from_type == "King" or from_type == "Knight":
-                        self.update_board(from_space.get_player(), from_type, square_to, square_from)
-                        self._turn_number += 1
-                        return True
-                    else:
-                        path = from_piece.path_to_move(square_to)
-                        # If the path value is an empty list, just update as is. There are no extra spaces to check.
-                        if len(path) == 0:
-                            self.update_board(from_space.get_player(), from_type, square_to, square_from)
-                            self._turn_number += 1
-                            return True
-                        for move in path:
-                            column_path = x_axis.index(move[0])
-                            row_path = y_axis.index(move[1])
-                            path_space = board[row_path][column_path]
-                            if path_space.get_player() != "None":
-                                return False
-                        self.update_board(from_space.get_player(), from_type, square_to, square_from)
-                        self._turn_number += 1
-                        return True
-            else:
-                return False
-
-new_game = ChessVar()
-new_game.print_board()
\ No newline at end of file
+# Author: Cooper Thompson
+# GitHub username: coopthompson
+# Date: November 19th, 2023
+# Description: Create a chess program with a ChessVar class and other
+#              classes. White goes first and whoever captures all pieces
+#              of a certain type wins.
+
+import contextlib
+import sys
+import time
+
+from .Bitboard import (
+    Bitboard, EMPTY, WHITE, BLACK, PLAYERS, PIECE_TYPES, SQUARE_NAMES, ZOBRIST_BLACK_TO_MOVE, InvalidSquareError,
+    square_index, parse_square
+)
+from .MoveTables import (
+    KNIGHT_MOVES, KING_MOVES, PAWN_ATTACKS, PAWN_PUSHES, ROOK_MOVES, BISHOP_MOVES, QUEEN_MOVES, BETWEEN,
+    bit_squares
+)
+from .Instrumentation import MoveStats
+from .LegalityCache import LegalityCache
+from .Position import format_fen, parse_fen, pack_position, unpack_position, save_position, load_position
+
+
+def list_squares(bitboard):
+    """
+    Takes a bitboard and returns a list of the names of the squares it contains
+    """
+    return [SQUARE_NAMES[square] for square in bit_squares(bitboard)]
+
+
+class Space:
+    """
+    Represents a space on a chess board. A number of these will be created by
+    the ChessVar class and each of these will have its own chess piece and its
+    corresponding class (Pawn, King, Queen, etc.) assigned to it.
+    """
+    __slots__ = ("_player", "_piece_type")
+
+    def __init__(self, player, piece_type):
+        """
+        Initializes a new chess piece with a specific player and a specific piece_type object
+        Its parameters are the player that owns the piece and the type of piece that it is.
+        """
+        self._player = player
+        self._piece_type = piece_type
+
+    def get_piece_object(self):
+        """
+        Returns the piece type
+        """
+        return self._piece_type
+
+    def get_player(self):
+        """
+        Returns the player that owns the piece
+        """
+        return self._player
+
+
+class Rook:
+    """
+    Represents a Rook object with a specific location. Interacts with the Space class
+    directly (it is initialized within a Space object) and the ChessVar class (the ChessVar
+    class will check its various properties like location and player owner and assign it a new
+    location if a move is deemed possible).
+    """
+    __slots__ = ("_square",)
+    _type = "Rook"
+
+    def __init__(self, location):
+        """
+        Initialises a Rook object with a specific location. The only parameter is the location
+        (a square name or index). Only the index of the square is kept and the name is worked out
+        from it when it is asked for. The type is the same for every Rook so it is kept on the class.
+        """
+        self._square = parse_square(location)
+
+    def get_type(self):
+        """
+        Returns the type
+        """
+        return self._type
+
+    def get_location(self):
+        """
+        Returns the location
+        """
+        return SQUARE_NAMES[self._square]
+
+    def potential_moves(self):
+        """
+        Takes no parameters and returns all potential moves from current position
+        This will be used in the ChessVar class's make_move method to check if a proposed move
+        can occur. The moves are read from the ROOK_MOVES table, which holds every square a rook
+        can travel to in a straight line along its row or column from every square of an empty board.
+        """
+        return [SQUARE_NAMES[square] for square in ROOK_MOVES[self._square]]
+
+    def path_to_move(self, end):
+        """
+        This takes one parameter which is the place the piece will eventually end up.
+        It returns a list of the spaces that the piece will pass through to eventually get
+        to the specified end point. The spaces are read from the BETWEEN table, which the
+        Bitboard class uses to determine if a space in its path is occupied by something, and
+        the piece will thus not be able to move through that space.
+        """
+        return list_squares(BETWEEN[self._square][square_index(end)])
+
+
+class Knight:
+    """
+    Represents a Knight object with a specific location. Interacts with the Space class
+    directly (it is initialized within a Space object) and the ChessVar class (the ChessVar
+    class will check its various properties like location and player owner and assign it a new
+    location if a move is deemed possible).
+    """
+    __slots__ = ("_square",)
+    _type = "Knight"
+
+    def __init__(self, location):
+        """
+        Initialises a Knight object with a specific location. The only parameter is the location
+        (a square name or index). Only the index of the square is kept and the name is worked out
+        from it when it is asked for. The type is the same for every Knight so it is kept on the class.
+        """
+        self._square = parse_square(location)
+
+    def get_type(self):
+        """
+        Returns the type
+        """
+        return self._type
+
+    def get_location(self):
+        """
+        Returns the location
+        """
+        return SQUARE_NAMES[self._square]
+
+    def potential_moves(self):
+        """
+        Takes no parameters and returns all potential moves from current position
+        This will be used in the ChessVar class's make_move method to check if a proposed move
+        can occur. The moves are read from the KNIGHT_MOVES table, which holds the (at most 8)
+        squares a knight can jump to from every square on the board.
+        """
+        return [SQUARE_NAMES[square] for square in KNIGHT_MOVES[self._square]]
+
+
+class Bishop:
+    """
+    Represents a Bishop with a specific location. Interacts with the Space class
+    directly (it is initialized within a Space object) and the ChessVar class (the ChessVar
+    class will check its various properties like location and player owner and assign it a new
+    location if a move is deemed possible).
+    """
+    __slots__ = ("_square",)
+    _type = "Bishop"
+
+    def __init__(self, location):
+        """
+        Initialises a Bishop object with a specific location. The only parameter is the location
+        (a square name or index). Only the index of the square is kept and the name is worked out
+        from it when it is asked for. The type is the same for every Bishop so it is kept on the class.
+        """
+        self._square = parse_square(location)
+
+    def get_type(self):
+        """
+        Returns the type
+        """
+        return self._type
+
+    def get_location(self):
+        """
+        Returns the location
+        """
+        return SQUARE_NAMES[self._square]
+
+    def potential_moves(self):
+        """
+        Takes no parameters and returns all potential moves from current position
+        This will be used in the ChessVar class's make_move method to check if a proposed move
+        can occur. The moves are read from the BISHOP_MOVES table, which holds every square a bishop
+        can travel to diagonally from every square of an empty board.
+        """
+        return [SQUARE_NAMES[square] for square in BISHOP_MOVES[self._square]]
+
+    def path_to_move(self, end):
+        """
+        This takes one parameter which is the place the piece will eventually end up.
+        It returns a list of the spaces that the piece will pass through to eventually get
+        to the specified end point. The spaces are read from the BETWEEN table, which the
+        Bitboard class uses to determine if a space in its path is occupied by something, and
+        the piece will thus not be able to move through that space.
+        """
+        return list_squares(BETWEEN[self._square][square_index(end)])
+
+
+class Queen:
+    """
+    Represents a Queen object with a specific location. Interacts with the Space class
+    directly (it is initialized within a Space object) and the ChessVar class (the ChessVar
+    class will check its various properties like location and player owner and assign it a new
+    location if a move is deemed possible).
+    """
+    __slots__ = ("_square",)
+    _type = "Queen"
+
+    def __init__(self, location):
+        """
+        Initialises a Queen object with a specific location. The only parameter is the location
+        (a square name or index). Only the index of the square is kept and the name is worked out
+        from it when it is asked for. The type is the same for every Queen so it is kept on the class.
+        """
+        self._square = parse_square(location)
+
+    def get_type(self):
+        """
+        Returns the type
+        """
+        return self._type
+
+    def get_location(self):
+        """
+        Returns the location
+        """
+        return SQUARE_NAMES[self._square]
+
+    def potential_moves(self):
+        """
+        Takes no parameters and returns all potential moves from current position
+        This will be used in the ChessVar class's make_move method to check if a proposed move
+        can occur. The moves are read from the QUEEN_MOVES table, which holds every square a queen
+        can travel to along its row, column, or diagonals from every square of an empty board.
+        """
+        return [SQUARE_NAMES[square] for square in QUEEN_MOVES[self._square]]
+
+    def path_to_move(self, end):
+        """
+        This takes one parameter which is the place the piece will eventually end up.
+        It returns a list of the spaces that the piece will pass through to eventually get
+        to the specified end point. The spaces are read from the BETWEEN table, which the
+        Bitboard class uses to determine if a space in its path is occupied by something, and
+        the piece will thus not be able to move through that space.
+        """
+        return list_squares(BETWEEN[self._square][square_index(end)])
+
+
+class King:
+    """
+    Represents a King object with a specific location. Interacts with the Space class
+    directly (it is initialized within a Space object) and the ChessVar class (the ChessVar
+    class will check its various properties like location and player owner and assign it a new
+    location if a move is deemed possible).
+    """
+    __slots__ = ("_square",)
+    _type = "King"
+
+    def __init__(self, location):
+        """
+        Initialises a King object with a specific location. The only parameter is the location
+        (a square name or index). Only the index of the square is kept and the name is worked out
+        from it when it is asked for. The type is the same for every King so it is kept on the class.
+        """
+        self._square = parse_square(location)
+
+    def get_type(self):
+        """
+        Returns the type
+        """
+        return self._type
+
+    def get_location(self):
+        """
+        Returns the location
+        """
+        return SQUARE_NAMES[self._square]
+
+    def potential_moves(self):
+        """
+        Takes no parameters and returns all potential moves from current position
+        This will be used in the ChessVar class's make_move method to check if a proposed move
+        can occur. The moves are read from the KING_MOVES table, which holds the (at most 8)
+        squares a king can step to from every square on the board.
+        """
+        return [SQUARE_NAMES[square] for square in KING_MOVES[self._square]]
+
+
+class Pawn:
+    """
+    Represents a Pawn object with a specific location. Interacts with the Space class
+    directly (it is initialized within a Space object) and the ChessVar class (the ChessVar
+    class will check its various properties like location and player owner and assign it a new
+    location if a move is deemed possible).
+    """
+    __slots__ = ("_square", "_player")
+    _type = "Pawn"
+
+    def __init__(self, location, player):
+        """
+        Initialises a Pawn object with a specific location. The Pawn has two parameters, location
+        and player, because the player is required to determine where it will be allowed to move.
+        The Pawn is the only piece that can't move backwards. Only the index of the square is kept
+        and the name is worked out from it when it is asked for.
+        """
+        self._square = parse_square(location)
+        self._player = player
+        # Pawn has a dedicated player value because it cannot move backwards, and it is important to
+        # track which direction it can move.
+
+    def get_type(self):
+        """
+        Returns the type
+        """
+        return self._type
+
+    def get_location(self):
+        """
+        Returns the location
+        """
+        return SQUARE_NAMES[self._square]
+
+    def potential_moves(self):
+        """
+        Consider possible moves for a pawn whether its turn 1, or not and
+        whether it is White or Black. Takes no parameters and returns all potential moves
+        from current position. This will be used in the ChessVar class's make_move method
+        to check if a proposed move can occur. The moves are read from the PAWN_PUSHES table,
+        which already allows for the two square move from the starting row.
+        """
+        pushes = PAWN_PUSHES[PLAYERS.index(self._player)]
+        return [SQUARE_NAMES[square] for square in pushes[self._square]]
+
+    def potential_attacks(self):
+        """
+        Consider possible attacks for a pawn whether it is White or Black. Takes no parameters
+        and returns all potential attacks that a pawn could make from its current position. This will
+        also interact with the ChessVar class's make_move object to see if a proposed attack is feasible.
+        The attacks are read from the PAWN_ATTACKS table.
+        """
+        attacks = PAWN_ATTACKS[PLAYERS.index(self._player)]
+        return [SQUARE_NAMES[square] for square in attacks[self._square]]
+
+    def path_to_move(self, end):
+        """
+        This takes one parameter which is the place the piece will eventually end up.
+        It returns a list of the spaces that the piece will pass through to eventually get
+        to the specified end point. This is used in the ChessVar class's method, make_move
+        to determine if a space in its path is occupied by something, and it will thus not be
+        able to move through that space. Used by Rook, Bishop, Queen, and Pawn (first turn of
+        movement only).
+        """
+        path = []
+        moves = self.potential_moves()
+        player = self._player
+
+        # The Pawn needs this method for its first movement if it moves two spaces
+        if player == "White":
+            for move in moves:
+                if move == end:
+                    continue
+                else:
+                    path.append(move)
+        else:
+            for move in moves:
+                if move == end:
+                    continue
+                else:
+                    path.append(move)
+
+        return path
+
+
+class Empty:
+    """
+    Represents an empty space. This Empty object is stored in a Space class and those
+    Space objects will be checked by the ChessVar class to see if there is anything within
+    the space. If a space is empty, it will have little functionality other than being a
+    place-holder for when/if a piece moves there.
+    """
+    __slots__ = ("_square",)
+    _type = "None"
+
+    def __init__(self, location):
+        """
+        Initialises an object of class Empty with a specific location (a square name or index)
+        """
+        self._square = parse_square(location)
+
+    def get_type(self):
+        """
+        Returns the type
+        """
+        return self._type
+
+    def get_location(self):
+        """
+        Returns the location
+        """
+        return SQUARE_NAMES[self._square]
+
+
+def make_space(code, location):
+    """
+    Takes a piece code from the Bitboard class and a location and returns a Space object
+    holding the matching piece object. This is how the ChessVar class builds the grid of
+    Space objects returned by get_board_state.
+    """
+    if code == EMPTY:
+        return Space("None", Empty(location))
+    player = PLAYERS[code // 6]
+    piece_type = PIECE_TYPES[code % 6]
+    if piece_type == "Pawn":
+        return Space(player, Pawn(location, player))
+    elif piece_type == "King":
+        return Space(player, King(location))
+    elif piece_type == "Queen":
+        return Space(player, Queen(location))
+    elif piece_type == "Rook":
+        return Space(player, Rook(location))
+    elif piece_type == "Bishop":
+        return Space(player, Bishop(location))
+    else:
+        return Space(player, Knight(location))
+
+
+# The Space objects handed out by get_board_state, keyed by piece code (EMPTY included) and
+# square. They are made the first time they are needed and then shared by every game, so there
+# are never more than 832 of them however many games are going on.
+_SHARED_SPACES = {}
+
+
+def shared_space(code, square):
+    """
+    Takes a piece code (or EMPTY) and a square index and returns the shared Space object for
+    that piece on that square. The same object is returned every time, so it must not be changed.
+    """
+    key = (code, square)
+    space = _SHARED_SPACES.get(key)
+    if space is None:
+        space = _SHARED_SPACES.setdefault(key, make_space(code, square))
+    return space
+
+
+# The two characters print_board uses for every piece code. E stands for empty and H is
+# used for the Knight so that it doesn't clash with the King.
+PIECE_LETTERS = ("P", "H", "B", "R", "Q", "K")
+GLYPHS = tuple(PLAYERS[code // 6][0] + PIECE_LETTERS[code % 6] for code in range(12))
+
+# What print_board shows on a square, indexed by piece code plus one so that an empty square
+# (EMPTY is -1) comes first, and the line of column labels above the board.
+CELLS = ("E ",) + GLYPHS
+BOARD_HEADER = "   " + "   ".join("abcdefgh")
+
+# How many bytes one entry of the undo stack takes up in memory (see push).
+UNDO_ENTRY_BYTES = sys.getsizeof(1 << 20)
+
+
+class ChessVar:
+    """
+    Represents a game of chess. Interacts with all other classes, either directly or indirectly.
+    Stores the position in a Bitboard object and changes it when using make_move. Checks the
+    current state of the board with get_board_state, which builds the Space and chess piece
+    classes from the Bitboard.
+    """
+    # The MoveStats make_move records into, or None to record nothing. This is the one shared by
+    # every game unless a game has its own (see enable_stats and profile).
+    _stats = None
+
+    # The answers is_legal has worked out, shared by every game.
+    _legality_cache = LegalityCache()
+
+    def __init__(self, debug=False):
+        """
+        Initialises a game of chess with a specific board and turn number. Initialises a Bitboard
+        object holding the starting position and turn_number that starts at 0 and increments as the
+        game progresses. The optional debug parameter makes get_game_state double-check the piece
+        counts kept by the Bitboard against a full scan of the board every time it is called.
+        Every move made with push is recorded on an undo stack as a single integer so that it can
+        be taken back with pop. The text of the board is kept after it is drawn so that drawing the same
+        position again doesn't build it again.
+        """
+        self._turn_number = 0
+        self._board = Bitboard()
+        self._debug = debug
+        self._undo_stack = []
+        self._rendered_hash = None
+        self._rendered = None
+
+    @classmethod
+    def from_bitboards(cls, bitboards, turn_number=0):
+        """
+        Takes twelve bitboards (indexed by piece code, see the Bitboard module) and a turn number
+        and returns a new ChessVar with those pieces on the board. White is to move if the turn
+        number is even and Black if it is odd.
+        """
+        game = cls()
+        game._board.set_pieces(bitboards)
+        game._turn_number = turn_number
+        return game
+
+    @classmethod
+    def from_position(cls, position):
+        """
+        Takes a position in the text form (a string) or the binary form (32 bytes) of the Position
+        module and returns a new ChessVar in that position. The binary form doesn't keep the turn
+        number, so the new game's turn number is 0 or 1 depending on who is to move. Raises
+        InvalidPositionError (a ValueError) if the position can't be read.
+        """
+        if isinstance(position, str):
+            return cls.from_bitboards(*parse_fen(position))
+        return cls.from_bitboards(*unpack_position(position))
+
+    @classmethod
+    def load(cls, path):
+        """
+        Takes the path of a file written by save and returns a new ChessVar in the position it holds
+        """
+        return cls.from_bitboards(*load_position(path))
+
+    def to_fen(self):
+        """
+        Returns the position in the text form of the Position module, for example
+        "rnbqkbnr/pppppppp/8/8/4P3/8/PPPP1PPP/RNBQKBNR b 1" after e2 to e4
+        """
+        return format_fen(self._board, self._turn_number)
+
+    def to_bytes(self):
+        """
+        Returns the position in the 32 byte binary form of the Position module
+        """
+        return pack_position(self._board, self._turn_number)
+
+    def save(self, path, binary=False):
+        """
+        Writes the position to a file, in the text form unless binary is set. Only the position is
+        saved, not the moves that led to it, so the loaded game can't pop them.
+        """
+        save_position(path, self._board, self._turn_number, binary)
+
+    def copy(self):
+        """
+        Returns a new ChessVar with the same position and turn number as this one. Moves made in
+        the copy don't change this game.
+        """
+        game = ChessVar(self._debug)
+        game._turn_number = self._turn_number
+        game._board = self._board.copy()
+        game._undo_stack = self._undo_stack[:]
+        return game
+
+    def get_board_state(self):
+        """
+        Returns the current board state as a list of rows (rank 8 first) of Space objects. The
+        rows are built from the Bitboard every time this is called, so changing them does not
+        change the game. The Space objects themselves are shared between games (see shared_space).
+        """
+        board = self._board
+        return [
+            [shared_space(board.piece_at(square), square) for square in range(row * 8, row * 8 + 8)]
+            for row in range(7, -1, -1)
+        ]
+
+    def get_bitboard(self):
+        """
+        Returns the Bitboard object that holds the current position
+        """
+        return self._board
+
+    def get_turn_number(self):
+        """
+        Returns the turn number. It starts at 0 and goes up by one every move, so White is to move
+        when it is even and Black when it is odd.
+        """
+        return self._turn_number
+
+    def get_memory_size(self):
+        """
+        Returns roughly how many bytes of memory the game takes up: the game itself, its Bitboard
+        (see Bitboard.get_memory_size), its undo stack, and the text of the board if it was drawn.
+        Only looks at a fixed number of things, so it is always quick.
+        """
+        size = sys.getsizeof(self) + sys.getsizeof(self.__dict__) + self._board.get_memory_size()
+        size += sys.getsizeof(self._undo_stack) + UNDO_ENTRY_BYTES * len(self._undo_stack)
+        if self._rendered is not None:
+            size += sys.getsizeof(self._rendered)
+        return size
+
+    def get_position_key(self):
+        """
+        Returns a 64-bit Zobrist key identifying the current position: where every piece stands
+        and which player is to move. Two games with the same position have the same key. The part
+        for the pieces is kept up to date by the Bitboard as update_board moves them, so this does
+        not look at the board.
+        """
+        if self._turn_number % 2:
+            return self._board.get_hash() ^ ZOBRIST_BLACK_TO_MOVE
+        return self._board.get_hash()
+
+    def render_board(self):
+        """
+        Returns the text print_board prints, including the x-axis and y-axis labels, as a single
+        string ending in a newline. The text is kept and handed back again until the pieces move.
+        """
+        board = self._board
+        if self._rendered_hash != board.get_hash():
+            lines = [BOARD_HEADER]  # Empty space to account for y-axis labels
+            for row in range(7, -1, -1):
+                cells = [CELLS[board.piece_at(square) + 1] for square in range(row * 8, row * 8 + 8)]
+                lines.append(str(row + 1) + "  " + "  ".join(cells))
+            lines.append("")
+            self._rendered = "\n".join(lines)
+            self._rendered_hash = board.get_hash()
+        return self._rendered
+
+    def print_board(self):
+        """
+        Prints out the current board state to the console including x-axis and y-axis
+        """
+        print(self.render_board(), end="")
+
+    def update_board(self, player, piece_type, move_to, move_from):
+        """
+        Updates the current board state after a move has been made. This means it will change the
+        board to reflect a move that was just made, changing a piece and such, it will also check the
+        get_game_state method to ensure no one has one the game yet. The squares can be names or
+        indexes. Moves made this way (and so by make_move) can't be taken back with pop: the undo
+        stack is emptied instead, so a game played with make_move doesn't keep growing in memory.
+        """
+        board = self._board
+        code = PLAYERS.index(player) * 6 + PIECE_TYPES.index(piece_type)
+
+        # Take the piece off the spot it moved from and put it on the spot it moved to, removing
+        # anything that was captured there.
+        from_index = parse_square(move_from)
+        to_index = parse_square(move_to)
+        board.remove_piece(from_index)
+        board.remove_piece(to_index)
+        board.put_piece(code, to_index)
+        # The moves on the undo stack were made before this one, so they can't be taken back any more.
+        if self._undo_stack:
+            self._undo_stack = []
+        self.get_game_state()
+
+    def push(self, move):
+        """
+        Takes a move (an integer from legal_moves) and makes it, changing the board in place and
+        passing the turn to the other player. The move is not checked, so it has to be one that
+        legal_moves returned for the current position. The captured piece, if any, is recorded on
+        the undo stack so that pop can take the move back.
+        """
+        square_from = move & 63
+        square_to = move >> 6
+        board = self._board
+        moved = board.piece_at(square_from)
+        captured = board.move_piece(square_from, square_to)
+        self._undo_stack.append(move | (captured + 1) << 12 | (moved + 1) << 16)
+        self._turn_number += 1
+
+    def pop(self):
+        """
+        Takes back the last move made with push, putting back any piece it captured, and returns
+        that move as an integer. Raises IndexError if there are no moves to take back, including
+        after make_move (see update_board).
+        """
+        entry = self._undo_stack.pop()
+        square_from = entry & 63
+        square_to = (entry >> 6) & 63
+        captured = ((entry >> 12) & 15) - 1
+        moved = (entry >> 16) - 1
+        board = self._board
+        board.remove_piece(square_to)
+        if moved != EMPTY:
+            board.put_piece(moved, square_from)
+        if captured != EMPTY:
+            board.put_piece(captured, square_to)
+        self._turn_number -= 1
+        return entry & 4095
+
+    def get_game_state(self):
+        """
+        Returns UNFINISHED, BLACK_WON, or WHITE_WON depending on the state of the board.
+        It does so by checking the pieces left on the board and if one player has none of a particular
+        piece type, it declares the other player the winner. The number of piece types each player has
+        left is kept up to date by the Bitboard whenever a piece is captured, so no scan is needed.
+        """
+        board = self._board
+        if self._debug and not board.counts_match_board():
+            raise RuntimeError("The piece counts kept by the Bitboard no longer match the board")
+
+        black_count = board.count_types(BLACK)
+        white_count = board.count_types(WHITE)
+
+        if black_count < 6 or white_count < 6:
+            if black_count > white_count:
+                return "BLACK_WON"
+            else:
+                return "WHITE_WON"
+        else:
+            return "UNFINISHED"
+
+    def legal_moves(self):
+        """
+        Returns a list of every move the player whose turn it is can make, following the same rules
+        as make_move. Each move is a single integer holding the starting and end square indexes (see
+        encode_move, move_from, and move_to in the Bitboard module). The list is empty once the game
+        is over.
+        """
+        if self.get_game_state() != "UNFINISHED":
+            return []
+        return self._board.generate_moves(self._turn_number % 2)
+
+    def legal_moves_from(self, square):
+        """
+        Takes a square (a name or an index) and returns a list of every move (as integers, like
+        legal_moves) the piece on that square can make. The list is empty if the square is empty, holds a piece of the
+        player whose turn it isn't, or the game is over.
+        """
+        index = parse_square(square)
+        code = self._board.piece_at(index)
+        if code == EMPTY or code // 6 != self._turn_number % 2:
+            return []
+        if self.get_game_state() != "UNFINISHED":
+            return []
+        return self._board.generate_moves_from(index)
+
+    def get_attacked_squares(self, player):
+        """
+        Takes a player ("White" or "Black") and returns a list of the names of every square their
+        pieces attack. The attacks of every piece are kept up to date by the Bitboard as
+        update_board moves pieces (see Bitboard.get_attacks_from), so only the pieces a move
+        affects are looked at again.
+        """
+        return list_squares(self._board.get_attacked_squares(PLAYERS.index(player)))
+
+    def get_attackers(self, square, player=None):
+        """
+        Takes a square (a name or an index) and returns a list of the names of the squares holding
+        pieces that attack it, only counting the given player's pieces ("White" or "Black") if a
+        player is given
+        """
+        if player is not None:
+            player = PLAYERS.index(player)
+        return list_squares(self._board.get_attackers(parse_square(square), player))
+
+    def get_threatened_pieces(self, player, piece_type=None):
+        """
+        Takes a player ("White" or "Black") and returns a list of the names of the squares holding
+        their pieces that the other player attacks, only counting pieces of the given type (for
+        example "Queen") if a type is given
+        """
+        board = self._board
+        player_index = PLAYERS.index(player)
+        if piece_type is None:
+            pieces = board.get_occupied(player_index)
+        else:
+            pieces = board.get_pieces(player_index, PIECE_TYPES.index(piece_type))
+        return list_squares(pieces & board.get_attacked_squares(1 - player_index))
+
+    def drop_attack_maps(self):
+        """
+        Stops the Bitboard keeping its attack maps up to date (see Bitboard.drop_attack_maps). The
+        next attack query works them out again.
+        """
+        self._board.drop_attack_maps()
+
+    def is_capture_defended(self, square_from, square_to):
+        """
+        Takes the starting square and the end square of a move (names or indexes, like make_move)
+        and returns True if the other player could capture the piece on the end square once the
+        move is made. The move itself is not checked.
+        """
+        return self._board.is_capture_defended(parse_square(square_from), parse_square(square_to))
+
+    def enable_stats(self, stats=None):
+        """
+        Starts recording counters and timings for every make_move call of this game into stats (a
+        new MoveStats if not given) and returns it
+        """
+        if stats is None:
+            stats = MoveStats()
+        self._stats = stats
+        return stats
+
+    def disable_stats(self):
+        """
+        Stops recording counters and timings for this game alone. It still records into the stats
+        shared by every game if profile is in use.
+        """
+        self.__dict__.pop("_stats", None)
+
+    def get_stats(self):
+        """
+        Returns the MoveStats make_move records into for this game, or None if nothing is recorded
+        """
+        return self._stats
+
+    @classmethod
+    @contextlib.contextmanager
+    def profile(cls, stats=None):
+        """
+        A context manager that records counters and timings for the make_move calls of every game
+        (except games with their own, see enable_stats) while it is open. Gives the MoveStats they
+        are recorded into (a new one if stats is not given):
+
+            with ChessVar.profile() as stats:
+                play_some_games()
+            print(stats.snapshot())
+        """
+        if stats is None:
+            stats = MoveStats()
+        previous = ChessVar._stats
+        ChessVar._stats = stats
+        try:
+            yield stats
+        finally:
+            ChessVar._stats = previous
+
+    def is_legal(self, square_from, square_to):
+        """
+        Takes the starting square and the end square (names or indexes, like make_move) and
+        returns True if make_move would make the move, without making it. Raises
+        InvalidSquareError for anything that isn't a square. Answers are kept in a cache shared by
+        every game and keyed by the position key and the move, so asking again about the same move
+        in the same position (in this game or any other) is a single lookup, and answers for a
+        position are never used once a move has changed it.
+        """
+        index_from = parse_square(square_from)
+        index_to = parse_square(square_to)
+        key = (self.get_position_key(), index_from | index_to << 6)
+        cache = self._legality_cache
+        answer = cache.get(key)
+        if answer is None:
+            code = self._board.piece_at(index_from)
+            answer = (code != EMPTY and code // 6 == self._turn_number % 2 and
+                      self.get_game_state() == "UNFINISHED" and self._board.is_valid_move(index_from, index_to))
+            cache.put(key, answer)
+        return answer
+
+    @classmethod
+    def get_legality_cache(cls):
+        """
+        Returns the LegalityCache used by is_legal, to read its statistics or clear it
+        """
+        return cls._legality_cache
+
+    def make_move(self, square_from, square_to):
+        """
+        Takes the starting square (square_from) and the end square (square_to) as
+        parameters, either as names ("e2") or as indexes (0 for a1 up to 63 for h8). Anything
+        else raises InvalidSquareError. It determines, through use of the player, the piece's movement rules
+        and the pieces standing in its way (both checked by the Bitboard), and more to
+        determine if a particular move is allowed. If a move is allowed, the method returns
+        True and otherwise, returns False
+        """
+        if self._stats is not None:
+            return self._make_move_with_stats(square_from, square_to)
+        board = self._board
+        index_from = parse_square(square_from)
+        index_to = parse_square(square_to)
+        code = board.piece_at(index_from)
+
+        if code == EMPTY:
+            return False
+
+        if self.get_game_state() != "UNFINISHED":
+            return False
+
+        # White moves only on even turns, Black moves only on odd.
+        player = code // 6
+        if player != self._turn_number % 2:
+            return False
+
+        if not board.is_valid_move(index_from, index_to):
+            return False
+
+        self.update_board(PLAYERS[player], PIECE_TYPES[code % 6], index_to, index_from)
+        self._turn_number += 1
+        return True
+
+    def _make_move_with_stats(self, square_from, square_to):
+        """
+        Does the same as make_move while recording how long each phase takes, and whether the move
+        was made or why not, into the game's MoveStats
+        """
+        stats = self._stats
+        clock = time.perf_counter_ns
+        board = self._board
+        start = clock()
+        try:
+            index_from = parse_square(square_from)
+            index_to = parse_square(square_to)
+        except InvalidSquareError:
+            stats.record_phase("parse", clock() - start)
+            stats.record_result("invalid_square")
+            raise
+        parsed = clock()
+        stats.record_phase("parse", parsed - start)
+        reason = None
+        code = board.piece_at(index_from)
+
+        if code == EMPTY:
+            reason = "empty_square"
+        else:
+            state = self.get_game_state()
+            checked = clock()
+            stats.record_phase("game_state", checked - parsed)
+            player = code // 6
+            if state != "UNFINISHED":
+                reason = "game_over"
+            elif player != self._turn_number % 2:
+                reason = "wrong_turn"
+            else:
+                valid = board.is_valid_move(index_from, index_to)
+                validated = clock()
+                stats.record_phase("validate", validated - checked)
+                if not valid:
+                    reason = "illegal_move"
+                else:
+                    self.update_board(PLAYERS[player], PIECE_TYPES[code % 6], index_to, index_from)
+                    self._turn_number += 1
+                    stats.record_phase("update_board", clock() - validated)
+
+        stats.record_phase("total", clock() - start)
+        stats.record_result(reason)
+        return reason is None
+
+
+if __name__ == "__main__":
+    new_game = ChessVar()
+    new_game.print_board()
@@ -0,0 +1,68 @@
+# Author: Cooper Thompson
+# GitHub username: coopthompson
+# Date: October 18th, 2026
+# Description: Converts batches of ChessVar positions to NumPy arrays (and back)
+#              for machine learning. The piece planes are unpacked straight
+#              from each game's bitboards, so no Python code runs per square.
+#              Needs NumPy, which the rest of chess_game does not.
+
+try:
+    import numpy
+except ImportError:
+    raise ImportError("chess_game.Encoding needs NumPy, install it with: pip install numpy")
+
+from .ChessVar import ChessVar
+
+
+def encode_positions(games):
+    """
+    Takes a list of ChessVar games and returns a tuple of three arrays describing their positions:
+
+    planes, shape (N, 12, 8, 8) of uint8. planes[n, code, row, column] is 1 if the piece with that
+        piece code (White's Pawn, Knight, Bishop, Rook, Queen, King, then Black's) stands on that
+        square. Rows go from rank 8 to rank 1 and columns from file a to file h, the same layout as
+        get_board_state.
+    side_to_move, shape (N,) of uint8. 0 when White is to move and 1 when Black is.
+    counts, shape (N, 2, 6) of uint8. The number of pieces of every type each player has left,
+        White first, with the piece types in the same order as the planes.
+    """
+    boards = [game.get_bitboard() for game in games]
+    bitboards = numpy.array([board.get_piece_bitboards() for board in boards], dtype="<u8").reshape(len(games), 12)
+
+    # Every bitboard is 8 bytes, one per rank starting with rank 1, and each byte holds the files
+    # from a (lowest bit) to h. Unpacking the bits of each byte lowest first gives the board rank
+    # by rank, which only needs flipping so that rank 8 comes first.
+    ranks = bitboards.view(numpy.uint8).reshape(len(games), 12, 8)
+    planes = numpy.unpackbits(ranks, axis=2, bitorder="little").reshape(len(games), 12, 8, 8)[:, :, ::-1, :]
+
+    side_to_move = numpy.array([game.get_turn_number() % 2 for game in games], dtype=numpy.uint8)
+    counts = numpy.array([board.get_counts() for board in boards], dtype=numpy.uint8).reshape(len(games), 2, 6)
+    return numpy.ascontiguousarray(planes), side_to_move, counts
+
+
+def encode_position(game):
+    """
+    Takes a single ChessVar and returns its planes, side to move, and counts like encode_positions,
+    without the batch dimension
+    """
+    planes, side_to_move, counts = encode_positions([game])
+    return planes[0], side_to_move[0], counts[0]
+
+
+def decode_positions(planes, side_to_move=None):
+    """
+    Takes piece planes shaped like the ones encode_positions returns and, optionally, the side to
+    move for each of them, and returns a list of ChessVar games with those positions. Only the side
+    to move can be recovered, so each game's turn number is 0 (White to move) or 1 (Black to move).
+    Raises ValueError if the planes have the wrong shape or put two pieces on one square.
+    """
+    planes = numpy.asarray(planes, dtype=numpy.uint8)
+    if planes.ndim != 4 or planes.shape[1:] != (12, 8, 8):
+        raise ValueError("Expected planes of shape (N, 12, 8, 8), got " + str(planes.shape))
+    count = planes.shape[0]
+    ranks = numpy.packbits(planes[:, :, ::-1, :] != 0, axis=3, bitorder="little").reshape(count, 12, 8)
+    bitboards = numpy.ascontiguousarray(ranks).view("<u8").reshape(count, 12)
+    if side_to_move is None:
+        side_to_move = numpy.zeros(count, dtype=numpy.uint8)
+    return [ChessVar.from_bitboards([int(value) for value in bitboards[index]], int(side_to_move[index]) % 2)
+            for index in range(count)]
@@ -0,0 +1,305 @@
+# Author: Cooper Thompson
+# GitHub username: coopthompson
+# Date: October 18th, 2026
+# Description: A search engine that picks a move for the player whose turn it
+#              is in a ChessVar game. It uses iterative deepening alpha-beta
+#              search and an evaluation built around the way this variant is
+#              won: losing every piece of any one type loses the game.
+
+import time
+
+from .Bitboard import EMPTY, PAWN, KNIGHT, BISHOP, ROOK, QUEEN, KING, move_to
+
+# Scores are always from the point of view of the player to move. A won game scores WIN_SCORE
+# minus the number of moves it takes to get there so that faster wins are preferred.
+WIN_SCORE = 100000
+WIN_THRESHOLD = WIN_SCORE - 1000
+
+# What a single piece of each type is worth, indexed by piece type.
+PIECE_VALUES = (100, 300, 300, 500, 900, 300)
+
+# How much it is worth to still have a certain number of pieces of one type, indexed by that
+# number. Running a type down to its last piece puts the whole game at risk, so the first few
+# pieces of every type are worth a lot more than the rest. The King and Queen start as the last
+# of their type, so the scarcity bonus starts out even for both players.
+SCARCITY_VALUES = (0, 0, 400, 550, 625, 660, 680, 690, 695)
+
+# A player whose last piece of a type is attacked is in danger of losing on the next move.
+THREATENED_LAST_PIECE = 350
+
+# What every square a player attacks is worth, so that pieces are developed towards the center
+# of the board instead of wandering.
+MOBILITY_VALUE = 4
+
+EXACT = 0
+LOWER_BOUND = 1
+UPPER_BOUND = 2
+
+
+class SearchAborted(Exception):
+    """
+    Raised inside the search when the node limit or the time limit is reached, to unwind back to
+    the root
+    """
+
+
+class Engine:
+    """
+    Represents a search engine for ChessVar games. Interacts with the ChessVar class by asking
+    it for legal moves, trying moves out with push and pop, and reading its Bitboard to evaluate
+    positions. Keeps a transposition table of searched positions (keyed by the ChessVar position
+    key) between searches.
+    """
+    def __init__(self, max_depth=4, max_nodes=None, table_size=1000000, table=None):
+        """
+        Initialises an Engine. max_depth is the deepest iteration the search will go to and
+        max_nodes, if given, stops the search once that many positions have been visited, keeping
+        the result of the last iteration that finished. table_size is the number of positions the
+        transposition table holds before it is cleared. table, if given, is used as the
+        transposition table instead of a dictionary of the Engine's own (for example a SharedTable
+        from the ParallelSearch module, so several engines can share one). It needs the get and
+        __setitem__ of a dictionary and is never cleared by the Engine itself.
+        """
+        self._max_depth = max_depth
+        self._max_nodes = max_nodes
+        self._table_size = table_size
+        self._own_table = table is None
+        self._table = {} if table is None else table
+        self._nodes = 0
+        self._node_limit = None
+        self._can_stop = False
+        self._deadline = None
+        self._depth_reached = 0
+
+    def get_nodes(self):
+        """
+        Returns the number of positions visited by the last search
+        """
+        return self._nodes
+
+    def get_depth_reached(self):
+        """
+        Returns the depth of the last iteration the last search finished
+        """
+        return self._depth_reached
+
+    def clear(self):
+        """
+        Empties the transposition table
+        """
+        if self._own_table:
+            self._table = {}
+        else:
+            self._table.clear()
+
+    def search(self, game, max_depth=None, max_nodes=None, max_seconds=None):
+        """
+        Takes a ChessVar and returns a tuple of the best move found for the player to move (as an
+        integer, see encode_move in the Bitboard module) and its score. The depth and node limits
+        given to the Engine can be overridden for this search, and max_seconds, if given, stops it
+        after that many seconds, keeping the result of the last iteration that finished. The move
+        is None if the game is over or the player to move can't move. The game is changed while
+        searching but is back in the same position when this returns. The attack maps of the
+        game's Bitboard are dropped first (see Bitboard.drop_attack_maps), since keeping them up to
+        date would slow down every move of the search.
+        """
+        if max_depth is None:
+            max_depth = self._max_depth
+        if max_nodes is None:
+            max_nodes = self._max_nodes
+        self._nodes = 0
+        self._node_limit = None
+        self._can_stop = False
+        self._deadline = None if max_seconds is None else time.monotonic() + max_seconds
+        self._depth_reached = 0
+        if self._own_table and len(self._table) > self._table_size:
+            self._table = {}
+        game.get_bitboard().drop_attack_maps()
+
+        moves = game.legal_moves()
+        if not moves:
+            return None, self._evaluate(game, 0)
+
+        best_move = moves[0]
+        best_score = 0
+        for depth in range(1, max_depth + 1):
+            # The first iteration always finishes so there is always a move to return.
+            if depth > 1:
+                self._node_limit = max_nodes
+                self._can_stop = True
+            try:
+                best_score, best_move = self._search_root(game, moves, depth, best_move)
+            except SearchAborted:
+                break
+            self._depth_reached = depth
+            if abs(best_score) >= WIN_THRESHOLD:
+                break
+        return best_move, best_score
+
+    def _search_root(self, game, moves, depth, first_move):
+        """
+        Searches every root move to the given depth, starting with first_move (the best move of
+        the previous iteration), and returns the best score and move
+        """
+        ordered = [first_move] + [move for move in self._order_moves(game, moves, None) if move != first_move]
+        alpha = -WIN_SCORE - 1
+        beta = WIN_SCORE + 1
+        best_move = first_move
+        for move in ordered:
+            game.push(move)
+            try:
+                score = -self._negamax(game, depth - 1, -beta, -alpha, 1)
+            finally:
+                game.pop()
+            if score > alpha:
+                alpha = score
+                best_move = move
+        self._store(game.get_position_key(), depth, alpha, EXACT, best_move, 0)
+        return alpha, best_move
+
+    def _negamax(self, game, depth, alpha, beta, ply):
+        """
+        Returns the score of a position for the player to move, searched to the given depth with
+        alpha-beta pruning. ply is the number of moves made since the root.
+        """
+        self._nodes += 1
+        if self._node_limit is not None and self._nodes > self._node_limit:
+            raise SearchAborted()
+        if self._can_stop and self._nodes & 1023 == 0 and self._should_stop():
+            raise SearchAborted()
+
+        # The game only ends right after a capture, and the player who made it is the winner, so a
+        # finished game is always lost for the player to move.
+        if game.get_game_state() != "UNFINISHED":
+            return -(WIN_SCORE - ply)
+        if depth == 0:
+            return self._evaluate(game, ply)
+
+        key = game.get_position_key()
+        entry = self._table.get(key)
+        table_move = None
+        if entry is not None:
+            entry_depth, entry_score, entry_flag, table_move = entry
+            if entry_depth >= depth:
+                entry_score = self._score_from_table(entry_score, ply)
+                if entry_flag == EXACT:
+                    return entry_score
+                if entry_flag == LOWER_BOUND and entry_score >= beta:
+                    return entry_score
+                if entry_flag == UPPER_BOUND and entry_score <= alpha:
+                    return entry_score
+
+        moves = game.legal_moves()
+        if not moves:
+            return 0
+
+        start_alpha = alpha
+        best_score = -WIN_SCORE - 1
+        best_move = None
+        for move in self._order_moves(game, moves, table_move):
+            game.push(move)
+            try:
+                score = -self._negamax(game, depth - 1, -beta, -alpha, ply + 1)
+            finally:
+                game.pop()
+            if score > best_score:
+                best_score = score
+                best_move = move
+                if score > alpha:
+                    alpha = score
+                    if alpha >= beta:
+                        break
+
+        if best_score <= start_alpha:
+            flag = UPPER_BOUND
+        elif best_score >= beta:
+            flag = LOWER_BOUND
+        else:
+            flag = EXACT
+        self._store(key, depth, best_score, flag, best_move, ply)
+        return best_score
+
+    def _should_stop(self):
+        """
+        Returns True if the search should stop now. It is asked every 1024 positions once the first
+        iteration has finished, and stops the search once the time given to search runs out.
+        """
+        return self._deadline is not None and time.monotonic() > self._deadline
+
+    def _store(self, key, depth, score, flag, move, ply):
+        """
+        Stores a search result in the transposition table. Winning and losing scores are stored
+        relative to the position rather than the root so they stay correct wherever the position
+        is found again.
+        """
+        if score >= WIN_THRESHOLD:
+            score += ply
+        elif score <= -WIN_THRESHOLD:
+            score -= ply
+        self._table[key] = (depth, score, flag, move)
+
+    def _score_from_table(self, score, ply):
+        """
+        Converts a score read from the transposition table back to one relative to the root
+        """
+        if score >= WIN_THRESHOLD:
+            return score - ply
+        if score <= -WIN_THRESHOLD:
+            return score + ply
+        return score
+
+    def _order_moves(self, game, moves, table_move):
+        """
+        Returns the moves sorted so the most promising are searched first: the move from the
+        transposition table, then captures of pieces the opponent has few of, then everything else
+        """
+        board = game.get_bitboard()
+        scored = []
+        for move in moves:
+            if move == table_move:
+                scored.append((1000000, move))
+                continue
+            captured = board.piece_at(move_to(move))
+            if captured == EMPTY:
+                scored.append((0, move))
+            else:
+                count = board.get_count(captured // 6, captured % 6)
+                scored.append((10000 // count + PIECE_VALUES[captured % 6], move))
+        scored.sort(key=lambda pair: -pair[0])
+        return [move for score, move in scored]
+
+    def _evaluate(self, game, ply):
+        """
+        Returns the score of a position for the player to move without searching any further.
+        Material counts for each piece and for how scarce each type is, and every attacked square
+        counts a little. If the player to move attacks one of the opponent's last pieces of a type
+        they can capture it and win at once, and if the opponent attacks one of theirs it is in
+        danger.
+        """
+        if game.get_game_state() != "UNFINISHED":
+            return -(WIN_SCORE - ply)
+        board = game.get_bitboard()
+        player = game.get_turn_number() % 2
+        opponent = 1 - player
+
+        score = 0
+        last_pieces = [0, 0]
+        for piece_type in (PAWN, KNIGHT, BISHOP, ROOK, QUEEN, KING):
+            own_count = board.get_count(player, piece_type)
+            opponent_count = board.get_count(opponent, piece_type)
+            score += PIECE_VALUES[piece_type] * (own_count - opponent_count)
+            score += SCARCITY_VALUES[min(own_count, 8)] - SCARCITY_VALUES[min(opponent_count, 8)]
+            if own_count == 1:
+                last_pieces[player] |= board.get_pieces(player, piece_type)
+            if opponent_count == 1:
+                last_pieces[opponent] |= board.get_pieces(opponent, piece_type)
+
+        attacked = board.get_attacked(player)
+        if attacked & last_pieces[opponent]:
+            return WIN_SCORE - ply - 1
+        opponent_attacked = board.get_attacked(opponent)
+        threatened = opponent_attacked & last_pieces[player]
+        if threatened:
+            score -= THREATENED_LAST_PIECE * threatened.bit_count()
+        score += MOBILITY_VALUE * (attacked.bit_count() - opponent_attacked.bit_count())
+        return score
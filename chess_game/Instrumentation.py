@@ -0,0 +1,82 @@
+# Author: Cooper Thompson
+# GitHub username: coopthompson
+# Date: October 18th, 2026
+# Description: Counters and timings for the steps of ChessVar.make_move, so it
+#              can be seen where the time goes and why moves are turned down.
+#              Nothing is recorded unless a MoveStats is switched on for a game
+#              (ChessVar.enable_stats) or for every game (ChessVar.profile).
+
+# The steps of make_move that are timed. "parse" reads the two squares, "game_state" checks the
+# game isn't over, "validate" checks the piece can make the move (what potential_moves,
+# potential_attacks, and path_to_move did before the Bitboard), "update_board" makes the move,
+# and "total" is the whole call.
+PHASES = ("parse", "game_state", "validate", "update_board", "total")
+
+# The reasons make_move turns a move down, in the order it checks for them.
+REJECT_REASONS = ("invalid_square", "empty_square", "game_over", "wrong_turn", "illegal_move")
+
+
+class MoveStats:
+    """
+    Represents the counters and timings collected from make_move calls: how many calls there were,
+    how many moves were made, how many were turned down for each reason, and how many times each
+    phase ran with the total and longest time it took in nanoseconds
+    """
+    def __init__(self):
+        """
+        Initialises a MoveStats with every counter at zero
+        """
+        self.reset()
+
+    def reset(self):
+        """
+        Sets every counter back to zero
+        """
+        self._calls = 0
+        self._accepted = 0
+        self._rejected = dict.fromkeys(REJECT_REASONS, 0)
+        self._phase_calls = dict.fromkeys(PHASES, 0)
+        self._phase_nanoseconds = dict.fromkeys(PHASES, 0)
+        self._phase_longest = dict.fromkeys(PHASES, 0)
+
+    def record_phase(self, phase, nanoseconds):
+        """
+        Records that a phase ran and how many nanoseconds it took
+        """
+        self._phase_calls[phase] += 1
+        self._phase_nanoseconds[phase] += nanoseconds
+        if nanoseconds > self._phase_longest[phase]:
+            self._phase_longest[phase] = nanoseconds
+
+    def record_result(self, reason=None):
+        """
+        Records the end of a make_move call: the move was made if reason is None, and otherwise
+        it was turned down for that reason (one of REJECT_REASONS)
+        """
+        self._calls += 1
+        if reason is None:
+            self._accepted += 1
+        else:
+            self._rejected[reason] += 1
+
+    def snapshot(self):
+        """
+        Returns the counters as a new dictionary that won't change as more moves are recorded, for
+        example {"calls": 3, "accepted": 2, "rejected": {"wrong_turn": 1, ...}, "phases": {"parse":
+        {"calls": 3, "total_ns": 2100, "mean_ns": 700.0, "max_ns": 900}, ...}}
+        """
+        phases = {}
+        for phase in PHASES:
+            calls = self._phase_calls[phase]
+            phases[phase] = {
+                "calls": calls,
+                "total_ns": self._phase_nanoseconds[phase],
+                "mean_ns": self._phase_nanoseconds[phase] / calls if calls else 0.0,
+                "max_ns": self._phase_longest[phase],
+            }
+        return {
+            "calls": self._calls,
+            "accepted": self._accepted,
+            "rejected": dict(self._rejected),
+            "phases": phases,
+        }
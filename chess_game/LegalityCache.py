@@ -0,0 +1,67 @@
+# Author: Cooper Thompson
+# GitHub username: coopthompson
+# Date: October 18th, 2026
+# Description: A bounded cache of whether a move is allowed in a position, used
+#              by ChessVar.is_legal. Entries are keyed by the position key and
+#              the move, so a move made on the board moves on to a different
+#              key by itself and nothing ever has to be thrown away as stale.
+
+class LegalityCache:
+    """
+    Represents a cache of answers to "is this move allowed in this position", keyed by a tuple of
+    the position key (see ChessVar.get_position_key) and the move (see encode_move in the Bitboard
+    module). The answers only depend on the position, so one cache can be shared by every game.
+    Like the Engine's transposition table, it is simply emptied once it holds max_entries answers.
+    """
+    def __init__(self, max_entries=65536):
+        """
+        Initialises an empty LegalityCache that holds at most max_entries answers
+        """
+        self._max_entries = max_entries
+        self._entries = {}
+        self._hits = 0
+        self._misses = 0
+        self._clears = 0
+
+    def get(self, key):
+        """
+        Returns the answer stored for a key, or None if there isn't one. Counts a hit or a miss.
+        """
+        answer = self._entries.get(key)
+        if answer is None:
+            self._misses += 1
+        else:
+            self._hits += 1
+        return answer
+
+    def put(self, key, answer):
+        """
+        Stores the answer for a key, first emptying the cache if it is full
+        """
+        if len(self._entries) >= self._max_entries:
+            self._entries = {}
+            self._clears += 1
+        self._entries[key] = answer
+
+    def clear(self):
+        """
+        Empties the cache and sets its counters back to zero
+        """
+        self._entries = {}
+        self._hits = 0
+        self._misses = 0
+        self._clears = 0
+
+    def get_stats(self):
+        """
+        Returns a dictionary of the number of hits, misses, times the cache was emptied because it
+        was full, answers held now, and the hit rate (hits over lookups, 0.0 before any lookup)
+        """
+        lookups = self._hits + self._misses
+        return {
+            "hits": self._hits,
+            "misses": self._misses,
+            "clears": self._clears,
+            "entries": len(self._entries),
+            "hit_rate": self._hits / lookups if lookups else 0.0,
+        }
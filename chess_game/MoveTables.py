@@ -0,0 +1,234 @@
+# Author: Cooper Thompson
+# GitHub username: coopthompson
+# Date: October 18th, 2026
+# Description: Tables of the squares each piece can reach from every square on
+#              the board, so that checking a move for a Knight, King, or Pawn is
+#              a single lookup, and checking a move for a Rook, Bishop, or Queen
+#              only needs one lookup per direction to find the first piece in
+#              the way. They are worked out once and then read from a cache on
+#              disk (see the TableCache module) every time the module is imported,
+#              or worked out during the import if the cache can't be used.
+
+from .TableCache import load_tables
+
+FULL_BOARD = 0xFFFFFFFFFFFFFFFF
+FILE_A = 0x0101010101010101
+FILE_B = FILE_A << 1
+FILE_G = FILE_A << 6
+FILE_H = FILE_A << 7
+RANK_2 = 0xFF << 8
+RANK_7 = 0xFF << 48
+
+NOT_FILE_A = FULL_BOARD ^ FILE_A
+NOT_FILE_H = FULL_BOARD ^ FILE_H
+NOT_FILE_AB = FULL_BOARD ^ (FILE_A | FILE_B)
+NOT_FILE_GH = FULL_BOARD ^ (FILE_G | FILE_H)
+
+# Directions a Rook, Bishop, or Queen can slide in, as (column step, row step). Moving in the
+# first four directions makes the square index bigger and moving in the last four makes it smaller,
+# which decides whether the nearest piece in the way is the lowest or the highest bit of a ray.
+NORTH = 0
+EAST = 1
+NORTH_EAST = 2
+NORTH_WEST = 3
+SOUTH = 4
+WEST = 5
+SOUTH_WEST = 6
+SOUTH_EAST = 7
+DIRECTION_STEPS = ((0, 1), (1, 0), (1, 1), (-1, 1), (0, -1), (-1, 0), (-1, -1), (1, -1))
+
+
+def bit_squares(bitboard):
+    """
+    Takes a bitboard and returns a tuple of the indexes of the squares it contains, lowest first
+    """
+    squares = []
+    while bitboard:
+        lowest = bitboard & -bitboard
+        squares.append(lowest.bit_length() - 1)
+        bitboard ^= lowest
+    return tuple(squares)
+
+
+def knight_attacks(bitboard):
+    """
+    Returns every square a knight standing on any of the squares in the bitboard could jump to
+    """
+    attacks = ((bitboard << 17) & NOT_FILE_A) | ((bitboard << 15) & NOT_FILE_H)
+    attacks |= ((bitboard << 10) & NOT_FILE_AB) | ((bitboard << 6) & NOT_FILE_GH)
+    attacks |= ((bitboard >> 15) & NOT_FILE_A) | ((bitboard >> 17) & NOT_FILE_H)
+    attacks |= ((bitboard >> 6) & NOT_FILE_AB) | ((bitboard >> 10) & NOT_FILE_GH)
+    return attacks & FULL_BOARD
+
+
+def king_attacks(bitboard):
+    """
+    Returns every square a king standing on any of the squares in the bitboard could step to
+    """
+    sideways = ((bitboard << 1) & NOT_FILE_A) | ((bitboard >> 1) & NOT_FILE_H)
+    row = bitboard | sideways
+    return (sideways | (row << 8) | (row >> 8)) & FULL_BOARD
+
+
+def pawn_attacks(bitboard, player):
+    """
+    Returns the diagonal squares that pawns of the given player (0 for White, 1 for Black)
+    standing on the bitboard could capture on. White pawns attack up the board and Black
+    pawns attack down it.
+    """
+    if player == 0:
+        return (((bitboard << 9) & NOT_FILE_A) | ((bitboard << 7) & NOT_FILE_H)) & FULL_BOARD
+    return ((bitboard >> 7) & NOT_FILE_A) | ((bitboard >> 9) & NOT_FILE_H)
+
+
+def pawn_pushes(bitboard, player):
+    """
+    Returns the squares that pawns of the given player (0 for White, 1 for Black) standing
+    on the bitboard could move forward to, ignoring any pieces in the way. Pawns still on
+    their starting rank may also move two squares.
+    """
+    if player == 0:
+        return ((bitboard << 8) | ((bitboard & RANK_2) << 16)) & FULL_BOARD
+    return (bitboard >> 8) | ((bitboard & RANK_7) >> 16)
+
+
+def ray(square, direction):
+    """
+    Returns a bitboard of every square from the given square (not included) to the edge of the
+    board in the given direction
+    """
+    column_step, row_step = DIRECTION_STEPS[direction]
+    column = (square & 7) + column_step
+    row = (square >> 3) + row_step
+    bitboard = 0
+    while 0 <= column < 8 and 0 <= row < 8:
+        bitboard |= 1 << (row * 8 + column)
+        column += column_step
+        row += row_step
+    return bitboard
+
+
+def between(square_from, square_to, rays):
+    """
+    Returns a bitboard of the squares strictly between two squares that share a row, column, or
+    diagonal, or 0 if they don't share one. rays is a table laid out like RAYS.
+    """
+    for direction in range(8):
+        if rays[direction][square_from] >> square_to & 1:
+            return rays[direction][square_from] & ~rays[direction][square_to] & ~(1 << square_to)
+    return 0
+
+
+def build_tables():
+    """
+    Works out every table and returns them in a dictionary keyed by their names. This is only
+    needed when the tables aren't in the cache (see the TableCache module), so importing the
+    module doesn't have to do it.
+    """
+    tables = {}
+    # Every table is indexed by square. The pawn tables are a pair of tables, White's first,
+    # because pawns of the two players move in opposite directions. The MASKS tables hold the
+    # reachable squares as a bitboard and the MOVES/ATTACKS/PUSHES tables hold the same squares
+    # as a tuple of indexes.
+    tables["KNIGHT_MASKS"] = tuple(knight_attacks(1 << square) for square in range(64))
+    tables["KING_MASKS"] = tuple(king_attacks(1 << square) for square in range(64))
+    tables["PAWN_ATTACK_MASKS"] = tuple(tuple(pawn_attacks(1 << square, player) for square in range(64))
+                                        for player in (0, 1))
+    tables["PAWN_PUSH_MASKS"] = tuple(tuple(pawn_pushes(1 << square, player) for square in range(64))
+                                      for player in (0, 1))
+
+    # RAYS[direction][square] holds the squares a sliding piece on square passes over in that
+    # direction on an empty board.
+    rays = tuple(tuple(ray(square, direction) for square in range(64)) for direction in range(8))
+    tables["RAYS"] = rays
+    tables["ROOK_MASKS"] = tuple(rays[NORTH][square] | rays[EAST][square] | rays[SOUTH][square] | rays[WEST][square]
+                                 for square in range(64))
+    tables["BISHOP_MASKS"] = tuple(rays[NORTH_EAST][square] | rays[NORTH_WEST][square] | rays[SOUTH_EAST][square]
+                                   | rays[SOUTH_WEST][square] for square in range(64))
+    tables["QUEEN_MASKS"] = tuple(tables["ROOK_MASKS"][square] | tables["BISHOP_MASKS"][square]
+                                  for square in range(64))
+
+    for piece in ("KNIGHT", "KING", "ROOK", "BISHOP", "QUEEN"):
+        tables[piece + "_MOVES"] = tuple(bit_squares(mask) for mask in tables[piece + "_MASKS"])
+    tables["PAWN_ATTACKS"] = tuple(tuple(bit_squares(mask) for mask in masks) for masks in tables["PAWN_ATTACK_MASKS"])
+    tables["PAWN_PUSHES"] = tuple(tuple(bit_squares(mask) for mask in masks) for masks in tables["PAWN_PUSH_MASKS"])
+
+    # BETWEEN[square_from][square_to] holds the squares a sliding piece passes through on its way
+    # from square_from to square_to. Every one of them has to be empty for the move to be possible.
+    tables["BETWEEN"] = tuple(tuple(between(square_from, square_to, rays) for square_to in range(64))
+                              for square_from in range(64))
+    return tables
+
+
+# Change this whenever build_tables gives different tables, so that caches written by older
+# versions are worked out again instead of being used.
+TABLES_VERSION = 1
+
+_tables = load_tables("move_tables", TABLES_VERSION, build_tables)
+KNIGHT_MASKS = _tables["KNIGHT_MASKS"]
+KING_MASKS = _tables["KING_MASKS"]
+PAWN_ATTACK_MASKS = _tables["PAWN_ATTACK_MASKS"]
+PAWN_PUSH_MASKS = _tables["PAWN_PUSH_MASKS"]
+KNIGHT_MOVES = _tables["KNIGHT_MOVES"]
+KING_MOVES = _tables["KING_MOVES"]
+PAWN_ATTACKS = _tables["PAWN_ATTACKS"]
+PAWN_PUSHES = _tables["PAWN_PUSHES"]
+RAYS = _tables["RAYS"]
+ROOK_MASKS = _tables["ROOK_MASKS"]
+BISHOP_MASKS = _tables["BISHOP_MASKS"]
+QUEEN_MASKS = _tables["QUEEN_MASKS"]
+ROOK_MOVES = _tables["ROOK_MOVES"]
+BISHOP_MOVES = _tables["BISHOP_MOVES"]
+QUEEN_MOVES = _tables["QUEEN_MOVES"]
+BETWEEN = _tables["BETWEEN"]
+
+_POSITIVE_ROOK_RAYS = (RAYS[NORTH], RAYS[EAST])
+_NEGATIVE_ROOK_RAYS = (RAYS[SOUTH], RAYS[WEST])
+_POSITIVE_BISHOP_RAYS = (RAYS[NORTH_EAST], RAYS[NORTH_WEST])
+_NEGATIVE_BISHOP_RAYS = (RAYS[SOUTH_EAST], RAYS[SOUTH_WEST])
+
+
+def _slide(square, occupied, positive_rays, negative_rays):
+    """
+    Returns the squares reached by sliding from square along the given rays. Each ray is cut
+    off after the first occupied square on it, found from the lowest set bit for the rays that
+    go up the board and the highest set bit for the rays that go down it.
+    """
+    attacks = 0
+    for rays in positive_rays:
+        attacked = rays[square]
+        blockers = attacked & occupied
+        if blockers:
+            attacked ^= rays[(blockers & -blockers).bit_length() - 1]
+        attacks |= attacked
+    for rays in negative_rays:
+        attacked = rays[square]
+        blockers = attacked & occupied
+        if blockers:
+            attacked ^= rays[blockers.bit_length() - 1]
+        attacks |= attacked
+    return attacks
+
+
+def rook_attacks(square, occupied):
+    """
+    Returns every square a rook on the given square attacks when the squares in occupied hold
+    pieces. Occupied squares the rook runs into are included since they can be captured.
+    """
+    return _slide(square, occupied, _POSITIVE_ROOK_RAYS, _NEGATIVE_ROOK_RAYS)
+
+
+def bishop_attacks(square, occupied):
+    """
+    Returns every square a bishop on the given square attacks when the squares in occupied hold
+    pieces. Occupied squares the bishop runs into are included since they can be captured.
+    """
+    return _slide(square, occupied, _POSITIVE_BISHOP_RAYS, _NEGATIVE_BISHOP_RAYS)
+
+
+def queen_attacks(square, occupied):
+    """
+    Returns every square a queen on the given square attacks when the squares in occupied hold
+    pieces. Occupied squares the queen runs into are included since they can be captured.
+    """
+    return rook_attacks(square, occupied) | bishop_attacks(square, occupied)
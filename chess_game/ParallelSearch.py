@@ -0,0 +1,357 @@
+# Author: Cooper Thompson
+# GitHub username: coopthompson
+# Date: October 18th, 2026
+# Description: Searches one ChessVar position with several Engines at once, one
+#              per worker process, so a search can use every core. The engines
+#              share one transposition table in shared memory, so each finds the
+#              positions the others have already searched (the "Lazy SMP" way
+#              of searching in parallel). Includes a benchmark of how well the
+#              search scales with more workers.
+#              Run it with: python -m chess_game.ParallelSearch [options]
+
+import argparse
+import ctypes
+import multiprocessing
+import multiprocessing.connection
+import sys
+import time
+
+from .ChessVar import ChessVar
+from .Engine import Engine, WIN_THRESHOLD
+from .Bitboard import move_names
+
+# Positions the benchmark searches, reached by random moves from the start.
+BENCHMARK_POSITIONS = (
+    "1nbqkb1r/r1p1pp1p/Qp1n4/p2p2p1/3N4/P1N5/1PPP1PPP/R1B1KB1R w 18",
+    "r1bqk1nr/pppp2pp/n3pp2/b7/2P5/5PPP/PPQPP3/RNB1KBNR w 10",
+    "rnbqkbn1/p1pp4/4p3/1p3ppr/2P4p/N2P2BP/PP1QPPPR/R3KBN1 b 17",
+    "rnbqkb1r/p3pp1p/1p6/2pp1n1p/1P1P2P1/2P2P2/PB1KP3/RN2QBNR b 19",
+    "rnbqkbnr/pp2p2p/8/2N5/6p1/3p3B/PPPPPP1P/RNBQKR2 w 14",
+    "rn2qbn1/1ppkppp1/3p3r/p3N2p/4P2P/1b6/PPPPBPPR/RNBQK3 b 19",
+)
+
+# How a table entry's data is packed into one 64-bit number: the score (plus SCORE_OFFSET so it
+# isn't negative) in the lowest 21 bits, then the flag, the depth, and the move plus one (0 for no
+# move). A stored entry is never all zeros, so zeros mark an empty slot.
+SCORE_OFFSET = 1 << 20
+SCORE_MASK = (1 << 21) - 1
+FLAG_SHIFT = 21
+DEPTH_SHIFT = 23
+MOVE_SHIFT = 31
+
+
+class SharedTable:
+    """
+    Represents a transposition table kept in shared memory (a multiprocessing.RawArray), which
+    Engines in different processes can read and write at the same time. It is used by the Engine
+    like its own dictionary, through get and item assignment. Each position key has one slot, so a
+    new entry replaces whatever was there. Every slot holds two 64-bit numbers: the entry's data,
+    and the position key XORed with the data. The two are written one after the other without any
+    locking, so a slot being written by two processes at once can end up with halves of different
+    entries, but then the key no longer matches and the slot simply reads as empty.
+    """
+    def __init__(self, entries=1 << 20):
+        """
+        Initialises an empty SharedTable with room for entries entries (rounded up to a power of
+        two). It takes 16 bytes an entry. Worker processes started after it is made share it.
+        """
+        size = 1
+        while size < entries:
+            size *= 2
+        self._mask = size - 1
+        self._array = multiprocessing.RawArray("Q", 2 * size)
+        self._slots = memoryview(self._array).cast("B").cast("Q")
+
+    def __getstate__(self):
+        """
+        Returns what is needed to share the table with a worker process: the shared array itself
+        and not the view of it
+        """
+        return self._mask, self._array
+
+    def __setstate__(self, state):
+        """
+        Sets up a table shared from another process
+        """
+        self._mask, self._array = state
+        self._slots = memoryview(self._array).cast("B").cast("Q")
+
+    def __len__(self):
+        """
+        Returns the number of entries the table has room for
+        """
+        return self._mask + 1
+
+    def get(self, key, default=None):
+        """
+        Returns the entry for a position key as a tuple of depth, score, flag, and move (like the
+        Engine's own table), or default if there isn't one
+        """
+        slot = 2 * (key & self._mask)
+        data = self._slots[slot + 1]
+        if data == 0 or self._slots[slot] ^ data != key:
+            return default
+        move = (data >> MOVE_SHIFT) - 1
+        return ((data >> DEPTH_SHIFT) & 255, (data & SCORE_MASK) - SCORE_OFFSET, (data >> FLAG_SHIFT) & 3,
+                None if move < 0 else move)
+
+    def __setitem__(self, key, entry):
+        """
+        Stores an entry (a tuple of depth, score, flag, and move) for a position key
+        """
+        depth, score, flag, move = entry
+        data = ((score + SCORE_OFFSET) | flag << FLAG_SHIFT | min(depth, 255) << DEPTH_SHIFT |
+                (0 if move is None else move + 1) << MOVE_SHIFT)
+        slot = 2 * (key & self._mask)
+        self._slots[slot] = key ^ data
+        self._slots[slot + 1] = data
+
+    def clear(self):
+        """
+        Empties the table
+        """
+        ctypes.memset(self._array, 0, ctypes.sizeof(self._array))
+
+
+class WorkerEngine(Engine):
+    """
+    Represents the Engine run by one worker. It uses the SharedTable and also stops once the
+    shared stop flag is set, which happens as soon as any worker has finished. Workers other than
+    the first try root moves the ordering scores as equal in a different order, so they spread out
+    over the tree instead of all searching the same moves first.
+    """
+    def __init__(self, table, stop, worker_index):
+        """
+        Initialises a WorkerEngine for the worker with the given index, using the shared table and
+        stop flag (a multiprocessing.RawValue)
+        """
+        super().__init__(table=table)
+        self._stop = stop
+        self._worker_index = worker_index
+
+    def _should_stop(self):
+        """
+        Returns True if another worker has finished or the time is up
+        """
+        return self._stop.value or super()._should_stop()
+
+    def _search_root(self, game, moves, depth, first_move):
+        """
+        Searches the root moves like the Engine, but starting at a different move for every worker
+        and depth
+        """
+        if self._worker_index:
+            start = (self._worker_index * depth) % len(moves)
+            moves = moves[start:] + moves[:start]
+        return super()._search_root(game, moves, depth, first_move)
+
+
+def _run_worker(table, stop, worker_index, connection):
+    """
+    Runs in a worker process: searches every task sent over the connection (the position in the
+    text form of the Position module, the depth limit, and the time limit in seconds) and sends back
+    the result, until it is sent None
+    """
+    engine = WorkerEngine(table, stop, worker_index)
+    while True:
+        task = connection.recv()
+        if task is None:
+            break
+        connection.send(_search_task(engine, *task))
+    connection.close()
+
+
+def _search_task(engine, position, max_depth, max_seconds):
+    """
+    Searches a position with an engine and returns a tuple of the move, score, depth reached, and
+    number of positions visited
+    """
+    move, score = engine.search(ChessVar.from_position(position), max_depth=max_depth, max_seconds=max_seconds)
+    return move, score, engine.get_depth_reached(), engine.get_nodes()
+
+
+class ParallelSearch:
+    """
+    Represents a parallel search over a pool of worker processes sharing a SharedTable. Every
+    search hands the same position to every worker, and each searches it with its own Engine. As
+    soon as one finishes (it reached the depth limit or found a win) or the time is up, all of them
+    stop, and the move from the deepest search finished is returned. The workers and the table are
+    kept between searches, so close it (or use it in a with statement) when done.
+    """
+    def __init__(self, workers=None, table_entries=1 << 20):
+        """
+        Initialises a ParallelSearch with the given number of workers (one per CPU if None) and a
+        table with room for table_entries entries. With one worker it searches in this process.
+        """
+        self._table = SharedTable(table_entries)
+        self._stop = multiprocessing.RawValue("b", 0)
+        self._workers = workers or multiprocessing.cpu_count()
+        self._connections = []
+        self._processes = []
+        self._engine = None
+        self._results = []
+        if self._workers == 1:
+            self._engine = WorkerEngine(self._table, self._stop, 0)
+            return
+        for worker_index in range(self._workers):
+            connection, worker_connection = multiprocessing.Pipe()
+            process = multiprocessing.Process(target=_run_worker, args=(self._table, self._stop, worker_index,
+                                                                         worker_connection), daemon=True)
+            process.start()
+            worker_connection.close()
+            self._connections.append(connection)
+            self._processes.append(process)
+
+    def __enter__(self):
+        """
+        Returns the ParallelSearch itself for a with statement
+        """
+        return self
+
+    def __exit__(self, exception_type, exception, traceback):
+        """
+        Closes the ParallelSearch at the end of a with statement
+        """
+        self.close()
+
+    def close(self):
+        """
+        Stops the worker processes
+        """
+        for connection in self._connections:
+            connection.send(None)
+            connection.close()
+        for process in self._processes:
+            process.join()
+        self._connections = []
+        self._processes = []
+
+    def get_workers(self):
+        """
+        Returns the number of workers
+        """
+        return self._workers
+
+    def get_results(self):
+        """
+        Returns a list of what every worker found in the last search, in worker order: tuples of
+        the move, score, depth reached, and number of positions visited
+        """
+        return list(self._results)
+
+    def get_nodes(self):
+        """
+        Returns the number of positions all the workers visited in the last search
+        """
+        return sum(result[3] for result in self._results)
+
+    def get_depth_reached(self):
+        """
+        Returns the depth of the deepest iteration any worker finished in the last search
+        """
+        return max((result[2] for result in self._results), default=0)
+
+    def clear(self):
+        """
+        Empties the shared transposition table
+        """
+        self._table.clear()
+
+    def search(self, game, max_depth=64, max_seconds=None):
+        """
+        Takes a ChessVar and returns a tuple of the best move found for the player to move (as an
+        integer, see encode_move in the Bitboard module) and its score, like Engine.search. Stops at
+        max_depth or once max_seconds have passed, whichever comes first. The game isn't changed.
+        """
+        task = (game.to_fen(), max_depth, max_seconds)
+        self._stop.value = 0
+        if self._engine is not None:
+            self._results = [_search_task(self._engine, *task)]
+        else:
+            for connection in self._connections:
+                connection.send(task)
+            results = [None] * self._workers
+            waiting = dict(zip(self._connections, range(self._workers)))
+            while waiting:
+                for connection in multiprocessing.connection.wait(list(waiting)):
+                    results[waiting.pop(connection)] = connection.recv()
+                    self._stop.value = 1
+            self._results = results
+        # The deepest finished search is the best informed. The first worker wins ties since its
+        # moves are searched in the Engine's own order.
+        best = max(self._results, key=lambda result: result[2])
+        return best[0], best[1]
+
+
+def run_benchmark(max_workers, depth, positions=BENCHMARK_POSITIONS, table_entries=1 << 20):
+    """
+    Searches every position to a fixed depth with 1 worker, then 2, up to max_workers, starting
+    from an empty table for every position. Returns a list of dictionaries, one for each number of
+    workers, with the time it took, the positions visited, the speedup over one worker, and the
+    efficiency (the speedup divided by the number of workers, 1.0 being perfect scaling).
+    """
+    rows = []
+    for workers in range(1, max_workers + 1):
+        with ParallelSearch(workers, table_entries) as search:
+            seconds = 0.0
+            nodes = 0
+            for position in positions:
+                search.clear()
+                game = ChessVar.from_position(position)
+                start = time.perf_counter()
+                search.search(game, max_depth=depth)
+                seconds += time.perf_counter() - start
+                nodes += search.get_nodes()
+        speedup = rows[0]["seconds"] / seconds if rows else 1.0
+        rows.append({
+            "workers": workers,
+            "seconds": seconds,
+            "nodes": nodes,
+            "nodes_per_second": nodes / seconds if seconds else 0.0,
+            "speedup": speedup,
+            "efficiency": speedup / workers,
+        })
+    return rows
+
+
+def main(argv=None):
+    """
+    Runs the scaling benchmark, or searches one position, from the command line
+    """
+    parser = argparse.ArgumentParser(prog="python -m chess_game.ParallelSearch", description="Benchmark how the "
+                                     "parallel search scales, or search one position.")
+    parser.add_argument("--workers", type=int, default=multiprocessing.cpu_count(),
+                        help="most workers to benchmark, or workers to search with (default one per CPU)")
+    parser.add_argument("--depth", type=int, default=5, help="depth to search to (default 5)")
+    parser.add_argument("--position", help="search this position (in the text form of the Position module) "
+                        "instead of running the benchmark")
+    parser.add_argument("--seconds", type=float, default=None, help="time limit for --position")
+    args = parser.parse_args(argv)
+    if args.workers < 1 or args.depth < 1:
+        parser.error("--workers and --depth must be at least 1")
+
+    if args.position:
+        try:
+            game = ChessVar.from_position(args.position)
+        except ValueError as error:
+            parser.error(str(error))
+        with ParallelSearch(args.workers) as search:
+            move, score = search.search(game, args.depth, args.seconds)
+            if move is None:
+                print("No moves")
+            else:
+                result = " (decisive)" if abs(score) >= WIN_THRESHOLD else ""
+                print("".join(move_names(move)) + " score " + str(score) + result + ", depth " +
+                      str(search.get_depth_reached()) + ", " + str(search.get_nodes()) + " positions")
+        return 0
+
+    print("workers  seconds  positions  positions/s  speedup  efficiency")
+    for row in run_benchmark(args.workers, args.depth):
+        print("%7d  %7.2f  %9d  %11.0f  %7.2f  %10.2f" % (row["workers"], row["seconds"], row["nodes"],
+                                                        row["nodes_per_second"], row["speedup"],
+                                                        row["efficiency"]))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,159 @@
+# Author: Cooper Thompson
+# GitHub username: coopthompson
+# Date: October 18th, 2026
+# Description: Perft (performance test) for the ChessVar rules. Counts every
+#              position that can be reached in a given number of moves, which
+#              measures how fast moves are generated and, compared against the
+#              stored counts below, proves that they are generated correctly.
+#              Run it with: python -m chess_game.Perft [depth] [options]
+
+import argparse
+import sys
+import time
+
+from .ChessVar import ChessVar
+from .Bitboard import move_names
+
+# Positions perft can start from, each given as the moves that lead to it from the starting
+# position.
+POSITIONS = {
+    # The normal starting position.
+    "start": (),
+    # Both center pawns have moved so pawns can capture each other and the Queens and Bishops
+    # have open lines.
+    "open-center": (("e2", "e4"), ("d7", "d5")),
+    # The Scholar's mate setup. White's Queen and Bishop both aim at f7.
+    "scholar": (("e2", "e4"), ("e7", "e5"), ("d1", "h5"), ("b8", "c6"), ("f1", "c4"), ("g8", "f6")),
+    # White's Queen can capture Black's only King, which ends the game, so many lines stop early.
+    "king-hunt": (("e2", "e4"), ("f7", "f5"), ("d1", "h5"), ("a7", "a6")),
+}
+
+# Expected perft counts for each position, starting from depth 1. These differ from the counts
+# for regular chess because there is no check, castling, en passant, or promotion, a pawn can only
+# move forward while all of its forward squares are empty, and the game ends as soon as one player
+# has lost every piece of a type. The counts up to depth 3 (depth 4 for the starting position) were
+# confirmed by trying make_move on every pair of squares in every position.
+EXPECTED = {
+    "start": (20, 400, 8902, 197388, 4873540),
+    "open-center": (31, 889, 27972, 828788),
+    "scholar": (42, 1158, 44785, 1317137),
+    "king-hunt": (41, 734, 28840, 600780),
+}
+
+
+def setup_position(name):
+    """
+    Takes the name of one of the POSITIONS and returns a new ChessVar with that position
+    """
+    game = ChessVar()
+    for square_from, square_to in POSITIONS[name]:
+        if not game.make_move(square_from, square_to):
+            raise ValueError("Position " + name + " contains an illegal move: " + square_from + square_to)
+    return game
+
+
+def perft(game, depth):
+    """
+    Takes a ChessVar and a depth and returns the number of positions that can be reached by making
+    exactly depth moves. Games that end sooner don't count. Moves are made with push and taken back
+    with pop, so the game is left as it was.
+    """
+    if depth == 0:
+        return 1
+    moves = game.legal_moves()
+    if depth == 1:
+        return len(moves)
+    nodes = 0
+    for move in moves:
+        game.push(move)
+        nodes += perft(game, depth - 1)
+        game.pop()
+    return nodes
+
+
+def divide(game, depth):
+    """
+    Takes a ChessVar and a depth of at least 1 and returns a list of (move name, count) pairs, one
+    for every legal move, where count is the perft count below that move
+    """
+    results = []
+    for move in game.legal_moves():
+        game.push(move)
+        results.append(("".join(move_names(move)), perft(game, depth - 1)))
+        game.pop()
+    return results
+
+
+def validate(game, depth):
+    """
+    Takes a ChessVar and a depth and checks, for every position up to that depth, that legal_moves
+    returns exactly the moves make_move accepts when it is tried on all 4096 pairs of squares.
+    Returns the number of positions checked. This is much slower than perft.
+    """
+    names = [column + row for row in "12345678" for column in "abcdefgh"]
+    generated = set("".join(move_names(move)) for move in game.legal_moves())
+    for square_from in names:
+        for square_to in names:
+            accepted = game.copy().make_move(square_from, square_to)
+            if accepted != (square_from + square_to in generated):
+                raise AssertionError("legal_moves and make_move disagree on " + square_from + square_to)
+    checked = 1
+    if depth > 0:
+        for move in game.legal_moves():
+            game.push(move)
+            checked += validate(game, depth - 1)
+            game.pop()
+    return checked
+
+
+def main(argv=None):
+    """
+    Runs perft from the command line. Prints the count for every position (or the chosen one) at
+    the given depth along with how long it took and how many positions per second that is.
+    """
+    parser = argparse.ArgumentParser(prog="python -m chess_game.Perft", description="Count positions reachable in "
+                                     "a number of moves under the ChessVar rules.")
+    parser.add_argument("depth", type=int, nargs="?", default=3, help="number of moves to look ahead (default 3)")
+    parser.add_argument("--position", choices=sorted(POSITIONS), help="only run this position")
+    parser.add_argument("--divide", action="store_true", help="print the count below every legal first move")
+    parser.add_argument("--check", action="store_true", help="compare the counts against the stored table")
+    parser.add_argument("--validate", action="store_true", help="also compare legal_moves against make_move "
+                        "on all 4096 square pairs in every position (slow)")
+    args = parser.parse_args(argv)
+
+    failed = False
+    names = [args.position] if args.position else list(POSITIONS)
+    for name in names:
+        game = setup_position(name)
+        start = time.perf_counter()
+        if args.divide and args.depth > 0:
+            results = divide(game, args.depth)
+            for move, count in results:
+                print("  " + move + ": " + str(count))
+            nodes = sum(count for move, count in results)
+        else:
+            nodes = perft(game, args.depth)
+        elapsed = time.perf_counter() - start
+        nodes_per_second = int(nodes / elapsed) if elapsed > 0 else 0
+        line = name + " depth " + str(args.depth) + ": " + str(nodes) + " nodes in " + \
+            "%.3f" % elapsed + "s (" + str(nodes_per_second) + " nodes/s)"
+
+        if args.check:
+            expected = EXPECTED[name]
+            if args.depth < 1 or args.depth > len(expected):
+                line += " [no stored count]"
+            elif expected[args.depth - 1] == nodes:
+                line += " [ok]"
+            else:
+                line += " [FAILED, expected " + str(expected[args.depth - 1]) + "]"
+                failed = True
+        print(line)
+
+        if args.validate:
+            print("  validated " + str(validate(game, args.depth - 1)) + " positions against make_move")
+
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
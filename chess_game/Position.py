@@ -0,0 +1,174 @@
+# Author: Cooper Thompson
+# GitHub username: coopthompson
+# Date: October 18th, 2026
+# Description: Saves and loads ChessVar positions in two compact forms. The text
+#              form is like FEN: "rnbqkbnr/pppppppp/8/8/8/8/PPPPPPPP/RNBQKBNR w 0"
+#              gives the pieces (rank 8 first), the player to move, and the turn
+#              number. The binary form packs the board into exactly 32 bytes.
+
+from .Bitboard import EMPTY, PLAYERS
+from .MoveTables import FULL_BOARD
+
+
+class InvalidPositionError(ValueError):
+    """
+    Raised when a position in the text or binary form can't be read
+    """
+
+
+# The letters used for each piece type in the text form, indexed by piece type. White's pieces
+# are upper case and Black's are lower case, as in FEN.
+FEN_LETTERS = "PNBRQK"
+FEN_CODES = {letter: code for code, letter in enumerate(FEN_LETTERS + FEN_LETTERS.lower())}
+SIDE_LETTERS = ("w", "b")
+
+# The binary form is 32 bytes holding a 4 bit value for each square, a1 in the low half of the
+# first byte through h8 in the high half of the last one. 1 to 6 are White's Pawn to King and
+# 9 to 14 are Black's (the 8 bit marks Black). An empty square is 0 when White is to move and 8
+# when Black is, which is how the player to move fits in without another byte. A game never has
+# more than 32 pieces, so there is always an empty square to carry it. 15 is never used, so the
+# binary form never contains the byte for "/" and load_position can tell the two forms apart.
+POSITION_SIZE = 32
+BLACK_BIT = 8
+
+
+def format_fen(board, turn_number):
+    """
+    Takes a Bitboard and a turn number and returns the position in the text form
+    """
+    ranks = []
+    for rank in range(7, -1, -1):
+        text = ""
+        empty = 0
+        for square in range(rank * 8, rank * 8 + 8):
+            code = board.piece_at(square)
+            if code == EMPTY:
+                empty += 1
+                continue
+            if empty:
+                text += str(empty)
+                empty = 0
+            letter = FEN_LETTERS[code % 6]
+            text += letter if code < 6 else letter.lower()
+        if empty:
+            text += str(empty)
+        ranks.append(text)
+    return "/".join(ranks) + " " + SIDE_LETTERS[turn_number % 2] + " " + str(turn_number)
+
+
+def parse_fen(text):
+    """
+    Takes a position in the text form and returns a tuple of twelve bitboards (indexed by piece
+    code) and the turn number. The turn number can be left out, in which case it is 0 with White
+    to move and 1 with Black to move. Raises InvalidPositionError if the text can't be read or the
+    turn number doesn't match the player to move.
+    """
+    fields = text.split()
+    if len(fields) not in (2, 3):
+        raise InvalidPositionError("Expected pieces, player to move, and turn number in " + repr(text))
+    placement, side = fields[0], fields[1]
+    if side not in SIDE_LETTERS:
+        raise InvalidPositionError("The player to move must be w or b, not " + repr(side))
+    if len(fields) == 3:
+        if not fields[2].isdigit():
+            raise InvalidPositionError("The turn number must be a whole number, not " + repr(fields[2]))
+        turn_number = int(fields[2])
+        if turn_number % 2 != SIDE_LETTERS.index(side):
+            raise InvalidPositionError("Turn " + str(turn_number) + " is not " + PLAYERS[SIDE_LETTERS.index(side)] +
+                                       "'s turn")
+    else:
+        turn_number = SIDE_LETTERS.index(side)
+
+    ranks = placement.split("/")
+    if len(ranks) != 8:
+        raise InvalidPositionError("Expected 8 ranks, got " + str(len(ranks)))
+    bitboards = [0] * 12
+    for row, text_rank in enumerate(ranks):
+        square = (7 - row) * 8
+        end = square + 8
+        for character in text_rank:
+            if character in "12345678":
+                square += int(character)
+            elif character in FEN_CODES:
+                if square < end:
+                    bitboards[FEN_CODES[character]] |= 1 << square
+                square += 1
+            else:
+                raise InvalidPositionError("Unknown piece " + repr(character))
+        if square != end:
+            raise InvalidPositionError("Rank " + str(8 - row) + " does not have 8 squares")
+    return tuple(bitboards), turn_number
+
+
+def pack_position(board, turn_number):
+    """
+    Takes a Bitboard and a turn number and returns the position in the 32 byte binary form. Only
+    the player to move is kept, not the turn number itself. Raises InvalidPositionError if every
+    square is occupied, since then there is nowhere to keep the player to move.
+    """
+    if board.get_occupied() == FULL_BOARD:
+        raise InvalidPositionError("A position needs at least one empty square")
+    empty = BLACK_BIT if turn_number % 2 else 0
+    values = []
+    for square in range(64):
+        code = board.piece_at(square)
+        if code == EMPTY:
+            values.append(empty)
+        else:
+            values.append(code % 6 + 1 + BLACK_BIT * (code // 6))
+    return bytes(values[square] | values[square + 1] << 4 for square in range(0, 64, 2))
+
+
+def unpack_position(data):
+    """
+    Takes a position in the binary form and returns a tuple of twelve bitboards (indexed by piece
+    code) and the turn number, which is 0 with White to move and 1 with Black to move. Raises
+    InvalidPositionError if the data isn't 32 bytes or isn't a position.
+    """
+    if len(data) != POSITION_SIZE:
+        raise InvalidPositionError("Expected " + str(POSITION_SIZE) + " bytes, got " + str(len(data)))
+    bitboards = [0] * 12
+    empty = None
+    for square in range(64):
+        value = data[square >> 1] >> 4 * (square & 1) & 15
+        piece = value & 7
+        if piece == 0:
+            if empty is None:
+                empty = value
+            elif value != empty:
+                raise InvalidPositionError("The empty squares don't agree on the player to move")
+        elif piece == 7:
+            raise InvalidPositionError("Unknown piece value " + str(value) + " on square " + str(square))
+        else:
+            bitboards[(value >> 3) * 6 + piece - 1] |= 1 << square
+    if empty is None:
+        raise InvalidPositionError("A position needs at least one empty square")
+    return tuple(bitboards), empty >> 3
+
+
+def save_position(path, board, turn_number, binary=False):
+    """
+    Writes a Bitboard and turn number to a file, in the text form unless binary is set
+    """
+    if binary:
+        with open(path, "wb") as output:
+            output.write(pack_position(board, turn_number))
+    else:
+        with open(path, "w") as output:
+            output.write(format_fen(board, turn_number) + "\n")
+
+
+def load_position(path):
+    """
+    Reads a position written by save_position (in either form) and returns a tuple of twelve
+    bitboards and the turn number. Raises InvalidPositionError if the file doesn't hold a position.
+    """
+    with open(path, "rb") as source:
+        data = source.read()
+    if b"/" not in data:
+        return unpack_position(data)
+    try:
+        text = data.decode("ascii")
+    except UnicodeDecodeError:
+        raise InvalidPositionError(path + " does not hold a position")
+    return parse_fen(text)
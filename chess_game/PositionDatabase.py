@@ -0,0 +1,426 @@
+# Author: Cooper Thompson
+# GitHub username: coopthompson
+# Date: October 18th, 2026
+# Description: A database of every position reached in a collection of archived
+#              ChessVar games, with how often each was reached and how the games
+#              through it ended. It is kept in two memory-mapped files, a record
+#              file and a hash index of position keys, so a position is looked
+#              up without reading the whole database, and new games are added
+#              to it without rebuilding it.
+#              Run it with: python -m chess_game.PositionDatabase add DATABASE games.txt
+
+import argparse
+import mmap
+import os
+import struct
+import sys
+
+from .Bitboard import InvalidSquareError
+from .ChessVar import ChessVar
+from .Position import InvalidPositionError
+from .Replay import replay_game
+
+# The record file starts with a header (the magic bytes, the format version, the number of records,
+# and the number of games added) followed by one record per position: the position key, the
+# number of times it was reached, the number of games that reached it, and how many of those White
+# won and Black won. Records are only ever added at the end.
+DATA_MAGIC = b"CVPD"
+DATA_HEADER = struct.Struct("<4sIQQ")
+RECORD = struct.Struct("<QIIII")
+
+# The index file starts with a header (the magic bytes, the format version, and the number of
+# slots) followed by the slots of a hash table: a position key and the number of its record plus
+# one, 0 marking an empty slot. A key goes in the slot given by its low bits (keys are Zobrist keys,
+# so their bits are already random), or the next empty one after it. The index is rebuilt twice
+# the size once it is half full.
+INDEX_MAGIC = b"CVPI"
+INDEX_HEADER = struct.Struct("<4sIQ")
+SLOT = struct.Struct("<QI")
+
+FORMAT_VERSION = 1
+DATA_FILE = "positions.dat"
+INDEX_FILE = "positions.idx"
+INITIAL_RECORDS = 1024
+INITIAL_SLOTS = 2048
+
+# The number of games add_lines replays before writing what they added to the files.
+BATCH_GAMES = 10000
+
+
+class PositionStats:
+    """
+    Represents what the database knows about one position
+    """
+    def __init__(self, key, occurrences, games, white_won, black_won):
+        """
+        Initialises a PositionStats for the position with the given key. occurrences is the number
+        of times the position was reached (a game can reach it more than once), games the number
+        of games that reached it, and white_won and black_won how many of those each player won.
+        """
+        self._key = key
+        self._occurrences = occurrences
+        self._games = games
+        self._white_won = white_won
+        self._black_won = black_won
+
+    def get_key(self):
+        """
+        Returns the position key (see ChessVar.get_position_key)
+        """
+        return self._key
+
+    def get_occurrences(self):
+        """
+        Returns the number of times the position was reached
+        """
+        return self._occurrences
+
+    def get_games(self):
+        """
+        Returns the number of games that reached the position
+        """
+        return self._games
+
+    def get_results(self):
+        """
+        Returns a dictionary of how many of the games that reached the position ended each way,
+        keyed like get_game_state (WHITE_WON, BLACK_WON, and UNFINISHED)
+        """
+        return {
+            "WHITE_WON": self._white_won,
+            "BLACK_WON": self._black_won,
+            "UNFINISHED": self._games - self._white_won - self._black_won,
+        }
+
+
+class PositionDatabase:
+    """
+    Represents a position database kept in a directory. Both files are memory-mapped, so looking a
+    position up only reads the few pages it touches. Games are added by replaying them (see the
+    Replay module); a game with a move that isn't allowed is left out. Adding only ever appends
+    records or updates the counts of existing ones, so a database can keep growing as games come in.
+    Call close (or use a with statement) to write everything to disk.
+    """
+    def __init__(self, directory, writable=False):
+        """
+        Initialises a PositionDatabase for the given directory. If writable is False the database
+        has to exist and can only be read. If it is True the directory and files are created if
+        they don't exist.
+        """
+        self._directory = directory
+        self._writable = writable
+        data_path = os.path.join(directory, DATA_FILE)
+        index_path = os.path.join(directory, INDEX_FILE)
+        if writable and not os.path.exists(data_path):
+            os.makedirs(directory, exist_ok=True)
+            with open(data_path, "wb") as data_file:
+                data_file.write(DATA_HEADER.pack(DATA_MAGIC, FORMAT_VERSION, 0, 0))
+                data_file.truncate(DATA_HEADER.size + RECORD.size * INITIAL_RECORDS)
+            self._write_empty_index(index_path, INITIAL_SLOTS)
+        mode = "r+b" if writable else "rb"
+        self._data_file = open(data_path, mode)
+        self._index_file = open(index_path, mode)
+        self._data = None
+        self._index = None
+        self._map_files()
+
+        magic, version, self._records, self._game_count = DATA_HEADER.unpack_from(self._data)
+        if magic != DATA_MAGIC or version != FORMAT_VERSION:
+            raise ValueError(data_path + " is not a position database")
+        magic, version, slots = INDEX_HEADER.unpack_from(self._index)
+        if magic != INDEX_MAGIC or version != FORMAT_VERSION:
+            raise ValueError(index_path + " is not a position database index")
+        self._mask = slots - 1
+
+    def __enter__(self):
+        """
+        Returns the PositionDatabase itself for a with statement
+        """
+        return self
+
+    def __exit__(self, exception_type, exception, traceback):
+        """
+        Closes the PositionDatabase at the end of a with statement
+        """
+        self.close()
+
+    def __len__(self):
+        """
+        Returns the number of positions in the database
+        """
+        return self._records
+
+    def get_game_count(self):
+        """
+        Returns the number of games added to the database
+        """
+        return self._game_count
+
+    def close(self):
+        """
+        Writes any changes to disk and closes the files
+        """
+        if self._data is None:
+            return
+        if self._writable:
+            self._data.flush()
+            self._index.flush()
+        self._data.close()
+        self._index.close()
+        self._data_file.close()
+        self._index_file.close()
+        self._data = None
+        self._index = None
+
+    def lookup(self, key):
+        """
+        Takes a position key (see ChessVar.get_position_key) and returns a PositionStats for it, or
+        None if no game reached the position
+        """
+        record = self._find(key)[1]
+        if record is None:
+            return None
+        return PositionStats(*RECORD.unpack_from(self._data, DATA_HEADER.size + RECORD.size * record))
+
+    def lookup_game(self, game):
+        """
+        Takes a ChessVar and returns a PositionStats for its current position, or None if no game
+        reached it
+        """
+        return self.lookup(game.get_position_key())
+
+    def add_game(self, squares):
+        """
+        Takes a game as a list of square names, two per move (like replay_game), and adds every
+        position it reached to the database. Returns True if the game was added, or False if it
+        had a move that isn't allowed.
+        """
+        updates = {}
+        added = self._collect_game(squares, updates)
+        self._apply(updates, added)
+        return bool(added)
+
+    def add_lines(self, lines):
+        """
+        Takes any iterable of lines, one game per line like the Replay module reads, and adds every
+        game to the database. Positions reached by several games in a batch are gathered up first
+        so each is only written once a batch. Returns a tuple of the number of games added and the
+        number left out because they had a move that isn't allowed.
+        """
+        updates = {}
+        batch = 0
+        added = 0
+        skipped = 0
+        for line in lines:
+            squares = line.split()
+            if not squares:
+                continue
+            if self._collect_game(squares, updates):
+                batch += 1
+            else:
+                skipped += 1
+            if batch == BATCH_GAMES:
+                self._apply(updates, batch)
+                added += batch
+                updates = {}
+                batch = 0
+        self._apply(updates, batch)
+        return added + batch, skipped
+
+    def add_file(self, path):
+        """
+        Takes the path of a file with one game per line and adds every game to the database, like
+        add_lines
+        """
+        with open(path) as games:
+            return self.add_lines(games)
+
+    def _collect_game(self, squares, updates):
+        """
+        Replays a game and adds its positions to updates, a dictionary from position key to a list
+        of the counts to add to its record. Returns 1 if the game was added and 0 if it wasn't.
+        """
+        keys = []
+        result = replay_game(squares, keys=keys)
+        if not result.is_valid():
+            return 0
+        state = result.get_state()
+        white_won = 1 if state == "WHITE_WON" else 0
+        black_won = 1 if state == "BLACK_WON" else 0
+        seen = set()
+        for key in keys:
+            counts = updates.get(key)
+            if counts is None:
+                counts = updates[key] = [0, 0, 0, 0]
+            counts[0] += 1
+            if key not in seen:
+                seen.add(key)
+                counts[1] += 1
+                counts[2] += white_won
+                counts[3] += black_won
+        return 1
+
+    def _apply(self, updates, games):
+        """
+        Adds the counts in updates (see _collect_game) to the records, appending a record for every
+        new position, and adds games to the number of games
+        """
+        if not self._writable:
+            raise ValueError("The position database was opened read only")
+        if not games:
+            return
+        data = self._data
+        for key, counts in updates.items():
+            slot, record = self._find(key)
+            if record is not None:
+                offset = DATA_HEADER.size + RECORD.size * record
+                stored = RECORD.unpack_from(data, offset)
+                RECORD.pack_into(data, offset, key, stored[1] + counts[0], stored[2] + counts[1],
+                                 stored[3] + counts[2], stored[4] + counts[3])
+                continue
+            if DATA_HEADER.size + RECORD.size * (self._records + 1) > len(data):
+                self._grow_data()
+                data = self._data
+            RECORD.pack_into(data, DATA_HEADER.size + RECORD.size * self._records, key, *counts)
+            self._records += 1
+            # The header counts the new record before the index points at it. If adding stops
+            # partway through a batch (a KeyboardInterrupt, say) no slot is left pointing past the
+            # records the header counts, where the next batch would put other positions.
+            DATA_HEADER.pack_into(data, 0, DATA_MAGIC, FORMAT_VERSION, self._records, self._game_count)
+            SLOT.pack_into(self._index, INDEX_HEADER.size + SLOT.size * slot, key, self._records)
+            if 2 * self._records > self._mask + 1:
+                self._grow_index()
+        self._game_count += games
+        DATA_HEADER.pack_into(data, 0, DATA_MAGIC, FORMAT_VERSION, self._records, self._game_count)
+
+    def _find(self, key):
+        """
+        Returns a tuple of the index slot holding a position key (or the empty slot where it would
+        go) and the number of its record (or None if it isn't in the database)
+        """
+        index = self._index
+        slot = key & self._mask
+        while True:
+            slot_key, record = SLOT.unpack_from(index, INDEX_HEADER.size + SLOT.size * slot)
+            if record == 0:
+                return slot, None
+            if slot_key == key:
+                return slot, record - 1
+            slot = (slot + 1) & self._mask
+
+    def _map_files(self):
+        """
+        Memory-maps both files (again, after one of them has grown)
+        """
+        access = mmap.ACCESS_WRITE if self._writable else mmap.ACCESS_READ
+        if self._data is not None:
+            self._data.close()
+            self._index.close()
+        self._data = mmap.mmap(self._data_file.fileno(), 0, access=access)
+        self._index = mmap.mmap(self._index_file.fileno(), 0, access=access)
+
+    def _grow_data(self):
+        """
+        Doubles the room for records in the record file
+        """
+        self._data.flush()
+        self._data_file.truncate(DATA_HEADER.size + RECORD.size * 2 * max(self._records, INITIAL_RECORDS))
+        self._map_files()
+
+    def _grow_index(self):
+        """
+        Rebuilds the index with twice as many slots, from the keys in the record file. The new
+        index is written next to the old one and moved into place once it is complete.
+        """
+        slots = 2 * (self._mask + 1)
+        mask = slots - 1
+        index_path = os.path.join(self._directory, INDEX_FILE)
+        self._write_empty_index(index_path + ".tmp", slots)
+        with open(index_path + ".tmp", "r+b") as index_file:
+            index = mmap.mmap(index_file.fileno(), 0)
+            for record in range(self._records):
+                key = RECORD.unpack_from(self._data, DATA_HEADER.size + RECORD.size * record)[0]
+                slot = key & mask
+                while SLOT.unpack_from(index, INDEX_HEADER.size + SLOT.size * slot)[1]:
+                    slot = (slot + 1) & mask
+                SLOT.pack_into(index, INDEX_HEADER.size + SLOT.size * slot, key, record + 1)
+            index.flush()
+            index.close()
+        self._index.close()
+        self._index_file.close()
+        self._index = None
+        os.replace(index_path + ".tmp", index_path)
+        self._index_file = open(index_path, "r+b")
+        self._index = mmap.mmap(self._index_file.fileno(), 0)
+        self._mask = mask
+
+    @staticmethod
+    def _write_empty_index(path, slots):
+        """
+        Writes an index file with the given number of empty slots
+        """
+        with open(path, "wb") as index_file:
+            index_file.write(INDEX_HEADER.pack(INDEX_MAGIC, FORMAT_VERSION, slots))
+            index_file.truncate(INDEX_HEADER.size + SLOT.size * slots)
+
+
+def main(argv=None):
+    """
+    Adds games to a database or looks a position up in one from the command line
+    """
+    parser = argparse.ArgumentParser(prog="python -m chess_game.PositionDatabase", description="Build and query a "
+                                     "database of the positions reached in archived ChessVar games.")
+    commands = parser.add_subparsers(dest="command")
+    add = commands.add_parser("add", help="add the games in files (one game per line) to a database")
+    add.add_argument("database")
+    add.add_argument("files", nargs="+")
+    query = commands.add_parser("query", help="look up a position")
+    query.add_argument("database")
+    query.add_argument("position", nargs="?", help='the position in the text form of the Position module, for '
+                       'example "rnbqkbnr/pppppppp/8/8/4P3/8/PPPP1PPP/RNBQKBNR b 1" (default the starting position)')
+    query.add_argument("--moves", help='reach the position by these moves from the start instead, like "e2 e4"')
+    args = parser.parse_args(argv)
+
+    if args.command == "add":
+        with PositionDatabase(args.database, writable=True) as database:
+            for path in args.files:
+                added, skipped = database.add_file(path)
+                print(path + ": added " + str(added) + " games, left out " + str(skipped))
+            print(str(database.get_game_count()) + " games, " + str(len(database)) + " positions")
+        return 0
+
+    if args.command == "query":
+        game = ChessVar()
+        try:
+            if args.position:
+                game = ChessVar.from_position(args.position)
+        except InvalidPositionError as error:
+            parser.error(str(error))
+        if args.moves:
+            squares = args.moves.split()
+            if len(squares) % 2:
+                parser.error("--moves needs two squares for every move, " + repr(squares[-1]) + " has no partner")
+            for square_from, square_to in zip(squares[::2], squares[1::2]):
+                try:
+                    allowed = game.make_move(square_from, square_to)
+                except InvalidSquareError as error:
+                    parser.error(str(error))
+                if not allowed:
+                    parser.error(square_from + " " + square_to + " is not allowed")
+        with PositionDatabase(args.database) as database:
+            stats = database.lookup_game(game)
+        if stats is None:
+            print("Not in the database")
+            return 1
+        results = stats.get_results()
+        print("reached " + str(stats.get_occurrences()) + " times in " + str(stats.get_games()) + " games")
+        print("WHITE_WON " + str(results["WHITE_WON"]) + ", BLACK_WON " + str(results["BLACK_WON"]) +
+              ", UNFINISHED " + str(results["UNFINISHED"]))
+        return 0
+
+    parser.print_help()
+    return 2
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,84 @@
+# Author: Cooper Thompson
+# GitHub username: coopthompson
+# Date: October 18th, 2026
+# Description: Draws ChessVar boards on a terminal that understands ANSI escape
+#              codes, for watching games as they are played. The first drawing
+#              of a board writes all of it, and after that only the squares
+#              whose pieces changed are written again, by moving the cursor
+#              straight to them.
+
+import sys
+
+from .ChessVar import CELLS
+from .MoveTables import bit_squares
+
+# Where the first square of a row starts, counted from the left of the board, and how far apart
+# the squares are. This matches the text print_board prints: "8  BR  BH  BB ...".
+FIRST_COLUMN = 3
+COLUMN_WIDTH = 4
+
+
+def move_cursor(line, column):
+    """
+    Returns the ANSI escape code that moves the cursor to a line and column (both counted from 1)
+    """
+    return "\x1b[" + str(line) + ";" + str(column) + "H"
+
+
+class BoardRenderer:
+    """
+    Represents one board drawn at a fixed place on a terminal. Remembers the pieces it last drew
+    (as the twelve bitboards of the Bitboard class) so that the next drawing only has to write the
+    squares that changed since then, however many moves were made or taken back in between.
+    Several renderers with different places can share a terminal to watch several games at once.
+    """
+    def __init__(self, top=1, left=1, stream=None):
+        """
+        Initialises a BoardRenderer that draws with the board's column labels on line top and its
+        left edge at column left (both counted from 1, the top left of the terminal), writing to
+        stream (sys.stdout if not given)
+        """
+        self._top = top
+        self._left = left
+        self._stream = stream
+        self._drawn = None
+
+    def reset(self):
+        """
+        Forgets what was drawn, so the next drawing writes the whole board again. Use this after
+        the terminal has been cleared.
+        """
+        self._drawn = None
+
+    def render(self, game):
+        """
+        Takes a ChessVar and returns the escape codes and text that bring the board on the terminal
+        up to date with it: the whole board the first time (or after reset), and after that only the
+        squares that changed. Returns an empty string if nothing changed.
+        """
+        board = game.get_bitboard()
+        bitboards = board.get_piece_bitboards()
+        if self._drawn is None:
+            lines = game.render_board().split("\n")[:-1]
+            output = "".join(move_cursor(self._top + number, self._left) + line for number, line in enumerate(lines))
+        else:
+            changed = 0
+            for code in range(12):
+                changed |= bitboards[code] ^ self._drawn[code]
+            output = ""
+            for square in bit_squares(changed):
+                line = self._top + 8 - (square >> 3)
+                column = self._left + FIRST_COLUMN + COLUMN_WIDTH * (square & 7)
+                output += move_cursor(line, column) + CELLS[board.piece_at(square) + 1]
+        self._drawn = tuple(bitboards)
+        return output
+
+    def draw(self, game):
+        """
+        Writes what render returns to the stream in a single write and flushes it
+        """
+        output = self.render(game)
+        if output:
+            stream = self._stream or sys.stdout
+            stream.write(output)
+            stream.flush()
@@ -0,0 +1,167 @@
+# Author: Cooper Thompson
+# GitHub username: coopthompson
+# Date: October 18th, 2026
+# Description: Replays archived ChessVar games. Games are read one per line as
+#              pairs of squares ("e2 e4 e7 e5 ..."), checked move by move under
+#              the same rules as make_move, and reported one at a time so files
+#              of any size can be replayed without loading them into memory.
+#              Run it with: python -m chess_game.Replay games.txt
+
+import sys
+
+from .ChessVar import ChessVar
+from .Bitboard import EMPTY, SQUARE_INDEXES, encode_move
+
+
+class ReplayResult:
+    """
+    Represents the result of replaying one archived game. Created by replay_game and the
+    functions that read games from lines or files.
+    """
+    def __init__(self, line_number, state, first_illegal, ply_count, position_key):
+        """
+        Initialises a ReplayResult. line_number is the line the game was read from (1 for the
+        first line), state is what get_game_state returned after the last legal move,
+        first_illegal is the index (from 0) of the first move that wasn't allowed or None if
+        every move was, ply_count is the number of moves made, and position_key is the final
+        position's key.
+        """
+        self._line_number = line_number
+        self._state = state
+        self._first_illegal = first_illegal
+        self._ply_count = ply_count
+        self._position_key = position_key
+
+    def get_line_number(self):
+        """
+        Returns the line the game was read from
+        """
+        return self._line_number
+
+    def get_state(self):
+        """
+        Returns the state of the game (UNFINISHED, BLACK_WON, or WHITE_WON) after its last legal move
+        """
+        return self._state
+
+    def get_first_illegal(self):
+        """
+        Returns the index of the first move that wasn't allowed, or None if every move was allowed
+        """
+        return self._first_illegal
+
+    def get_ply_count(self):
+        """
+        Returns the number of moves that were made before the end of the game or the first move
+        that wasn't allowed
+        """
+        return self._ply_count
+
+    def get_position_key(self):
+        """
+        Returns the position key (see ChessVar.get_position_key) of the final position
+        """
+        return self._position_key
+
+    def is_valid(self):
+        """
+        Returns True if every move of the game was allowed
+        """
+        return self._first_illegal is None
+
+
+def replay_game(squares, line_number=0, keys=None):
+    """
+    Takes a list of square names, two per move, and replays them from the starting position
+    with the same rules as make_move. Stops at the first move that isn't allowed (including any
+    move made after the game is over) and returns a ReplayResult. Moves are checked directly on
+    the Bitboard and made with push, and the game state is only looked at again after a capture,
+    since nothing else can end the game. If keys is a list, the position key of every position
+    reached (starting with the starting position) is added to it.
+    """
+    game = ChessVar()
+    board = game.get_bitboard()
+    if keys is not None:
+        keys.append(game.get_position_key())
+    state = "UNFINISHED"
+    first_illegal = None
+    ply = 0
+    for ply in range(len(squares) // 2):
+        index_from = SQUARE_INDEXES.get(squares[2 * ply])
+        index_to = SQUARE_INDEXES.get(squares[2 * ply + 1])
+        if state != "UNFINISHED" or index_from is None or index_to is None:
+            first_illegal = ply
+            break
+        code = board.piece_at(index_from)
+        if code == EMPTY or code // 6 != ply % 2 or not board.is_valid_move(index_from, index_to):
+            first_illegal = ply
+            break
+        capture = board.piece_at(index_to) != EMPTY
+        game.push(encode_move(index_from, index_to))
+        if keys is not None:
+            keys.append(game.get_position_key())
+        if capture:
+            state = game.get_game_state()
+    else:
+        ply = len(squares) // 2
+        # A square left over without a partner is a move that can't be made.
+        if len(squares) % 2:
+            first_illegal = ply
+    return ReplayResult(line_number, state, first_illegal, ply, game.get_position_key())
+
+
+def replay_lines(lines):
+    """
+    Takes any iterable of lines, one game per line, and yields a ReplayResult for every line
+    that isn't blank. Only one game is held in memory at a time.
+    """
+    line_number = 0
+    for line in lines:
+        line_number += 1
+        squares = line.split()
+        if squares:
+            yield replay_game(squares, line_number)
+
+
+def replay_file(path):
+    """
+    Takes the path of a file with one game per line and yields a ReplayResult for every game,
+    reading the file one line at a time
+    """
+    with open(path) as games:
+        for result in replay_lines(games):
+            yield result
+
+
+def main(argv=None):
+    """
+    Replays the games in the files given on the command line, printing a line for every game
+    with a move that isn't allowed and a summary of the results at the end
+    """
+    paths = sys.argv[1:] if argv is None else argv
+    if not paths:
+        print("usage: python -m chess_game.Replay FILE [FILE ...]")
+        return 2
+
+    totals = {"UNFINISHED": 0, "WHITE_WON": 0, "BLACK_WON": 0}
+    games = 0
+    invalid = 0
+    plies = 0
+    for path in paths:
+        for result in replay_file(path):
+            games += 1
+            plies += result.get_ply_count()
+            totals[result.get_state()] += 1
+            if not result.is_valid():
+                invalid += 1
+                print(path + ":" + str(result.get_line_number()) + ": move " +
+                      str(result.get_first_illegal() + 1) + " is not allowed")
+
+    print(str(games) + " games, " + str(plies) + " moves, " + str(invalid) + " with a move that is not allowed")
+    print("WHITE_WON " + str(totals["WHITE_WON"]) + ", BLACK_WON " + str(totals["BLACK_WON"]) +
+          ", UNFINISHED " + str(totals["UNFINISHED"]))
+    return 1 if invalid else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
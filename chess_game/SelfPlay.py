@@ -0,0 +1,234 @@
+# Author: Cooper Thompson
+# GitHub username: coopthompson
+# Date: October 18th, 2026
+# Description: Plays many ChessVar games between two move-selection policies,
+#              spread across a pool of worker processes, and collects the
+#              results and moves into one report. Every game gets its own seed
+#              worked out from the run's seed, so any run can be reproduced.
+#              Run it with: python -m chess_game.SelfPlay [options]
+
+import argparse
+import json
+import multiprocessing
+import random
+import sys
+
+from .ChessVar import ChessVar
+from .Engine import Engine, PIECE_VALUES
+from .Bitboard import EMPTY, move_names, move_to
+
+
+class RandomPolicy:
+    """
+    Represents a policy that picks one of the legal moves at random
+    """
+    def get_name(self):
+        """
+        Returns the name of the policy
+        """
+        return "random"
+
+    def choose(self, game, rng):
+        """
+        Takes a ChessVar and a random.Random and returns the move to make
+        """
+        return rng.choice(game.legal_moves())
+
+
+class GreedyPolicy:
+    """
+    Represents a policy that always captures when it can. It prefers capturing the opponent's last
+    piece of a type (which wins the game) and otherwise the most valuable piece, and moves at random
+    when there is nothing to capture.
+    """
+    def get_name(self):
+        """
+        Returns the name of the policy
+        """
+        return "greedy"
+
+    def choose(self, game, rng):
+        """
+        Takes a ChessVar and a random.Random and returns the move to make
+        """
+        board = game.get_bitboard()
+        best_moves = []
+        best_value = 0
+        for move in game.legal_moves():
+            captured = board.piece_at(move_to(move))
+            if captured == EMPTY:
+                continue
+            value = PIECE_VALUES[captured % 6]
+            if board.get_count(captured // 6, captured % 6) == 1:
+                value += 100000
+            if value > best_value:
+                best_moves = [move]
+                best_value = value
+            elif value == best_value:
+                best_moves.append(move)
+        if best_moves:
+            return rng.choice(best_moves)
+        return rng.choice(game.legal_moves())
+
+
+class EnginePolicy:
+    """
+    Represents a policy that searches with the Engine to a fixed depth
+    """
+    def __init__(self, depth):
+        """
+        Initialises an EnginePolicy that searches to the given depth
+        """
+        self._depth = depth
+        self._engine = Engine(max_depth=depth)
+
+    def get_name(self):
+        """
+        Returns the name of the policy
+        """
+        return "engine:" + str(self._depth)
+
+    def choose(self, game, rng):
+        """
+        Takes a ChessVar and a random.Random (not used, the search always gives the same move) and
+        returns the move to make
+        """
+        move, score = self._engine.search(game)
+        return move
+
+
+def make_policy(name):
+    """
+    Takes a policy name ("random", "greedy", or "engine:DEPTH") and returns the matching policy.
+    Raises ValueError for any other name.
+    """
+    if name == "random":
+        return RandomPolicy()
+    if name == "greedy":
+        return GreedyPolicy()
+    if name.startswith("engine:") and name[7:].isdigit() and int(name[7:]) > 0:
+        return EnginePolicy(int(name[7:]))
+    raise ValueError("Unknown policy " + repr(name) + ", use random, greedy, or engine:DEPTH")
+
+
+def game_seed(seed, game_index):
+    """
+    Returns the seed for one game of a run. It only depends on the run's seed and the game's
+    index, not on which worker plays the game or in what order.
+    """
+    return random.Random(seed * 1000003 + game_index).getrandbits(32)
+
+
+def play_game(game_index, white, black, seed, max_plies=400):
+    """
+    Plays one game between the policies named white and black and returns a dictionary with the
+    game's index, seed, policies, final state, number of moves, and the moves themselves (as
+    "e2e4" strings). A game still going after max_plies moves is stopped and left UNFINISHED.
+    """
+    rng = random.Random(game_seed(seed, game_index))
+    policies = (make_policy(white), make_policy(black))
+    game = ChessVar()
+    moves = []
+    while len(moves) < max_plies and game.legal_moves():
+        move = policies[game.get_turn_number() % 2].choose(game, rng)
+        game.push(move)
+        moves.append("".join(move_names(move)))
+    return {
+        "game": game_index,
+        "seed": game_seed(seed, game_index),
+        "white": white,
+        "black": black,
+        "state": game.get_game_state(),
+        "plies": len(moves),
+        "moves": moves,
+    }
+
+
+def _play_game_task(task):
+    """
+    Unpacks a task tuple for play_game, so it can be handed to a worker pool
+    """
+    return play_game(*task)
+
+
+def run_self_play(games, white, black, workers=None, seed=0, max_plies=400, alternate=False):
+    """
+    Plays the given number of games between the policies named white and black across a pool of
+    worker processes (one per CPU if workers is None, or in this process if workers is 1) and
+    returns a report dictionary. With alternate set, the policies swap colors every other game.
+    The report holds the number of games, how many ended each way, how many games each policy won
+    with each color (for example {"random": {"White": 40, "Black": 38}}, so the two colors stay
+    apart when both players use the same policy), the average game length, and the record of every
+    game in order.
+    """
+    make_policy(white)
+    make_policy(black)
+    tasks = []
+    for game_index in range(games):
+        if alternate and game_index % 2:
+            tasks.append((game_index, black, white, seed, max_plies))
+        else:
+            tasks.append((game_index, white, black, seed, max_plies))
+
+    if workers == 1:
+        records = [_play_game_task(task) for task in tasks]
+    else:
+        chunk_size = max(1, games // (4 * (workers or multiprocessing.cpu_count())))
+        with multiprocessing.Pool(workers) as pool:
+            records = pool.map(_play_game_task, tasks, chunk_size)
+
+    states = {"WHITE_WON": 0, "BLACK_WON": 0, "UNFINISHED": 0}
+    wins = {white: {"White": 0, "Black": 0}, black: {"White": 0, "Black": 0}}
+    total_plies = 0
+    for record in records:
+        states[record["state"]] += 1
+        total_plies += record["plies"]
+        if record["state"] == "WHITE_WON":
+            wins[record["white"]]["White"] += 1
+        elif record["state"] == "BLACK_WON":
+            wins[record["black"]]["Black"] += 1
+    return {
+        "games": games,
+        "seed": seed,
+        "results": states,
+        "wins": wins,
+        "average_plies": total_plies / games if games else 0,
+        "records": records,
+    }
+
+
+def main(argv=None):
+    """
+    Runs self-play from the command line, printing a summary and optionally writing the full
+    report (including every game's moves) to a JSON file
+    """
+    parser = argparse.ArgumentParser(prog="python -m chess_game.SelfPlay", description="Play ChessVar games "
+                                     "between two policies across several processes.")
+    parser.add_argument("--games", type=int, default=100, help="number of games to play (default 100)")
+    parser.add_argument("--white", default="random", help="policy for White: random, greedy, or engine:DEPTH")
+    parser.add_argument("--black", default="random", help="policy for Black: random, greedy, or engine:DEPTH")
+    parser.add_argument("--workers", type=int, default=None, help="worker processes (default one per CPU)")
+    parser.add_argument("--seed", type=int, default=0, help="seed for the run (default 0)")
+    parser.add_argument("--max-plies", type=int, default=400, help="stop games after this many moves")
+    parser.add_argument("--alternate", action="store_true", help="swap the policies' colors every other game")
+    parser.add_argument("--output", help="write the full report as JSON to this file")
+    args = parser.parse_args(argv)
+
+    try:
+        report = run_self_play(args.games, args.white, args.black, args.workers, args.seed, args.max_plies,
+                               args.alternate)
+    except ValueError as error:
+        parser.error(str(error))
+    print(str(report["games"]) + " games, average " + "%.1f" % report["average_plies"] + " moves")
+    for state in ("WHITE_WON", "BLACK_WON", "UNFINISHED"):
+        print("  " + state + ": " + str(report["results"][state]))
+    for policy, wins in sorted(report["wins"].items()):
+        print("  " + policy + " won " + str(wins["White"]) + " as White and " + str(wins["Black"]) + " as Black")
+    if args.output:
+        with open(args.output, "w") as output:
+            json.dump(report, output)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,332 @@
+# Author: Cooper Thompson
+# GitHub username: coopthompson
+# Date: October 18th, 2026
+# Description: An asyncio server that hosts many ChessVar games at once, each
+#              known by a game id. Clients talk to it over TCP with one JSON
+#              object per line and get one JSON object back per line, for
+#              example {"op": "move", "game": "g1", "from": "e2", "to": "e4"}.
+#              Run it with: python -m chess_game.Server [--host H] [--port P]
+
+import argparse
+import asyncio
+import concurrent.futures
+import json
+import sys
+
+from .ChessVar import ChessVar, GLYPHS
+from .Bitboard import EMPTY, InvalidSquareError, move_names
+from .Position import InvalidPositionError
+from .SessionStore import SessionStore
+
+# The longest game id a client can choose, in bytes of UTF-8. A session store names the file it
+# spills a game to after the id in hexadecimal, and this keeps that name well within the 255 bytes
+# most file systems allow.
+MAX_GAME_ID_BYTES = 100
+
+
+class RequestError(Exception):
+    """
+    Raised while handling a request that can't be carried out. Its message is sent back to the
+    client as the error.
+    """
+
+
+class GameServer:
+    """
+    Represents a server hosting ChessVar games keyed by game id. Every request is handled from
+    start to finish without giving up the event loop (a move is checked in a few microseconds on
+    the Bitboard), so no two requests ever run at the same time. The requests for a game are
+    therefore carried out in the order they arrive, and requests sent on one connection are
+    answered in the order they were sent, without a thread or a lock per game. With a session
+    store, a request may have to write a game to disk or read one back, so requests are handed to
+    a single worker thread instead and the event loop keeps serving other connections meanwhile.
+    There is only the one thread, so requests still run one at a time and in the order they arrive.
+
+    The requests are JSON objects with an "op" and the fields that op needs. Any request may also
+    have an "id", which is copied into the response so clients can match them up. A game id chosen
+    by the client can be at most MAX_GAME_ID_BYTES bytes long.
+
+        {"op": "new", "game": ID, "position": FEN}   start a game (both fields are optional)
+        {"op": "move", "game": ID, "from": SQ, "to": SQ}
+        {"op": "state", "game": ID}                  the game state and turn number
+        {"op": "board", "game": ID}                  the position as FEN and as a grid of pieces
+        {"op": "legal", "game": ID, "square": SQ}    the legal moves (from one square if given)
+        {"op": "close", "game": ID}                  forget a game
+        {"op": "count"}                              the number of games hosted
+        {"op": "metrics"}                            the session store's counters, if there is one
+
+    Responses have "ok" set to true and the fields asked for, or "ok" set to false and an "error".
+    """
+    def __init__(self, max_games=None, store=None):
+        """
+        Initialises a GameServer. max_games, if given, is the most games it will host at once. The
+        games are kept in a dictionary, or in store if one is given (a SessionStore, which keeps
+        only some of them in memory).
+        """
+        self._games = {} if store is None else store
+        self._store = store
+        self._executor = None
+        if store is not None:
+            self._executor = concurrent.futures.ThreadPoolExecutor(max_workers=1, thread_name_prefix="session-store")
+        self._max_games = max_games
+        self._next_id = 1
+        self._handlers = {
+            "new": self._new_game,
+            "move": self._make_move,
+            "state": self._get_state,
+            "board": self._get_board,
+            "legal": self._get_legal_moves,
+            "close": self._close_game,
+            "count": self._count_games,
+            "metrics": self._get_metrics,
+        }
+
+    def get_game(self, game_id):
+        """
+        Returns the ChessVar for a game id, or None if there is no such game
+        """
+        return self._games.get(game_id)
+
+    def handle_request(self, request):
+        """
+        Takes a request (a dictionary decoded from JSON) and returns the response dictionary. This
+        is all the network code calls, so it can also be used without a socket.
+        """
+        response = {}
+        if isinstance(request, dict) and "id" in request:
+            response["id"] = request["id"]
+        try:
+            if not isinstance(request, dict):
+                raise RequestError("A request must be a JSON object")
+            op = request.get("op")
+            handler = self._handlers.get(op) if isinstance(op, str) else None
+            if handler is None:
+                raise RequestError("Unknown op " + json.dumps(op))
+            result = handler(request)
+        except (RequestError, InvalidSquareError, InvalidPositionError) as error:
+            response["ok"] = False
+            response["error"] = str(error)
+            return response
+        response["ok"] = True
+        response.update(result)
+        return response
+
+    def handle_line(self, line):
+        """
+        Takes one line sent by a client and returns the line (ending in a newline) to send back
+        """
+        try:
+            request = json.loads(line)
+        except ValueError:
+            response = {"ok": False, "error": "A request must be a line of JSON"}
+        else:
+            response = self.handle_request(request)
+        return json.dumps(response) + "\n"
+
+    async def handle_connection(self, reader, writer):
+        """
+        Reads requests from one client until it disconnects, answering each one in turn
+        """
+        try:
+            while True:
+                try:
+                    line = await reader.readline()
+                except ValueError:
+                    # The line was longer than the reader's limit.
+                    writer.write(b'{"ok": false, "error": "The request is too long"}\n')
+                    break
+                if not line:
+                    break
+                if line.strip():
+                    try:
+                        if self._executor is None:
+                            response = self.handle_line(line)
+                        else:
+                            response = await asyncio.get_running_loop().run_in_executor(self._executor,
+                                                                                        self.handle_line, line)
+                    except Exception as error:
+                        # Anything else that goes wrong (JSON nested too deeply to decode, or the
+                        # session store failing to read or write a file) only fails this request.
+                        response = json.dumps({"ok": False, "error": "The request failed: " +
+                                               type(error).__name__ + ": " + str(error)}) + "\n"
+                    writer.write(response.encode())
+                    await writer.drain()
+        except ConnectionError:
+            pass
+        finally:
+            writer.close()
+
+    async def close(self):
+        """
+        Spills every game in the session store (if there is one) to disk, on the worker thread, and
+        then stops the thread
+        """
+        if self._executor is not None:
+            await asyncio.get_running_loop().run_in_executor(self._executor, self._store.spill_all)
+            self._executor.shutdown()
+            self._executor = None
+
+    async def serve(self, host="127.0.0.1", port=0):
+        """
+        Starts listening on the given host and port (0 picks a free port) and returns the
+        asyncio server. The port in use can be read from its sockets.
+        """
+        return await asyncio.start_server(self.handle_connection, host, port)
+
+    def _find_game(self, request):
+        """
+        Returns the game named in a request, raising RequestError if there isn't one
+        """
+        game_id = request.get("game")
+        game = self._games.get(game_id) if isinstance(game_id, str) else None
+        if game is None:
+            raise RequestError("No game " + json.dumps(request.get("game")))
+        return game
+
+    def _new_game(self, request):
+        """
+        Starts a new game, from the starting position or from the FEN in "position", under the id
+        in "game" or a new one
+        """
+        if self._max_games is not None and len(self._games) >= self._max_games:
+            raise RequestError("The server is hosting as many games as it can")
+        game_id = request.get("game")
+        if game_id is None:
+            game_id = "g" + str(self._next_id)
+            while game_id in self._games:
+                self._next_id += 1
+                game_id = "g" + str(self._next_id)
+            self._next_id += 1
+        elif not isinstance(game_id, str):
+            raise RequestError("A game id must be a string")
+        elif game_id in self._games:
+            raise RequestError("There is already a game " + json.dumps(game_id))
+        else:
+            try:
+                id_bytes = len(game_id.encode())
+            except UnicodeEncodeError:
+                raise RequestError("A game id must be valid Unicode")
+            if id_bytes > MAX_GAME_ID_BYTES:
+                raise RequestError("A game id can be at most " + str(MAX_GAME_ID_BYTES) + " bytes long")
+        position = request.get("position")
+        if position is None:
+            game = ChessVar()
+        elif isinstance(position, str):
+            game = ChessVar.from_position(position)
+        else:
+            raise RequestError("A position must be a FEN string")
+        self._games[game_id] = game
+        return {"game": game_id, "fen": game.to_fen()}
+
+    def _make_move(self, request):
+        """
+        Makes a move in a game and reports whether it was allowed and the game state after it
+        """
+        game = self._find_game(request)
+        square_from = request.get("from")
+        square_to = request.get("to")
+        if isinstance(square_from, (str, int)) and isinstance(square_to, (str, int)):
+            moved = game.make_move(square_from, square_to)
+        else:
+            raise RequestError("A move needs a square in \"from\" and \"to\"")
+        return {"moved": moved, "state": game.get_game_state(), "turn": game.get_turn_number()}
+
+    def _get_state(self, request):
+        """
+        Reports the game state and turn number of a game
+        """
+        game = self._find_game(request)
+        return {"state": game.get_game_state(), "turn": game.get_turn_number()}
+
+    def _get_board(self, request):
+        """
+        Reports the position of a game as FEN and as rows of pieces (rank 8 first) written the way
+        print_board writes them, with "E" for an empty square
+        """
+        game = self._find_game(request)
+        board = game.get_bitboard()
+        rows = []
+        for row in range(7, -1, -1):
+            codes = [board.piece_at(square) for square in range(row * 8, row * 8 + 8)]
+            rows.append(["E" if code == EMPTY else GLYPHS[code] for code in codes])
+        return {"fen": game.to_fen(), "board": rows}
+
+    def _get_legal_moves(self, request):
+        """
+        Reports every legal move in a game, or only those from the square in "square", as
+        "e2e4" strings
+        """
+        game = self._find_game(request)
+        if request.get("square") is None:
+            moves = game.legal_moves()
+        else:
+            moves = game.legal_moves_from(request["square"])
+        return {"moves": ["".join(move_names(move)) for move in moves]}
+
+    def _close_game(self, request):
+        """
+        Forgets a game
+        """
+        self._find_game(request)
+        del self._games[request["game"]]
+        return {}
+
+    def _count_games(self, request):
+        """
+        Reports the number of games being hosted
+        """
+        return {"games": len(self._games)}
+
+    def _get_metrics(self, request):
+        """
+        Reports the session store's counters (see SessionStore.get_metrics)
+        """
+        if self._store is None:
+            raise RequestError("The server has no session store")
+        return {"metrics": self._store.get_metrics()}
+
+
+async def run_server(host, port, max_games=None, store=None):
+    """
+    Runs a GameServer on the given host and port until the task is cancelled. If a session store
+    is given, every game in memory is spilled to disk when the server stops.
+    """
+    game_server = GameServer(max_games, store)
+    server = await game_server.serve(host, port)
+    for server_socket in server.sockets:
+        print("Serving ChessVar games on " + "%s:%d" % server_socket.getsockname()[:2])
+    try:
+        async with server:
+            await server.serve_forever()
+    finally:
+        await game_server.close()
+
+
+def main(argv=None):
+    """
+    Runs the server from the command line
+    """
+    parser = argparse.ArgumentParser(prog="python -m chess_game.Server", description="Host ChessVar games over "
+                                     "TCP with one JSON request per line.")
+    parser.add_argument("--host", default="127.0.0.1", help="address to listen on (default 127.0.0.1)")
+    parser.add_argument("--port", type=int, default=8765, help="port to listen on (default 8765)")
+    parser.add_argument("--max-games", type=int, default=None, help="most games to host at once")
+    parser.add_argument("--spill-dir", help="keep games in a session store that spills them to this directory")
+    parser.add_argument("--max-resident", type=int, default=None, help="most games the store keeps in memory")
+    parser.add_argument("--max-resident-bytes", type=int, default=None,
+                        help="most estimated bytes of games the store keeps in memory")
+    args = parser.parse_args(argv)
+    store = None
+    if args.spill_dir:
+        store = SessionStore(args.spill_dir, args.max_resident, args.max_resident_bytes)
+    elif args.max_resident is not None or args.max_resident_bytes is not None:
+        parser.error("--max-resident and --max-resident-bytes need --spill-dir")
+    try:
+        asyncio.run(run_server(args.host, args.port, args.max_games, store))
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
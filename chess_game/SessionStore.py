@@ -0,0 +1,248 @@
+# Author: Cooper Thompson
+# GitHub username: coopthompson
+# Date: October 18th, 2026
+# Description: A store for ChessVar games keyed by game id that keeps only a
+#              limited number of them in memory. When there are too many (or
+#              they take up too much memory) the game that was used longest ago
+#              is written to a small file on disk and dropped from memory, and
+#              it is read back in the next time it is asked for.
+
+import collections
+import os
+import struct
+
+from .ChessVar import ChessVar
+from .Position import POSITION_SIZE, unpack_position
+
+# A spilled game's file holds the position in the 32 byte binary form of the Position module
+# followed by the turn number as a 4 byte unsigned integer.
+TURN_FORMAT = "<I"
+SNAPSHOT_EXTENSION = ".game"
+
+
+def estimate_game_bytes(game):
+    """
+    Returns roughly how many bytes of memory a ChessVar takes up (see ChessVar.get_memory_size)
+    """
+    return game.get_memory_size()
+
+
+class SessionStore:
+    """
+    Represents a store of ChessVar games keyed by game id (a string). It can be used like a
+    dictionary, and is used that way by the GameServer. Games are kept in memory in the order they
+    were last used. Once there are more than max_games of them, or they are estimated to take more
+    than max_bytes, the least recently used games are written to the directory and dropped from
+    memory (spilled) until the store is back within its limits. A spilled game is read back the
+    next time it is asked for, so code using the store never sees the difference, as long as it
+    gets the game from the store every time instead of holding on to it.
+
+    A spilled game keeps its position and turn number but not the moves that led to it, so pop
+    can't take back moves made before it was spilled. Games left in the directory by an earlier
+    store are picked up as spilled games.
+    """
+    def __init__(self, directory, max_games=None, max_bytes=None):
+        """
+        Initialises a SessionStore that spills games to the given directory (which is created if it
+        doesn't exist). max_games and max_bytes are the most games and the most estimated bytes to
+        keep in memory. Either or both can be None for no limit.
+        """
+        self._directory = directory
+        self._max_games = max_games
+        self._max_bytes = max_bytes
+        self._resident = collections.OrderedDict()
+        self._sizes = {}
+        self._resident_bytes = 0
+        self._hits = 0
+        self._misses = 0
+        self._spills = 0
+        self._failed_spills = 0
+        os.makedirs(directory, exist_ok=True)
+        self._spilled = set()
+        for name in os.listdir(directory):
+            if name.endswith(SNAPSHOT_EXTENSION):
+                try:
+                    self._spilled.add(bytes.fromhex(name[:-len(SNAPSHOT_EXTENSION)]).decode())
+                except ValueError:
+                    continue
+
+    def get(self, game_id, default=None):
+        """
+        Returns the game with the given id, reading it back from disk if it was spilled, or default
+        if there is no such game. The game becomes the most recently used one.
+        """
+        game = self._resident.get(game_id)
+        if game is not None:
+            self._hits += 1
+            self._resident.move_to_end(game_id)
+        elif game_id in self._spilled:
+            self._misses += 1
+            game = self._load(game_id)
+            self._resident[game_id] = game
+            self._sizes[game_id] = 0
+        else:
+            return default
+        # The game may have changed since it was last used, so its size is estimated again.
+        self._update_size(game_id)
+        return game
+
+    def make_move(self, game_id, square_from, square_to):
+        """
+        Makes a move in the game with the given id (see ChessVar.make_move) and returns whether it
+        was allowed. Raises KeyError if there is no such game.
+        """
+        game = self.get(game_id)
+        if game is None:
+            raise KeyError(game_id)
+        allowed = game.make_move(square_from, square_to)
+        self._update_size(game_id)
+        return allowed
+
+    def __getitem__(self, game_id):
+        """
+        Returns the game with the given id like get, but raises KeyError if there is no such game
+        """
+        game = self.get(game_id)
+        if game is None:
+            raise KeyError(game_id)
+        return game
+
+    def __setitem__(self, game_id, game):
+        """
+        Adds a game to the store under the given id, replacing any game already there
+        """
+        if game_id in self:
+            del self[game_id]
+        self._resident[game_id] = game
+        self._sizes[game_id] = 0
+        self._update_size(game_id)
+
+    def __delitem__(self, game_id):
+        """
+        Removes the game with the given id, from memory or from disk. Raises KeyError if there is no
+        such game.
+        """
+        if game_id in self._resident:
+            del self._resident[game_id]
+            self._resident_bytes -= self._sizes.pop(game_id)
+        elif game_id in self._spilled:
+            self._spilled.remove(game_id)
+            os.remove(self._snapshot_path(game_id))
+        else:
+            raise KeyError(game_id)
+
+    def __contains__(self, game_id):
+        """
+        Returns True if there is a game with the given id, in memory or on disk
+        """
+        return game_id in self._resident or game_id in self._spilled
+
+    def __len__(self):
+        """
+        Returns the number of games in the store, in memory or on disk
+        """
+        return len(self._resident) + len(self._spilled)
+
+    def spill_all(self):
+        """
+        Writes every game in memory to disk and drops them from memory, for example before the
+        program exits
+        """
+        while self._resident:
+            self._spill(next(iter(self._resident)))
+
+    def get_metrics(self):
+        """
+        Returns a dictionary of the store's counters: hits (games found in memory), misses (games
+        read back from disk), spills (games written to disk), failed_spills (games that couldn't be
+        written and were kept in memory), and the number of games and estimated bytes in memory and
+        the number of games on disk right now
+        """
+        return {
+            "hits": self._hits,
+            "misses": self._misses,
+            "spills": self._spills,
+            "failed_spills": self._failed_spills,
+            "resident_games": len(self._resident),
+            "resident_bytes": self._resident_bytes,
+            "spilled_games": len(self._spilled),
+        }
+
+    def _update_size(self, game_id):
+        """
+        Estimates the size of a game in memory again and spills other games if that puts the store
+        over its limits
+        """
+        size = estimate_game_bytes(self._resident[game_id])
+        self._resident_bytes += size - self._sizes[game_id]
+        self._sizes[game_id] = size
+        self._evict(game_id)
+
+    def _over_limit(self):
+        """
+        Returns True if the games in memory are over either limit
+        """
+        if self._max_games is not None and len(self._resident) > self._max_games:
+            return True
+        return self._max_bytes is not None and self._resident_bytes > self._max_bytes
+
+    def _evict(self, keep_id):
+        """
+        Spills the least recently used games until the store is within its limits, never spilling
+        the game with the id keep_id (the one just asked for). A game that can't be written to disk
+        is kept in memory and counted as a failed spill, so the store can stay over its limits until
+        spilling works again, but no game is ever lost.
+        """
+        for game_id in list(self._resident):
+            if not self._over_limit():
+                break
+            if game_id == keep_id:
+                continue
+            try:
+                self._spill(game_id)
+            except OSError:
+                self._failed_spills += 1
+
+    def _snapshot_path(self, game_id):
+        """
+        Returns the path of the file a game is spilled to. The id is written in hexadecimal so any
+        id makes a safe file name.
+        """
+        return os.path.join(self._directory, game_id.encode().hex() + SNAPSHOT_EXTENSION)
+
+    def _spill(self, game_id):
+        """
+        Writes a game in memory to disk and then drops it from memory. If the file can't be written
+        the OSError is raised and the game stays in memory.
+        """
+        game = self._resident[game_id]
+        path = self._snapshot_path(game_id)
+        # Written to a file of its own first and then moved into place, so a crash never leaves a
+        # half written game behind.
+        try:
+            with open(path + ".tmp", "wb") as snapshot:
+                snapshot.write(game.to_bytes() + struct.pack(TURN_FORMAT, game.get_turn_number()))
+            os.replace(path + ".tmp", path)
+        except OSError:
+            try:
+                os.remove(path + ".tmp")
+            except OSError:
+                pass
+            raise
+        del self._resident[game_id]
+        self._resident_bytes -= self._sizes.pop(game_id)
+        self._spilled.add(game_id)
+        self._spills += 1
+
+    def _load(self, game_id):
+        """
+        Reads a spilled game back from disk, removing its file, and returns it
+        """
+        path = self._snapshot_path(game_id)
+        with open(path, "rb") as snapshot:
+            data = snapshot.read()
+        bitboards, side_to_move = unpack_position(data[:POSITION_SIZE])
+        turn_number, = struct.unpack(TURN_FORMAT, data[POSITION_SIZE:])
+        os.remove(path)
+        self._spilled.remove(game_id)
+        return ChessVar.from_bitboards(bitboards, turn_number)
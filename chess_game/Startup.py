@@ -0,0 +1,111 @@
+# Author: Cooper Thompson
+# GitHub username: coopthompson
+# Date: October 18th, 2026
+# Description: Measures how long a new process takes to import ChessVar and to
+#              make its first move. Every run starts a fresh Python process so
+#              nothing is left over from the run before. Runs are made with the
+#              table cache already written, with an empty cache, and with the
+#              cache turned off.
+#              Run it with: python -m chess_game.Startup [--runs N]
+
+import argparse
+import json
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+
+from .TableCache import CACHE_VARIABLE
+
+# The code each new process runs. It reports its own timings as JSON on its last line.
+CHILD_CODE = """
+import json, time
+start = time.perf_counter()
+from chess_game.ChessVar import ChessVar
+imported = time.perf_counter()
+game = ChessVar()
+game.make_move("e2", "e4")
+moved = time.perf_counter()
+print(json.dumps({"import": imported - start, "first_move": moved - imported}))
+"""
+
+MODES = ("cached", "cold", "off")
+
+
+def run_once(cache_directory):
+    """
+    Starts a new Python process that imports ChessVar and makes one move, with the table cache in
+    cache_directory ("" turns the cache off). Returns a dictionary of the seconds the whole process
+    took ("process"), the import took ("import"), and the first move took ("first_move").
+    """
+    environment = dict(os.environ)
+    environment[CACHE_VARIABLE] = cache_directory
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    start = time.perf_counter()
+    output = subprocess.run([sys.executable, "-c", CHILD_CODE], cwd=root, env=environment, check=True,
+                            stdout=subprocess.PIPE, universal_newlines=True).stdout
+    timings = json.loads(output.splitlines()[-1])
+    timings["process"] = time.perf_counter() - start
+    return timings
+
+
+def measure(mode, runs):
+    """
+    Makes the given number of runs in one of the MODES and returns the list of their timings.
+    "cached" runs share a cache that is written before the first of them, "cold" runs each start
+    with an empty cache, and "off" runs don't use the cache at all.
+    """
+    directory = tempfile.mkdtemp(prefix="chess_game_startup_")
+    try:
+        if mode == "cached":
+            run_once(directory)
+        results = []
+        for run in range(runs):
+            if mode == "cold":
+                shutil.rmtree(directory)
+                os.mkdir(directory)
+            results.append(run_once("" if mode == "off" else directory))
+        return results
+    finally:
+        shutil.rmtree(directory, ignore_errors=True)
+
+
+def median(values):
+    """
+    Returns the median of a list of numbers
+    """
+    ordered = sorted(values)
+    middle = len(ordered) // 2
+    if len(ordered) % 2:
+        return ordered[middle]
+    return (ordered[middle - 1] + ordered[middle]) / 2
+
+
+def main(argv=None):
+    """
+    Runs the startup benchmark from the command line and prints the median timings of every mode
+    in milliseconds
+    """
+    parser = argparse.ArgumentParser(prog="python -m chess_game.Startup", description="Measure how long a new "
+                                     "process takes to import ChessVar and make its first move.")
+    parser.add_argument("--runs", type=int, default=10, help="processes to start for each mode (default 10)")
+    parser.add_argument("--mode", choices=MODES, action="append", help="only measure this mode (can be repeated)")
+    args = parser.parse_args(argv)
+    if args.runs < 1:
+        parser.error("--runs must be at least 1")
+
+    if sys.flags.dont_write_bytecode:
+        print("PYTHONDONTWRITEBYTECODE is set, so every run also compiles the modules from scratch")
+    print("mode     process  import  first move  (median ms of " + str(args.runs) + " runs)")
+    for mode in args.mode or MODES:
+        results = measure(mode, args.runs)
+        print("%-7s %8.1f %7.1f %11.2f" % (mode, 1000 * median([result["process"] for result in results]),
+                                            1000 * median([result["import"] for result in results]),
+                                            1000 * median([result["first_move"] for result in results])))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,84 @@
+# Author: Cooper Thompson
+# GitHub username: coopthompson
+# Date: October 18th, 2026
+# Description: Keeps precomputed tables in a cache on disk so that they only
+#              have to be worked out the first time the program runs. Every
+#              cache file is stamped with a version key and worked out again
+#              when the key doesn't match, so a stale file is never used.
+#
+# The tables are needed as soon as the MoveTables and Bitboard modules are imported, since the
+# move checks read them as plain module constants (looking them up through a function on every
+# move would slow every move down). So importing chess_game is only fast when the cache can be
+# read. When the cache is turned off, or the cache file is missing or stale, the tables are
+# worked out during the import, which takes about 20 milliseconds instead of about 3. The first
+# import also writes the cache files into the cache directory. When that directory can't be
+# written to (a read-only home directory, for example), nothing is written and every import in a
+# new process works the tables out again, so point CHESS_GAME_CACHE at a directory that can be
+# written to, or fill the cache once while one can be.
+
+import marshal
+import os
+import sys
+
+# Set this environment variable to keep the cache somewhere else, or to an empty string to turn
+# the cache off.
+CACHE_VARIABLE = "CHESS_GAME_CACHE"
+
+
+def cache_directory():
+    """
+    Returns the directory the cache files are kept in, or None if the cache is turned off. This
+    is the directory in CHESS_GAME_CACHE if it is set, and otherwise chess_game in the user's
+    cache directory.
+    """
+    directory = os.environ.get(CACHE_VARIABLE)
+    if directory is not None:
+        return directory or None
+    return os.path.join(os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache"),
+                        "chess_game")
+
+
+def version_key(name, version):
+    """
+    Returns the key a cache file is stamped with. It changes with the tables' own version number
+    and with the Python version, since marshal files can't be shared between Python versions.
+    """
+    return name + " " + str(version) + " python " + "%d.%d" % sys.version_info[:2] + " marshal " + \
+        str(marshal.version)
+
+
+def load_tables(name, version, build):
+    """
+    Returns the tables kept in the cache file for name, as long as the file was written for the
+    same version. Otherwise calls build (which takes no parameters and returns the tables as a
+    dictionary of tuples, numbers, and strings), writes what it returns to the cache, and returns
+    it. A cache that can't be read or written is ignored, so this always returns the tables, but
+    then they are worked out again on every call (see the note at the top of this module).
+    """
+    directory = cache_directory()
+    if directory is None:
+        return build()
+    key = version_key(name, version)
+    path = os.path.join(directory, name + ".marshal")
+    try:
+        # Reading the whole file and then unpacking it is much faster than letting marshal read
+        # from the file, which it does a few bytes at a time.
+        with open(path, "rb") as cache:
+            stored_key, tables = marshal.loads(cache.read())
+        if stored_key == key:
+            return tables
+    except (OSError, EOFError, ValueError, TypeError):
+        pass
+
+    tables = build()
+    try:
+        os.makedirs(directory, exist_ok=True)
+        # Write to a file of our own first and then move it into place, so other processes never
+        # see a cache that is only half written.
+        temporary = path + "." + str(os.getpid())
+        with open(temporary, "wb") as cache:
+            marshal.dump((key, tables), cache)
+        os.replace(temporary, path)
+    except OSError:
+        pass
+    return tables
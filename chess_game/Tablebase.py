@@ -0,0 +1,460 @@
+# Author: Cooper Thompson
+# GitHub username: coopthompson
+# Date: October 18th, 2026
+# Description: Builds and reads endgame tablebases for ChessVar: for every
+#              position with a small set of pieces, whether the player to move
+#              wins, loses, or can't be forced either way, and in how many moves.
+#              They are worked out backwards from the won positions (retrograde
+#              analysis) and kept in files that are memory-mapped when read.
+#              Run it with: python -m chess_game.Tablebase build DIRECTORY --pieces 3
+#
+# In a real game both players always keep at least one piece of every type until the game ends,
+# so a position with only a few pieces is already over by get_game_state's count of piece types.
+# The tablebases therefore play out what that count decides in a real game: a player loses as
+# soon as they lose the last piece of any type they have. With all six types on both sides that
+# is exactly get_game_state's rule, and with fewer pieces it asks who wins the race to capture one
+# of the other side's last pieces of a type. Moves follow the same rules as make_move.
+
+import argparse
+import itertools
+import mmap
+import multiprocessing
+import os
+import sys
+from array import array
+
+from .Bitboard import Bitboard, EMPTY
+from .ChessVar import ChessVar
+from .MoveTables import bit_squares
+from .Position import FEN_LETTERS, parse_fen
+
+# Every table file starts with a 16 byte header: the MAGIC bytes, the format version, the number
+# of pieces, and the piece code of every piece (padded with zeros). After that comes one byte per
+# position, indexed as described in position_index.
+MAGIC = b"CVTB"
+FORMAT_VERSION = 1
+HEADER_SIZE = 16
+MAX_PIECES = HEADER_SIZE - len(MAGIC) - 2
+TABLE_EXTENSION = ".cvtb"
+
+# What the byte for a position means. 0 is a draw (neither player can force a win, or the player
+# to move can't move). 1 to 254 is the number of moves until the game is won, counting both
+# players' moves: odd if the player to move wins and even if they lose. 255 marks an index that
+# isn't a position (two pieces on one square, or identical pieces listed out of order).
+DRAW = 0
+INVALID = 255
+MAX_DISTANCE = 254
+
+
+def signature_name(signature):
+    """
+    Takes a signature (a sorted tuple of the piece codes of every piece on the board, one entry
+    per piece) and returns its name, White's pieces then "v" then Black's, for example "RKvK"
+    """
+    white = "".join(FEN_LETTERS[code] for code in signature if code < 6)
+    black = "".join(FEN_LETTERS[code - 6] for code in signature if code >= 6)
+    return white + "v" + black
+
+
+def parse_signature(name):
+    """
+    Takes a signature name like "RKvK" (in any order and case) and returns the signature. Raises
+    ValueError if it isn't one.
+    """
+    sides = name.upper().split("V")
+    if len(sides) != 2 or not sides[0] or not sides[1]:
+        raise ValueError(repr(name) + " is not a signature, name White's and Black's pieces like RKvK")
+    codes = []
+    for player, letters in enumerate(sides):
+        for letter in letters:
+            if letter not in FEN_LETTERS:
+                raise ValueError(repr(letter) + " is not a piece, use the letters " + FEN_LETTERS)
+            codes.append(player * 6 + FEN_LETTERS.index(letter))
+    return tuple(sorted(codes))
+
+
+def board_signature(board):
+    """
+    Returns the signature of the pieces on a Bitboard
+    """
+    return tuple(code for code in range(12) for count in range(board.get_count(code // 6, code % 6)))
+
+
+def signatures(piece_count):
+    """
+    Returns every signature with the given number of pieces in which both players have a piece
+    """
+    return [signature for signature in itertools.combinations_with_replacement(range(12), piece_count)
+            if signature[0] < 6 <= signature[-1]]
+
+
+def position_index(signature, squares, player):
+    """
+    Takes a signature, the square of each of its pieces (in the same order), and the player to move
+    and returns the index of the position in the signature's table. Each piece's square is a digit
+    in base 64, the first piece's the lowest, with the player to move above them all. Identical
+    pieces are listed in order of their squares so every position has just one index.
+    """
+    squares = list(squares)
+    start = 0
+    while start < len(signature):
+        end = start + 1
+        while end < len(signature) and signature[end] == signature[start]:
+            end += 1
+        if end - start > 1:
+            squares[start:end] = sorted(squares[start:end])
+        start = end
+    index = player
+    for square in reversed(squares):
+        index = index * 64 + square
+    return index
+
+
+def table_path(directory, signature):
+    """
+    Returns the path of the table file for a signature
+    """
+    return os.path.join(directory, signature_name(signature) + TABLE_EXTENSION)
+
+
+def table_header(signature):
+    """
+    Returns the header a signature's table file starts with
+    """
+    return MAGIC + bytes([FORMAT_VERSION, len(signature)]) + bytes(signature).ljust(MAX_PIECES, b"\0")
+
+
+def table_complete(directory, signature):
+    """
+    Returns True if the table for a signature has already been built in the directory
+    """
+    path = table_path(directory, signature)
+    try:
+        if os.path.getsize(path) != HEADER_SIZE + 2 * 64 ** len(signature):
+            return False
+        with open(path, "rb") as table:
+            return table.read(HEADER_SIZE) == table_header(signature)
+    except OSError:
+        return False
+
+
+class Tablebase:
+    """
+    Represents the tables in a directory, read through memory maps so that only the parts that are
+    looked at are read from disk and processes reading the same tables share them. Tables are
+    opened the first time they are needed.
+    """
+    def __init__(self, directory):
+        """
+        Initialises a Tablebase reading the tables in the given directory
+        """
+        self._directory = directory
+        self._tables = {}
+
+    def close(self):
+        """
+        Closes every table that was opened
+        """
+        for table in self._tables.values():
+            if table is not None:
+                table.close()
+        self._tables = {}
+
+    def get_table(self, signature):
+        """
+        Returns the memory map of a signature's table (with the header at the start), or None if
+        there is no complete table for it
+        """
+        if signature not in self._tables:
+            table = None
+            if table_complete(self._directory, signature):
+                with open(table_path(self._directory, signature), "rb") as table_file:
+                    table = mmap.mmap(table_file.fileno(), 0, access=mmap.ACCESS_READ)
+            self._tables[signature] = table
+        return self._tables[signature]
+
+    def get_value(self, board, player):
+        """
+        Returns the byte stored for the position on a Bitboard with the given player to move, or
+        None if it isn't covered by a table
+        """
+        signature = board_signature(board)
+        table = self.get_table(signature)
+        if table is None:
+            return None
+        squares = [square for code in sorted(set(signature))
+                   for square in bit_squares(board.get_pieces(code // 6, code % 6))]
+        return table[HEADER_SIZE + position_index(signature, squares, player)]
+
+    def probe(self, game):
+        """
+        Takes a ChessVar and returns a tuple of the result for the player to move ("WIN", "LOSS",
+        or "DRAW") and the number of moves until the game is won (0 for a draw), or None if the
+        position isn't covered by a table
+        """
+        value = self.get_value(game.get_bitboard(), game.get_turn_number() % 2)
+        if value is None:
+            return None
+        if value == DRAW:
+            return "DRAW", 0
+        return ("WIN" if value % 2 else "LOSS"), value
+
+    def best_move(self, game):
+        """
+        Takes a ChessVar and returns the move (as an integer, see encode_move in the Bitboard
+        module) that wins fastest, or draws, or loses slowest, or None if the position isn't
+        covered or the player to move can't move
+        """
+        board = game.get_bitboard().copy()
+        player = game.get_turn_number() % 2
+        if self.get_value(board, player) is None:
+            return None
+        best_move = None
+        best_rank = None
+        for move in board.generate_moves(player):
+            square_from = move & 63
+            square_to = move >> 6
+            captured = board.piece_at(square_to)
+            if captured != EMPTY and board.get_count(captured // 6, captured % 6) == 1:
+                return move
+            board.move_piece(square_from, square_to)
+            value = self.get_value(board, 1 - player)
+            board.move_piece(square_to, square_from)
+            if captured != EMPTY:
+                board.put_piece(captured, square_to)
+            if value is None:
+                continue
+            # Rank the moves so that the smallest is best: wins for us (the opponent loses in an
+            # even number of moves) fastest first, then draws, then losses slowest first.
+            if value == DRAW:
+                rank = 0
+            elif value % 2 == 0:
+                rank = value - 1000
+            else:
+                rank = 1000 - value
+            if best_rank is None or rank < best_rank:
+                best_move = move
+                best_rank = rank
+        return best_move
+
+
+def build_table(directory, signature):
+    """
+    Builds the table for a signature in the directory (created if it doesn't exist) and returns its
+    path. The tables for every signature reachable by a capture (one piece fewer) have to be built
+    already. Does nothing if the table is already complete. The table is written to a temporary file
+    that is only moved into place once it is finished, so an interrupted build is simply started
+    again.
+    """
+    path = table_path(directory, signature)
+    if table_complete(directory, signature):
+        return path
+    piece_count = len(signature)
+    if piece_count > MAX_PIECES:
+        raise ValueError("A table can have at most " + str(MAX_PIECES) + " pieces")
+    positions = 64 ** piece_count
+    size = 2 * positions
+    tablebase = Tablebase(directory)
+
+    values = bytearray(size)
+    # For every position: the number of its moves that stay in this table and haven't been found
+    # to win for the opponent yet, whether it has a move that can't lose (so it can never be lost),
+    # and the longest loss among the moves found to win for the opponent.
+    remaining = array("H", [0]) * size
+    escapes = bytearray(size)
+    longest_loss = bytearray(size)
+    # The positions each position can move to in this table, stored one after another with
+    # child_starts[index] giving where a position's list starts.
+    children = array("I")
+    child_starts = array("I", [0]) * (size + 1)
+    buckets = {}
+
+    board = Bitboard()
+    board.set_pieces([0] * 12)
+    placed = []
+
+    for index in range(size):
+        child_starts[index] = len(children)
+        player, rest = divmod(index, positions)
+        squares = []
+        for slot in range(piece_count):
+            rest, square = divmod(rest, 64)
+            squares.append(square)
+        if len(set(squares)) != piece_count or any(
+                signature[slot] == signature[slot - 1] and squares[slot] < squares[slot - 1]
+                for slot in range(1, piece_count)):
+            values[index] = INVALID
+            continue
+        for square in placed:
+            board.remove_piece(square)
+        for slot in range(piece_count):
+            board.put_piece(signature[slot], squares[slot])
+        placed = squares
+
+        fastest_win = 0
+        for move in board.generate_moves(player):
+            square_from = move & 63
+            square_to = move >> 6
+            slot = squares.index(square_from)
+            captured = board.piece_at(square_to)
+            if captured == EMPTY:
+                child_squares = squares[:]
+                child_squares[slot] = square_to
+                children.append(position_index(signature, child_squares, 1 - player))
+                remaining[index] += 1
+                continue
+            if board.get_count(captured // 6, captured % 6) == 1:
+                # Capturing the opponent's last piece of a type wins at once.
+                fastest_win = 1
+                continue
+            board.move_piece(square_from, square_to)
+            value = tablebase.get_value(board, 1 - player)
+            board.move_piece(square_to, square_from)
+            board.put_piece(captured, square_to)
+            if value is None:
+                raise RuntimeError("The table for " + signature_name(board_signature(board)) + " is needed first")
+            if value == DRAW:
+                escapes[index] = 1
+            elif value % 2:
+                longest_loss[index] = max(longest_loss[index], value + 1)
+            elif fastest_win == 0 or value + 1 < fastest_win:
+                fastest_win = value + 1
+
+        if fastest_win:
+            escapes[index] = 1
+            buckets.setdefault(fastest_win, []).append(index)
+        elif remaining[index] == 0 and not escapes[index] and longest_loss[index]:
+            buckets.setdefault(longest_loss[index], []).append(index)
+    child_starts[size] = len(children)
+    tablebase.close()
+
+    # Turn the lists of children into lists of parents: the positions that can move to each one.
+    parent_starts = array("I", [0]) * (size + 1)
+    for child in children:
+        parent_starts[child + 1] += 1
+    for index in range(size):
+        parent_starts[index + 1] += parent_starts[index]
+    parents = array("I", [0]) * len(children)
+    next_slot = parent_starts[:]
+    for index in range(size):
+        for child in children[child_starts[index]:child_starts[index + 1]]:
+            parents[next_slot[child]] = index
+            next_slot[child] += 1
+    del children, child_starts, next_slot
+
+    # Settle positions in order of distance. A position lost in d moves makes every parent a win
+    # in d + 1, and a position won in d moves takes one move away from each parent, which is lost
+    # once none are left.
+    distance = 1
+    while buckets:
+        found = buckets.pop(distance, ())
+        if distance > MAX_DISTANCE and found:
+            raise RuntimeError("A position in " + signature_name(signature) + " takes more than " +
+                               str(MAX_DISTANCE) + " moves to win")
+        for index in found:
+            if values[index]:
+                continue
+            values[index] = distance
+            for parent in parents[parent_starts[index]:parent_starts[index + 1]]:
+                if values[parent]:
+                    continue
+                if distance % 2 == 0:
+                    buckets.setdefault(distance + 1, []).append(parent)
+                else:
+                    remaining[parent] -= 1
+                    if longest_loss[parent] < distance + 1:
+                        longest_loss[parent] = distance + 1
+                    if remaining[parent] == 0 and not escapes[parent]:
+                        buckets.setdefault(longest_loss[parent], []).append(parent)
+        distance += 1
+
+    os.makedirs(directory, exist_ok=True)
+    temporary = path + "." + str(os.getpid())
+    with open(temporary, "wb") as table:
+        table.write(table_header(signature))
+        table.write(values)
+    os.replace(temporary, path)
+    return path
+
+
+def _build_table_task(task):
+    """
+    Unpacks a task tuple for build_table, so it can be handed to a worker pool
+    """
+    return build_table(*task)
+
+
+def build_tablebases(directory, max_pieces, workers=None):
+    """
+    Builds the tables for every signature with up to max_pieces pieces in the directory, skipping
+    any already built, and yields the path of each table as it is finished. Tables with the same
+    number of pieces don't depend on each other, so they are built at the same time across a pool
+    of worker processes (one per CPU if workers is None, or in this process if workers is 1).
+    """
+    os.makedirs(directory, exist_ok=True)
+    for piece_count in range(2, max_pieces + 1):
+        tasks = [(directory, signature) for signature in signatures(piece_count)
+                 if not table_complete(directory, signature)]
+        if workers == 1:
+            for task in tasks:
+                yield _build_table_task(task)
+        elif tasks:
+            with multiprocessing.Pool(workers) as pool:
+                for path in pool.imap_unordered(_build_table_task, tasks):
+                    yield path
+
+
+def main(argv=None):
+    """
+    Builds tables or probes a position from the command line
+    """
+    parser = argparse.ArgumentParser(prog="python -m chess_game.Tablebase", description="Build and probe "
+                                     "ChessVar endgame tablebases.")
+    commands = parser.add_subparsers(dest="command")
+    build = commands.add_parser("build", help="build every table up to a number of pieces")
+    build.add_argument("directory")
+    build.add_argument("--pieces", type=int, default=3, help="most pieces on the board (default 3)")
+    build.add_argument("--signature", action="append", help="only build this table, like RKvK (can be repeated, "
+                       "tables it depends on must be built already)")
+    build.add_argument("--workers", type=int, default=None, help="worker processes (default one per CPU)")
+    probe = commands.add_parser("probe", help="look up a position given in the text form of the Position module")
+    probe.add_argument("directory")
+    probe.add_argument("position", help='for example "8/8/8/3k4/8/8/8/R3K3 w"')
+    args = parser.parse_args(argv)
+
+    if args.command == "build":
+        if args.signature:
+            try:
+                for name in args.signature:
+                    print(build_table(args.directory, parse_signature(name)))
+            except (ValueError, RuntimeError) as error:
+                parser.error(str(error))
+        else:
+            if not 2 <= args.pieces <= MAX_PIECES:
+                parser.error("--pieces must be between 2 and " + str(MAX_PIECES))
+            for path in build_tablebases(args.directory, args.pieces, args.workers):
+                print(path)
+        return 0
+
+    if args.command == "probe":
+        try:
+            bitboards, turn_number = parse_fen(args.position)
+        except ValueError as error:
+            parser.error(str(error))
+        game = ChessVar.from_bitboards(bitboards, turn_number)
+        result = Tablebase(args.directory).probe(game)
+        if result is None:
+            print("No table for " + signature_name(board_signature(game.get_bitboard())))
+            return 1
+        if result[0] == "DRAW":
+            print("draw")
+        else:
+            print(result[0].lower() + " in " + str(result[1]) + " moves for the player to move")
+        return 0
+
+    parser.print_help()
+    return 2
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,36 @@
+# Author: Cooper Thompson
+# GitHub username: coopthompson
+# Date: October 18th, 2026
+# Description: Helpers shared by the tests in this directory.
+
+import random
+
+from chess_game.Bitboard import move_names
+from chess_game.ChessVar import ChessVar
+
+
+def random_games(count, seed, max_plies=80):
+    """
+    Returns a list of count games, the first in the starting position and each of the others
+    reached by playing up to max_plies random legal moves from it with make_move
+    """
+    rng = random.Random(seed)
+    games = [ChessVar()]
+    while len(games) < count:
+        game = ChessVar()
+        for ply in range(rng.randrange(1, max_plies)):
+            moves = game.legal_moves()
+            if not moves:
+                break
+            game.make_move(*move_names(rng.choice(moves)))
+        games.append(game)
+    return games
+
+
+def same_position(first, second):
+    """
+    Returns True if two games have the same pieces on the same squares and the same player to move
+    """
+    return (first.get_bitboard().get_piece_bitboards() == second.get_bitboard().get_piece_bitboards() and
+            first.get_turn_number() % 2 == second.get_turn_number() % 2 and
+            first.get_position_key() == second.get_position_key())
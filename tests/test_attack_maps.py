@@ -0,0 +1,97 @@
+# Author: Cooper Thompson
+# GitHub username: coopthompson
+# Date: October 18th, 2026
+# Description: Tests for the attack maps the Bitboard keeps up to date, checked
+#              against working out every attack from scratch.
+
+import random
+
+from chess_game.ChessVar import ChessVar
+from chess_game.Engine import Engine
+
+
+def check_maps(board):
+    """
+    Checks every attack map of a Bitboard against get_attacks and get_attacked
+    """
+    for square in range(64):
+        assert board.get_attacks_from(square) == board.get_attacks(square)
+    for player in (0, 1):
+        assert board.get_attacked_squares(player) == board.get_attacked(player)
+
+
+def test_maps_follow_push_pop_and_make_move():
+    """
+    The maps stay right through random games played with push, pop, and make_move
+    """
+    rng = random.Random(5)
+    for game_index in range(40):
+        game = ChessVar()
+        board = game.get_bitboard()
+        check_maps(board)
+        for ply in range(rng.randrange(10, 80)):
+            moves = game.legal_moves()
+            if not moves:
+                break
+            move = rng.choice(moves)
+            if game._undo_stack and rng.random() < 0.15:
+                game.pop()
+            elif rng.random() < 0.5:
+                game.push(move)
+            else:
+                assert game.make_move(move & 63, move >> 6)
+            check_maps(board)
+
+
+def test_capture_defended_matches_making_the_move():
+    """
+    is_capture_defended agrees with making the move and looking at the opponent's attacks
+    """
+    rng = random.Random(9)
+    for game_index in range(20):
+        game = ChessVar()
+        for ply in range(rng.randrange(10, 60)):
+            moves = game.legal_moves()
+            if not moves:
+                break
+            board = game.get_bitboard()
+            for move in moves:
+                square_from = move & 63
+                square_to = move >> 6
+                after = board.copy()
+                opponent = 1 - board.piece_at(square_from) // 6
+                after.move_piece(square_from, square_to)
+                expected = bool(after.get_attacked(opponent) & (1 << square_to))
+                assert board.is_capture_defended(square_from, square_to) == expected
+            game.push(rng.choice(moves))
+
+
+def test_queries_by_name():
+    """
+    The ChessVar queries answer with square names
+    """
+    game = ChessVar()
+    assert game.get_attackers("f3") == ["g1", "e2", "g2"]
+    assert game.get_attackers("f3", "Black") == []
+    assert "e4" not in game.get_attacked_squares("White")
+    assert game.get_threatened_pieces("Black", "Queen") == []
+    assert not game.is_capture_defended("e2", "e4")
+
+
+def test_maps_can_be_dropped():
+    """
+    Copies don't carry the maps, drop_attack_maps forgets them, and a search drops them
+    """
+    game = ChessVar()
+    game.get_attacked_squares("White")
+    board = game.get_bitboard()
+    assert board._attack_maps is not None
+    assert game.copy().get_bitboard()._attack_maps is None
+
+    game.drop_attack_maps()
+    assert board._attack_maps is None
+    game.push(game.legal_moves()[0])
+    check_maps(board)
+
+    Engine(max_depth=1).search(game)
+    assert board._attack_maps is None
@@ -0,0 +1,184 @@
+# Author: Cooper Thompson
+# GitHub username: coopthompson
+# Date: October 18th, 2026
+# Description: Tests for the ChessVar rules kept on the Bitboard: the moves
+#              make_move allows, the moves legal_moves lists, the board state
+#              they lead to, position keys, taking moves back with push and
+#              pop, and is_legal.
+
+import random
+
+import pytest
+
+from chess_game.Bitboard import EMPTY, ZOBRIST_BLACK_TO_MOVE, ZOBRIST_PIECES, move_names
+from chess_game.ChessVar import ChessVar
+
+from .conftest import random_games
+
+SQUARE_NAMES = [column + row for row in "12345678" for column in "abcdefgh"]
+
+
+def replay(moves):
+    """
+    Returns a new game with the given moves (pairs of square names) made in it
+    """
+    game = ChessVar()
+    for square_from, square_to in moves:
+        assert game.make_move(square_from, square_to)
+    return game
+
+
+def test_play_a_short_game():
+    """
+    Moves are only made in turn and by the rules, the board state follows them, and the game ends
+    once a player has lost every piece of a type
+    """
+    game = ChessVar()
+    assert not game.make_move("e7", "e5")
+    assert not game.make_move("e2", "e5")
+    assert not game.make_move("d1", "h5")
+    for square_from, square_to in (("e2", "e4"), ("f7", "f5"), ("d1", "h5"), ("a7", "a6")):
+        assert game.make_move(square_from, square_to)
+        assert game.get_game_state() == "UNFINISHED"
+    assert game.make_move("h5", "e8")
+    assert game.get_game_state() == "WHITE_WON"
+    assert not game.make_move("a6", "a5")
+
+    board_state = game.get_board_state()
+    queen = board_state[0][4]
+    assert (queen.get_player(), queen.get_piece_object().get_type()) == ("White", "Queen")
+    assert queen.get_piece_object().get_location() == "e8"
+    pawn = board_state[4][4]
+    assert (pawn.get_player(), pawn.get_piece_object().get_type()) == ("White", "Pawn")
+    assert board_state[7][3].get_piece_object().get_type() != "Queen"
+
+
+def test_piece_counts_follow_captures():
+    """
+    The piece counts go down as pieces are captured and always match the board, which debug mode
+    checks after every move
+    """
+    game = ChessVar(debug=True)
+    board = game.get_bitboard()
+    for square_from, square_to in (("e2", "e4"), ("d7", "d5"), ("e4", "d5"), ("d8", "d5")):
+        assert game.make_move(square_from, square_to)
+    assert (board.get_count(0, 0), board.get_count(1, 0), board.get_count(1, 4)) == (7, 7, 1)
+    assert board.count_types(0) == board.count_types(1) == 6
+    assert board.counts_match_board()
+
+
+def test_legal_moves_match_make_move():
+    """
+    legal_moves returns exactly the moves make_move accepts out of all 4096 pairs of squares, and
+    legal_moves_from the ones starting on each square, in every position of a few random games
+    """
+    rng = random.Random(3)
+    for game_index in range(2):
+        played = []
+        game = ChessVar()
+        for ply in range(30):
+            generated = set(move_names(move) for move in game.legal_moves())
+            for square_from in SQUARE_NAMES:
+                from_square = set(move_names(move) for move in game.legal_moves_from(square_from))
+                assert from_square == set(move for move in generated if move[0] == square_from)
+                for square_to in SQUARE_NAMES:
+                    accepted = game.make_move(square_from, square_to)
+                    assert accepted == ((square_from, square_to) in generated)
+                    if accepted:
+                        game = replay(played)
+            if not generated:
+                break
+            played.append(rng.choice(sorted(generated)))
+            game.make_move(*played[-1])
+
+
+def scratch_key(board, black_to_move):
+    """
+    Works out the position key of a Bitboard from every one of its squares and the player to move
+    """
+    key = ZOBRIST_BLACK_TO_MOVE if black_to_move else 0
+    for square in range(64):
+        code = board.piece_at(square)
+        if code != EMPTY:
+            key ^= ZOBRIST_PIECES[code][square]
+    return key
+
+
+def test_position_keys_match_scratch():
+    """
+    The position key kept up to date move by move is the one worked out from scratch after every
+    make_move, push, and pop, and a copy of the game has the same key
+    """
+    rng = random.Random(9)
+    for game_index in range(30):
+        game = ChessVar()
+        pushed = 0
+        assert game.get_position_key() == scratch_key(game.get_bitboard(), False)
+        for ply in range(rng.randrange(10, 80)):
+            moves = game.legal_moves()
+            if pushed and (not moves or rng.random() < 0.2):
+                game.pop()
+                pushed -= 1
+            elif not moves:
+                break
+            elif rng.random() < 0.5:
+                game.push(rng.choice(moves))
+                pushed += 1
+            else:
+                assert game.make_move(*move_names(rng.choice(moves)))
+                pushed = 0
+            black_to_move = game.get_turn_number() % 2 == 1
+            assert game.get_position_key() == scratch_key(game.get_bitboard(), black_to_move)
+        assert game.copy().get_position_key() == game.get_position_key()
+
+
+def snapshot(game):
+    """
+    Returns everything pop has to put back: the piece on every square, the position key, the turn
+    number, and the game state
+    """
+    board = game.get_bitboard()
+    return (tuple(board.piece_at(square) for square in range(64)), game.get_position_key(),
+            game.get_turn_number(), game.get_game_state())
+
+
+def test_pop_undoes_push():
+    """
+    Every push taken back with pop gives back the same position, key, and turn number
+    """
+    for game in random_games(10, 11):
+        before = snapshot(game)
+        for move in game.legal_moves():
+            game.push(move)
+            assert game.pop() == move
+            assert snapshot(game) == before
+
+
+def test_make_move_keeps_no_undo_entries():
+    """
+    make_move clears the undo stack instead of growing it, so pop can't take it back
+    """
+    game = ChessVar()
+    game.push(game.legal_moves()[0])
+    assert game.make_move("e7", "e6")
+    assert game.make_move("e2", "e3")
+    assert game.get_turn_number() == 3
+    with pytest.raises(IndexError):
+        game.pop()
+    game.update_board("White", "Pawn", "d3", "d2")
+    with pytest.raises(IndexError):
+        game.pop()
+    assert game.get_turn_number() == 3
+
+
+def test_is_legal_matches_legal_moves():
+    """
+    is_legal agrees with legal_moves_from for every pair of squares, asked twice so the second
+    answer comes from the cache
+    """
+    for game in random_games(4, 7):
+        for square_from in range(64):
+            targets = set(move >> 6 for move in game.legal_moves_from(square_from))
+            for square_to in range(64):
+                assert game.is_legal(square_from, square_to) == (square_to in targets)
+                assert game.is_legal(square_from, square_to) == (square_to in targets)
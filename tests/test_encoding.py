@@ -0,0 +1,24 @@
+# Author: Cooper Thompson
+# GitHub username: coopthompson
+# Date: October 18th, 2026
+# Description: Tests for the NumPy encoder: positions decoded from the planes
+#              have to be the ones that were encoded. Skipped without NumPy.
+
+import pytest
+
+from .conftest import random_games, same_position
+
+encoding = pytest.importorskip("chess_game.Encoding")
+
+
+def test_encoding_round_trip():
+    """
+    Positions decoded from the NumPy planes are the ones that were encoded
+    """
+    games = random_games(30, 4)
+    planes, side_to_move, counts = encoding.encode_positions(games)
+    assert planes.shape == (30, 12, 8, 8)
+    assert planes[0, 0, 6].tolist() == [1] * 8
+    for game, decoded, game_counts in zip(games, encoding.decode_positions(planes, side_to_move), counts):
+        assert same_position(decoded, game)
+        assert game_counts.reshape(12).tolist() == list(game.get_bitboard().get_counts())
@@ -0,0 +1,45 @@
+# Author: Cooper Thompson
+# GitHub username: coopthompson
+# Date: October 18th, 2026
+# Description: Tests for the search engine: it has to take a win when there is
+#              one, return a legal move otherwise, and leave the game as it was.
+
+from chess_game.Bitboard import encode_move, square_index
+from chess_game.ChessVar import ChessVar
+from chess_game.Engine import WIN_THRESHOLD, Engine
+from chess_game.Perft import POSITIONS, setup_position
+
+
+def test_takes_the_win():
+    """
+    With the Queen able to capture Black's only King, the search takes it at every depth
+    """
+    for depth in (1, 2, 3):
+        game = setup_position("king-hunt")
+        move, score = Engine(max_depth=depth).search(game)
+        assert move == encode_move(square_index("h5"), square_index("e8"))
+        assert score >= WIN_THRESHOLD
+
+
+def test_search_leaves_the_game_alone():
+    """
+    The search returns a legal move and the game is back in the same position afterwards, with or
+    without a node limit
+    """
+    for name in POSITIONS:
+        for engine in (Engine(max_depth=3), Engine(max_depth=6, max_nodes=500)):
+            game = setup_position(name)
+            key = game.get_position_key()
+            turn_number = game.get_turn_number()
+            move, score = engine.search(game)
+            assert move in game.legal_moves()
+            assert (game.get_position_key(), game.get_turn_number()) == (key, turn_number)
+
+
+def test_finished_game_has_no_move():
+    """
+    Once the game is over there is no move to return
+    """
+    game = setup_position("king-hunt")
+    assert game.make_move("h5", "e8")
+    assert Engine().search(game)[0] is None
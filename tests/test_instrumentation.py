@@ -0,0 +1,86 @@
+# Author: Cooper Thompson
+# GitHub username: coopthompson
+# Date: October 18th, 2026
+# Description: Tests for the make_move instrumentation: every move turned down
+#              has to be counted under the right reason, and the phases it went
+#              through have to be timed.
+
+import pytest
+
+from chess_game.Bitboard import InvalidSquareError
+from chess_game.ChessVar import ChessVar
+from chess_game.Instrumentation import MoveStats, PHASES, REJECT_REASONS
+
+
+def test_reject_reasons():
+    """
+    Moves that are turned down are counted under the reason make_move turned them down for
+    """
+    game = ChessVar()
+    stats = game.enable_stats()
+    moves = (
+        ("e3", "e4", "empty_square"),
+        ("e7", "e5", "wrong_turn"),
+        ("e2", "e5", "illegal_move"),
+        ("e2", "e4", None),
+        ("e4", "e5", "wrong_turn"),
+        ("f7", "f5", None),
+        ("d1", "h5", None),
+        ("a7", "a6", None),
+        ("h5", "e8", None),
+        ("a6", "a5", "game_over"),
+    )
+    expected = dict.fromkeys(REJECT_REASONS, 0)
+    for square_from, square_to, reason in moves:
+        assert game.make_move(square_from, square_to) == (reason is None)
+        if reason is not None:
+            expected[reason] += 1
+        assert stats.snapshot()["rejected"] == expected
+    with pytest.raises(InvalidSquareError):
+        game.make_move("e9", "e4")
+    expected["invalid_square"] += 1
+
+    snapshot = stats.snapshot()
+    assert snapshot["rejected"] == expected
+    assert (snapshot["calls"], snapshot["accepted"]) == (11, 5)
+
+
+def test_phase_timings():
+    """
+    Every phase a call gets to is timed, and the times add up
+    """
+    game = ChessVar()
+    stats = game.enable_stats()
+    assert game.make_move("e2", "e4")
+    assert not game.make_move("e3", "e4")
+    assert not game.make_move("e7", "e4")
+    phases = stats.snapshot()["phases"]
+    assert [phases[phase]["calls"] for phase in PHASES] == [3, 2, 2, 1, 3]
+    for phase in PHASES:
+        timing = phases[phase]
+        assert 0 <= timing["max_ns"] <= timing["total_ns"]
+        assert timing["mean_ns"] == timing["total_ns"] / timing["calls"]
+    assert phases["total"]["total_ns"] >= phases["parse"]["total_ns"] + phases["update_board"]["total_ns"]
+
+    stats.reset()
+    assert stats.snapshot()["calls"] == 0
+
+
+def test_profile_records_every_game():
+    """
+    profile records the moves of every game without stats of its own while it is open, and
+    nothing after it closes
+    """
+    own = MoveStats()
+    with ChessVar.profile() as stats:
+        first = ChessVar()
+        second = ChessVar()
+        second.enable_stats(own)
+        assert first.make_move("e2", "e4")
+        assert not first.make_move("e2", "e4")
+        assert second.make_move("d2", "d4")
+    assert first.make_move("e7", "e5")
+    assert (stats.snapshot()["calls"], stats.snapshot()["accepted"]) == (2, 1)
+    assert stats.snapshot()["rejected"]["empty_square"] == 1
+    assert own.snapshot()["calls"] == 1
+    assert first.get_stats() is None
@@ -0,0 +1,100 @@
+# Author: Cooper Thompson
+# GitHub username: coopthompson
+# Date: October 18th, 2026
+# Description: Tests for the move tables: every square a piece can reach has to
+#              match stepping from the square one file and rank at a time.
+
+import random
+
+from chess_game.MoveTables import (BETWEEN, DIRECTION_STEPS, KING_MASKS, KING_MOVES, KNIGHT_MASKS, KNIGHT_MOVES,
+                                   PAWN_ATTACK_MASKS, PAWN_PUSH_MASKS, bishop_attacks, bit_squares, queen_attacks,
+                                   rook_attacks)
+
+KNIGHT_STEPS = ((1, 2), (2, 1), (2, -1), (1, -2), (-1, -2), (-2, -1), (-2, 1), (-1, 2))
+KING_STEPS = ((1, 0), (1, 1), (0, 1), (-1, 1), (-1, 0), (-1, -1), (0, -1), (1, -1))
+
+
+def stepped(square, steps):
+    """
+    Returns a bitboard of the squares one of the given (file, rank) steps away from square that are
+    still on the board
+    """
+    bitboard = 0
+    for column_step, row_step in steps:
+        column = (square & 7) + column_step
+        row = (square >> 3) + row_step
+        if 0 <= column < 8 and 0 <= row < 8:
+            bitboard |= 1 << (row * 8 + column)
+    return bitboard
+
+
+def test_knight_and_king_tables():
+    """
+    The Knight and King tables hold the squares one jump or one step away, as masks and as tuples
+    """
+    for square in range(64):
+        assert KNIGHT_MASKS[square] == stepped(square, KNIGHT_STEPS)
+        assert KING_MASKS[square] == stepped(square, KING_STEPS)
+        assert KNIGHT_MOVES[square] == bit_squares(KNIGHT_MASKS[square])
+        assert KING_MOVES[square] == bit_squares(KING_MASKS[square])
+
+
+def test_pawn_tables():
+    """
+    Pawns attack the two squares diagonally ahead and move one square ahead, or two from their
+    starting rank, up the board for White and down it for Black
+    """
+    for square in range(64):
+        for player, forward, start_row in ((0, 1, 1), (1, -1, 6)):
+            assert PAWN_ATTACK_MASKS[player][square] == stepped(square, ((-1, forward), (1, forward)))
+            pushes = ((0, forward), (0, 2 * forward)) if square >> 3 == start_row else ((0, forward),)
+            assert PAWN_PUSH_MASKS[player][square] == stepped(square, pushes)
+
+
+def slid(square, steps, occupied):
+    """
+    Returns a bitboard of the squares reached by sliding from square along each of the given
+    (file, rank) steps until the edge of the board or the first occupied square
+    """
+    bitboard = 0
+    for column_step, row_step in steps:
+        column = (square & 7) + column_step
+        row = (square >> 3) + row_step
+        while 0 <= column < 8 and 0 <= row < 8:
+            bitboard |= 1 << (row * 8 + column)
+            if occupied >> (row * 8 + column) & 1:
+                break
+            column += column_step
+            row += row_step
+    return bitboard
+
+
+def test_sliding_attacks():
+    """
+    Rook, Bishop, and Queen attacks stop at the first piece in every direction, on boards with
+    pieces scattered at random
+    """
+    rng = random.Random(1)
+    rook_steps = DIRECTION_STEPS[0:2] + DIRECTION_STEPS[4:6]
+    bishop_steps = DIRECTION_STEPS[2:4] + DIRECTION_STEPS[6:8]
+    for board_index in range(50):
+        occupied = rng.getrandbits(64) & rng.getrandbits(64)
+        for square in range(64):
+            assert rook_attacks(square, occupied) == slid(square, rook_steps, occupied)
+            assert bishop_attacks(square, occupied) == slid(square, bishop_steps, occupied)
+            assert queen_attacks(square, occupied) == slid(square, DIRECTION_STEPS, occupied)
+
+
+def test_between():
+    """
+    BETWEEN holds the squares a piece slides over between two squares on a line, and nothing for
+    squares that aren't on one
+    """
+    for square_from in range(64):
+        for square_to in range(64):
+            expected = 0
+            for step in DIRECTION_STEPS:
+                line = slid(square_from, (step,), 1 << square_to)
+                if line >> square_to & 1:
+                    expected = line ^ (1 << square_to)
+            assert BETWEEN[square_from][square_to] == expected
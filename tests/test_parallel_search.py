@@ -0,0 +1,85 @@
+# Author: Cooper Thompson
+# GitHub username: coopthompson
+# Date: October 18th, 2026
+# Description: Tests for the parallel search: entries have to come back out of
+#              the shared table as they went in, and a search gives the same
+#              answer as the Engine.
+
+import multiprocessing
+import random
+
+from chess_game.Engine import Engine
+from chess_game.ParallelSearch import ParallelSearch, SharedTable
+from chess_game.Perft import POSITIONS, setup_position
+
+
+def random_entries(count, seed):
+    """
+    Returns a dictionary of count random position keys to random Engine table entries
+    """
+    rng = random.Random(seed)
+    entries = {}
+    while len(entries) < count:
+        move = rng.choice([None, rng.randrange(4096)])
+        entries[rng.getrandbits(64)] = (rng.randrange(256), rng.randrange(-100000, 100001), rng.randrange(3), move)
+    return entries
+
+
+def test_shared_table_round_trip():
+    """
+    Every entry stored in a table large enough to hold them all is read back unchanged, keys that
+    were never stored read as empty, and clear empties the table
+    """
+    entries = random_entries(500, 2)
+    table = SharedTable(1 << 20)
+    for key, entry in entries.items():
+        table[key] = entry
+    slots = len(table) - 1
+    assert len(set(key & slots for key in entries)) == len(entries)
+    for key, entry in entries.items():
+        assert table.get(key) == entry
+        assert table.get(key ^ (1 << 63), "missing") == "missing"
+    table.clear()
+    assert all(table.get(key) is None for key in entries)
+
+
+def store_entry(table, key, entry):
+    """
+    Runs in a child process: stores an entry in a shared table
+    """
+    table[key] = entry
+
+
+def test_shared_table_is_shared_with_processes():
+    """
+    An entry a child process stores in the table can be read by the parent
+    """
+    table = SharedTable(64)
+    process = multiprocessing.Process(target=store_entry, args=(table, 12345, (3, -7, 1, 99)))
+    process.start()
+    process.join()
+    assert process.exitcode == 0
+    assert table.get(12345) == (3, -7, 1, 99)
+
+
+def test_one_worker_matches_engine():
+    """
+    With one worker the search gives the same move and score as the Engine on its own
+    """
+    with ParallelSearch(1, table_entries=1 << 14) as search:
+        for name in POSITIONS:
+            game = setup_position(name)
+            assert search.search(game, max_depth=3) == Engine().search(game, max_depth=3)
+            search.clear()
+
+
+def test_workers_return_legal_move():
+    """
+    With several worker processes the search returns a legal move from a finished depth
+    """
+    game = setup_position("open-center")
+    with ParallelSearch(2, table_entries=1 << 14) as search:
+        move, score = search.search(game, max_depth=3)
+        assert move in game.legal_moves()
+        assert search.get_depth_reached() == 3
+        assert len(search.get_results()) == 2
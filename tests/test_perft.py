@@ -0,0 +1,27 @@
+# Author: Cooper Thompson
+# GitHub username: coopthompson
+# Date: October 18th, 2026
+# Description: Tests for perft: the counts for every stored position have to
+#              match the table, and validate has to find nothing wrong.
+
+from chess_game.Perft import EXPECTED, POSITIONS, divide, perft, setup_position, validate
+
+
+def test_perft_counts():
+    """
+    perft gives the stored counts for every position up to depth 3, and divide splits them up by
+    first move
+    """
+    for name in POSITIONS:
+        game = setup_position(name)
+        for depth in range(1, 4):
+            assert perft(game, depth) == EXPECTED[name][depth - 1]
+        assert sum(count for move, count in divide(game, 2)) == EXPECTED[name][1]
+
+
+def test_validate_positions():
+    """
+    validate finds legal_moves and make_move agreeing in every stored position
+    """
+    for name in POSITIONS:
+        assert validate(setup_position(name), 0) == 1
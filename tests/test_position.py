@@ -0,0 +1,59 @@
+# Author: Cooper Thompson
+# GitHub username: coopthompson
+# Date: October 18th, 2026
+# Description: Tests for the position formats: the text form and the binary form
+#              both have to give back the position they were made from, and
+#              anything else has to be turned down.
+
+import pytest
+
+from chess_game.ChessVar import ChessVar
+from chess_game.Position import InvalidPositionError
+
+from .conftest import random_games, same_position
+
+
+def test_fen_round_trip():
+    """
+    A game read back from its text form has the same position, turn number, and game state
+    """
+    for game in random_games(50, 1):
+        loaded = ChessVar.from_position(game.to_fen())
+        assert same_position(loaded, game)
+        assert loaded.get_turn_number() == game.get_turn_number()
+        assert loaded.get_game_state() == game.get_game_state()
+        assert loaded.to_fen() == game.to_fen()
+
+
+def test_bytes_round_trip():
+    """
+    A game read back from its binary form has the same position and player to move
+    """
+    for game in random_games(50, 2):
+        data = game.to_bytes()
+        assert len(data) == 32
+        assert same_position(ChessVar.from_position(data), game)
+
+
+def test_save_and_load(tmp_path):
+    """
+    save and load give back the position in both forms
+    """
+    game = random_games(2, 3)[1]
+    for binary in (False, True):
+        path = tmp_path / ("position.bin" if binary else "position.fen")
+        game.save(path, binary)
+        assert same_position(ChessVar.load(path), game)
+
+
+def test_bad_positions_are_rejected():
+    """
+    Positions that can't be read raise InvalidPositionError
+    """
+    for text in ("", "8/8/8/8/8/8/8/8 x 0", "8/8/8/8/8/8/8 w 0", "9/8/8/8/8/8/8/8 w 0",
+                 "8/8/8/8/8/8/8/7z w 0", "8/8/8/8/8/8/8/8 b 2"):
+        with pytest.raises(InvalidPositionError):
+            ChessVar.from_position(text)
+    for data in (b"", bytes(31), bytes([0x77]) * 32):
+        with pytest.raises(InvalidPositionError):
+            ChessVar.from_position(data)
@@ -0,0 +1,131 @@
+# Author: Cooper Thompson
+# GitHub username: coopthompson
+# Date: October 18th, 2026
+# Description: Tests for the PositionDatabase: its counts have to match replaying
+#              the games directly, however the games are added.
+
+import pytest
+
+from chess_game import PositionDatabase as position_database
+from chess_game.ChessVar import ChessVar
+from chess_game.PositionDatabase import PositionDatabase, main
+from chess_game.Replay import replay_game
+from chess_game.SelfPlay import play_game
+
+
+def game_lines(count):
+    """
+    Returns count random games as lines of squares, like the Replay module reads
+    """
+    lines = []
+    for game_index in range(count):
+        moves = play_game(game_index, "random", "greedy", seed=2, max_plies=60)["moves"]
+        lines.append(" ".join(move[:2] + " " + move[2:] for move in moves))
+    return lines
+
+
+def expected_counts(lines):
+    """
+    Replays the games and returns a dictionary from position key to a list of the times it was
+    reached, the games that reached it, and how many of those White won and Black won
+    """
+    counts = {}
+    for line in lines:
+        keys = []
+        result = replay_game(line.split(), keys=keys)
+        if not result.is_valid():
+            continue
+        for key in keys:
+            counts.setdefault(key, [0, 0, 0, 0])[0] += 1
+        for key in set(keys):
+            counts[key][1] += 1
+            counts[key][2] += result.get_state() == "WHITE_WON"
+            counts[key][3] += result.get_state() == "BLACK_WON"
+    return counts
+
+
+def test_counts_match_replaying(tmp_path):
+    """
+    Games added in two goes give the same counts as replaying all of them, and games with a move
+    that isn't allowed are left out
+    """
+    lines = game_lines(60)
+    with PositionDatabase(str(tmp_path), writable=True) as database:
+        assert database.add_lines(lines[:30]) == (30, 0)
+    with PositionDatabase(str(tmp_path), writable=True) as database:
+        assert database.add_lines(lines[30:] + ["e2 e5"]) == (30, 1)
+
+    expected = expected_counts(lines)
+    with PositionDatabase(str(tmp_path)) as database:
+        assert database.get_game_count() == 60
+        assert len(database) == len(expected)
+        for key, (occurrences, games, white_won, black_won) in expected.items():
+            stats = database.lookup(key)
+            assert stats.get_occurrences() == occurrences
+            assert stats.get_games() == games
+            results = stats.get_results()
+            assert (results["WHITE_WON"], results["BLACK_WON"]) == (white_won, black_won)
+        assert database.lookup_game(ChessVar()).get_games() == 60
+        assert database.lookup(12345) is None
+
+
+class InterruptedSlot:
+    """
+    Stands in for the SLOT struct of the PositionDatabase module, raising KeyboardInterrupt once a
+    number of index slots have been written
+    """
+    def __init__(self, writes):
+        """
+        Initialises an InterruptedSlot that lets writes slots be written
+        """
+        self._slot = position_database.SLOT
+        self.size = self._slot.size
+        self._writes = writes
+
+    def unpack_from(self, buffer, offset):
+        """
+        Reads a slot like the real struct
+        """
+        return self._slot.unpack_from(buffer, offset)
+
+    def pack_into(self, buffer, offset, *values):
+        """
+        Writes a slot like the real struct, or raises KeyboardInterrupt if no more writes are left
+        """
+        if not self._writes:
+            raise KeyboardInterrupt
+        self._writes -= 1
+        self._slot.pack_into(buffer, offset, *values)
+
+
+def test_interrupted_batch_leaves_index_right(tmp_path, monkeypatch):
+    """
+    After adding a batch is stopped partway, games added later still find their own records
+    """
+    lines = game_lines(40)
+    with PositionDatabase(str(tmp_path), writable=True) as database:
+        monkeypatch.setattr(position_database, "SLOT", InterruptedSlot(20))
+        with pytest.raises(KeyboardInterrupt):
+            database.add_lines(lines[:20])
+        monkeypatch.undo()
+    with PositionDatabase(str(tmp_path), writable=True) as database:
+        database.add_lines(lines[20:])
+
+    with PositionDatabase(str(tmp_path)) as database:
+        for key, counts in expected_counts(lines[20:]).items():
+            stats = database.lookup(key)
+            assert stats.get_key() == key
+            assert stats.get_occurrences() >= counts[0]
+
+
+def test_query_rejects_bad_moves(tmp_path, capsys):
+    """
+    The query command turns down squares that don't exist and a square without a partner
+    """
+    with PositionDatabase(str(tmp_path), writable=True) as database:
+        database.add_game("e2 e4".split())
+    for moves in ("e2 e9", "e2 e4 e7"):
+        with pytest.raises(SystemExit):
+            main(["query", str(tmp_path), "--moves", moves])
+    assert main(["query", str(tmp_path), "--moves", "e2 e4"]) == 0
+    assert "reached 1 times in 1 games" in capsys.readouterr().out
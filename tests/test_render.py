@@ -0,0 +1,57 @@
+# Author: Cooper Thompson
+# GitHub username: coopthompson
+# Date: October 18th, 2026
+# Description: Tests for drawing boards: the first drawing has to write the whole
+#              board, and every later one only the squares that changed.
+
+import io
+
+from chess_game.ChessVar import ChessVar
+from chess_game.Render import BoardRenderer, move_cursor
+
+
+def test_first_render_writes_the_whole_board():
+    """
+    The first rendering writes every line of print_board's text, each at its own line of the
+    terminal
+    """
+    game = ChessVar()
+    output = BoardRenderer(top=3, left=5).render(game)
+    lines = game.render_board().split("\n")[:-1]
+    assert output == "".join(move_cursor(3 + number, 5) + line for number, line in enumerate(lines))
+
+
+def test_later_renders_only_write_changed_squares():
+    """
+    After a move only the squares it changed are written, nothing is written if nothing changed,
+    and reset makes the next rendering write the whole board again
+    """
+    game = ChessVar()
+    renderer = BoardRenderer(top=1, left=1)
+    renderer.render(game)
+    assert renderer.render(game) == ""
+
+    # Line 1 holds the column labels, so rank r is on line 10 - r. The e file starts at column
+    # 4 + 4 * 4 = 20.
+    assert game.make_move("e2", "e4")
+    assert renderer.render(game) == move_cursor(8, 20) + "E " + move_cursor(6, 20) + "WP"
+    assert game.make_move("d7", "d5")
+    assert game.make_move("e4", "d5")
+    assert renderer.render(game) == move_cursor(6, 20) + "E " + move_cursor(5, 16) + "WP" + move_cursor(3, 16) + "E "
+
+    renderer.reset()
+    assert renderer.render(game).startswith(move_cursor(1, 1) + game.render_board().split("\n")[0])
+
+
+def test_draw_writes_once():
+    """
+    draw writes what render returns to the stream, and nothing when the board hasn't changed
+    """
+    stream = io.StringIO()
+    game = ChessVar()
+    renderer = BoardRenderer(stream=stream)
+    renderer.draw(game)
+    written = stream.getvalue()
+    assert written == BoardRenderer().render(game)
+    renderer.draw(game)
+    assert stream.getvalue() == written
@@ -0,0 +1,60 @@
+# Author: Cooper Thompson
+# GitHub username: coopthompson
+# Date: October 18th, 2026
+# Description: Tests for replaying archived games: the state, the number of
+#              moves, and where the first bad move is have to be reported for
+#              every line.
+
+from chess_game.ChessVar import ChessVar
+from chess_game.Replay import replay_file, replay_game, replay_lines
+
+KING_HUNT = "e2 e4 f7 f5 d1 h5 a7 a6 h5 e8"
+
+
+def test_valid_game():
+    """
+    A game whose moves are all allowed reports its final state and position
+    """
+    result = replay_game(KING_HUNT.split(), line_number=4)
+    assert result.is_valid()
+    assert result.get_first_illegal() is None
+    assert (result.get_line_number(), result.get_state(), result.get_ply_count()) == (4, "WHITE_WON", 5)
+    game = ChessVar()
+    for square_from, square_to in zip(KING_HUNT.split()[::2], KING_HUNT.split()[1::2]):
+        game.make_move(square_from, square_to)
+    assert result.get_position_key() == game.get_position_key()
+
+
+def test_illegal_moves():
+    """
+    A game stops at its first move that isn't allowed: against the rules, out of turn, after the
+    game is over, or a square without a partner
+    """
+    for squares, first_illegal in (("e2 e4 e7 e5 e4 e5", 2), ("e2 e4 e4 e5", 1), ("e7 e5", 0),
+                                   (KING_HUNT + " a6 a5", 5), ("e2 e4 e7", 1)):
+        result = replay_game(squares.split())
+        assert not result.is_valid()
+        assert result.get_first_illegal() == first_illegal
+        assert result.get_ply_count() == first_illegal
+
+
+def test_malformed_squares():
+    """
+    A square that doesn't exist makes its move the first bad one instead of raising an error
+    """
+    for squares, first_illegal in (("e2 e9", 0), ("e2 e4 E7 e5", 1), ("e2 e4 d7 d5 x1 y2", 2)):
+        result = replay_game(squares.split())
+        assert result.get_first_illegal() == first_illegal
+        assert result.get_state() == "UNFINISHED"
+
+
+def test_line_numbers(tmp_path):
+    """
+    Blank lines are skipped but still counted, so every result names the line its game was on
+    """
+    path = tmp_path / "games.txt"
+    path.write_text("e2 e4\n\n" + KING_HUNT + "\n   \ne2 e9\n")
+    results = list(replay_file(str(path)))
+    assert [result.get_line_number() for result in results] == [1, 3, 5]
+    assert [result.get_first_illegal() for result in results] == [None, None, 0]
+    assert [result.get_state() for result in replay_lines(["e2 e4", KING_HUNT])] == ["UNFINISHED", "WHITE_WON"]
@@ -0,0 +1,26 @@
+# Author: Cooper Thompson
+# GitHub username: coopthompson
+# Date: October 18th, 2026
+# Description: Tests for self-play: runs have to be reproducible whatever the
+#              number of workers, and wins are reported per policy and color.
+
+from chess_game.SelfPlay import run_self_play
+
+
+def test_same_report_with_any_number_of_workers():
+    """
+    A run gives the same report in this process and across a pool of workers
+    """
+    alone = run_self_play(12, "random", "greedy", workers=1, seed=4, max_plies=60)
+    pooled = run_self_play(12, "random", "greedy", workers=3, seed=4, max_plies=60)
+    assert alone == pooled
+
+
+def test_wins_are_kept_apart_by_color():
+    """
+    With the same policy on both sides, the wins for each color still add up to the results
+    """
+    report = run_self_play(20, "random", "random", workers=1, seed=1)
+    assert list(report["wins"]) == ["random"]
+    assert report["wins"]["random"]["White"] == report["results"]["WHITE_WON"]
+    assert report["wins"]["random"]["Black"] == report["results"]["BLACK_WON"]
@@ -0,0 +1,91 @@
+# Author: Cooper Thompson
+# GitHub username: coopthompson
+# Date: October 18th, 2026
+# Description: Tests for the game server: requests answered without a socket,
+#              and bad lines on a real connection failing only that request.
+
+import asyncio
+import json
+
+from chess_game.Server import GameServer
+from chess_game.SessionStore import SessionStore
+
+
+def ask(server, request):
+    """
+    Sends a request to a server through handle_line and returns the decoded response
+    """
+    return json.loads(server.handle_line(json.dumps(request)))
+
+
+def test_play_a_game():
+    """
+    A game can be started, moved in, and read back, with ids copied into the responses
+    """
+    server = GameServer()
+    assert ask(server, {"op": "new", "game": "a", "id": 1}) == {
+        "id": 1, "ok": True, "game": "a", "fen": "rnbqkbnr/pppppppp/8/8/8/8/PPPPPPPP/RNBQKBNR w 0"}
+    assert ask(server, {"op": "move", "game": "a", "from": "e2", "to": "e4"}) == {
+        "ok": True, "moved": True, "state": "UNFINISHED", "turn": 1}
+    assert ask(server, {"op": "move", "game": "a", "from": "e4", "to": "e5"})["moved"] is False
+    assert ask(server, {"op": "board", "game": "a"})["fen"] == "rnbqkbnr/pppppppp/8/8/4P3/8/PPPP1PPP/RNBQKBNR b 1"
+    assert len(ask(server, {"op": "legal", "game": "a"})["moves"]) == 20
+    assert ask(server, {"op": "count"})["games"] == 1
+    assert ask(server, {"op": "close", "game": "a"})["ok"] is True
+    assert ask(server, {"op": "count"})["games"] == 0
+
+
+def test_bad_requests_get_errors():
+    """
+    Requests that can't be carried out are answered with an error instead of raising
+    """
+    server = GameServer(max_games=1)
+    assert ask(server, {"op": "new", "game": "a"})["ok"] is True
+    for request in ([1], {"op": "fly"}, {"op": "state", "game": "b"}, {"op": "new", "game": "b"},
+                    {"op": "move", "game": "a", "from": "e2"}, {"op": "move", "game": "a", "from": "e2", "to": "z9"},
+                    {"op": "metrics"}):
+        response = ask(server, request)
+        assert response["ok"] is False
+        assert response["error"]
+    assert json.loads(server.handle_line("{not json"))["ok"] is False
+
+
+def test_long_game_ids_are_rejected(tmp_path):
+    """
+    A game id too long to name a spill file after is turned down, and the games already hosted
+    aren't touched
+    """
+    server = GameServer(store=SessionStore(str(tmp_path), max_games=1))
+    assert ask(server, {"op": "new", "game": "a"})["ok"] is True
+    assert ask(server, {"op": "move", "game": "a", "from": "e2", "to": "e4"})["moved"] is True
+    for game_id in ("x" * 200, "\u00e9" * 60, "\ud800"):
+        response = ask(server, {"op": "new", "game": game_id})
+        assert response["ok"] is False
+    assert ask(server, {"op": "new", "game": "x" * 100})["ok"] is True
+    assert ask(server, {"op": "state", "game": "a"}) == {"ok": True, "state": "UNFINISHED", "turn": 1}
+    assert ask(server, {"op": "count"})["games"] == 2
+
+
+def test_failing_line_keeps_the_connection():
+    """
+    A line that makes handle_line raise (JSON nested too deeply to decode) is answered with an
+    error, and the next request on the same connection still works
+    """
+    async def talk():
+        server = GameServer()
+        listener = await server.serve()
+        port = listener.sockets[0].getsockname()[1]
+        reader, writer = await asyncio.open_connection("127.0.0.1", port)
+        writer.write(b"[" * 20000 + b"]" * 20000 + b"\n")
+        writer.write(b'{"op": "count"}\n')
+        await writer.drain()
+        responses = [json.loads(await reader.readline()) for index in range(2)]
+        writer.close()
+        listener.close()
+        await listener.wait_closed()
+        return responses
+
+    failed, counted = asyncio.run(talk())
+    assert failed["ok"] is False
+    assert "RecursionError" in failed["error"]
+    assert counted == {"ok": True, "games": 0}
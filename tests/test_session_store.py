@@ -0,0 +1,78 @@
+# Author: Cooper Thompson
+# GitHub username: coopthompson
+# Date: October 18th, 2026
+# Description: Tests for the SessionStore: games put into it, spilled to disk,
+#              and read back have to come back in the same position.
+
+from chess_game.ChessVar import ChessVar
+from chess_game.SessionStore import SessionStore
+
+
+def test_put_spill_and_reload(tmp_path):
+    """
+    A game that asked for its attack maps (so its Bitboard holds them) can be put into the store,
+    spilled by newer games, and read back in the same position
+    """
+    store = SessionStore(str(tmp_path), max_games=1)
+    game = ChessVar()
+    game.make_move("e2", "e4")
+    game.get_attacked_squares("White")
+    store["a"] = game
+    store["b"] = ChessVar()
+    assert store.get_metrics()["spills"] == 1
+    assert (tmp_path / ("a".encode().hex() + ".game")).exists()
+
+    reloaded = store["a"]
+    assert reloaded is not game
+    assert reloaded.to_fen() == game.to_fen()
+    assert reloaded.get_turn_number() == 1
+    assert store.make_move("a", "e7", "e5")
+    assert store.get_metrics()["misses"] == 1
+
+
+def test_spilled_games_survive_a_new_store(tmp_path):
+    """
+    Games spilled by one store are picked up by the next store using the same directory
+    """
+    store = SessionStore(str(tmp_path))
+    store["g1"] = ChessVar()
+    store.make_move("g1", "d2", "d4")
+    store.spill_all()
+
+    store = SessionStore(str(tmp_path))
+    assert "g1" in store
+    assert store["g1"].to_fen() == "rnbqkbnr/pppppppp/8/8/3P4/8/PPP1PPPP/RNBQKBNR b 1"
+
+
+def test_size_estimate_does_not_grow_with_moves(tmp_path):
+    """
+    The memory estimate stays the same however many moves are made with make_move
+    """
+    store = SessionStore(str(tmp_path), max_bytes=10 ** 6)
+    store["g"] = ChessVar()
+    size = store.get_metrics()["resident_bytes"]
+    for square_from, square_to in (("b1", "c3"), ("b8", "c6"), ("c3", "b1"), ("c6", "b8")) * 10:
+        assert store.make_move("g", square_from, square_to)
+    assert store.get_metrics()["resident_bytes"] == size
+
+
+def test_failed_spill_keeps_the_game(tmp_path):
+    """
+    A game that can't be written to disk stays in memory, and the store goes on working
+    """
+    store = SessionStore(str(tmp_path), max_games=1)
+    store["a"] = ChessVar()
+    assert store.make_move("a", "e2", "e4")
+    # A directory where the snapshot's temporary file has to go makes writing it fail.
+    blocker = tmp_path / ("a".encode().hex() + ".game.tmp")
+    blocker.mkdir()
+    store["b"] = ChessVar()
+    metrics = store.get_metrics()
+    assert (metrics["spills"], metrics["failed_spills"], metrics["resident_games"]) == (0, 1, 2)
+    assert store["a"].to_fen() == "rnbqkbnr/pppppppp/8/8/4P3/8/PPPP1PPP/RNBQKBNR b 1"
+
+    blocker.rmdir()
+    store["c"] = ChessVar()
+    assert store.get_metrics()["spills"] == 2
+    assert store["a"].get_turn_number() == 1
+    assert len(store) == 3
@@ -0,0 +1,110 @@
+# Author: Cooper Thompson
+# GitHub username: coopthompson
+# Date: October 18th, 2026
+# Description: Tests for the tablebases: a small table built by retrograde
+#              analysis has to agree with searching every position directly.
+
+from chess_game.Bitboard import Bitboard, EMPTY
+from chess_game.ChessVar import ChessVar
+from chess_game.Tablebase import (HEADER_SIZE, INVALID, Tablebase, build_table, main, parse_signature,
+                                  position_index, table_path)
+
+# The brute force search below looks this many moves ahead.
+SEARCH_DEPTH = 4
+
+
+def search(board, player, depth, memo):
+    """
+    Searches a position on a Bitboard by trying every line of play up to depth moves, and returns
+    what a table should hold for it if the result is decided that soon: the number of moves until
+    the game is won, odd if the player to move wins and even if they lose, or 0 if it isn't decided
+    within depth moves
+    """
+    key = (board.get_hash(), player, depth)
+    if key in memo:
+        return memo[key]
+    value = 0
+    if depth > 0:
+        fastest_win = None
+        slowest_loss = 0
+        escapes = False
+        for move in board.generate_moves(player):
+            square_from = move & 63
+            square_to = move >> 6
+            captured = board.piece_at(square_to)
+            if captured != EMPTY and board.get_count(captured // 6, captured % 6) == 1:
+                fastest_win = 1
+                break
+            board.move_piece(square_from, square_to)
+            child = search(board, 1 - player, depth - 1, memo)
+            board.move_piece(square_to, square_from)
+            if captured != EMPTY:
+                board.put_piece(captured, square_to)
+            if child and child % 2 == 0:
+                if fastest_win is None or child + 1 < fastest_win:
+                    fastest_win = child + 1
+            elif child:
+                slowest_loss = max(slowest_loss, child + 1)
+            else:
+                escapes = True
+        if fastest_win is not None:
+            value = fastest_win
+        elif slowest_loss and not escapes:
+            value = slowest_loss
+    memo[key] = value
+    return value
+
+
+def test_table_matches_search(tmp_path):
+    """
+    Every position of the Queen against the King table that is decided within SEARCH_DEPTH moves
+    has the distance searching finds, every other one is left undecided by the search, and probe
+    and best_move agree with the table
+    """
+    signature = parse_signature("QvK")
+    build_table(str(tmp_path), signature)
+    tablebase = Tablebase(str(tmp_path))
+    table = tablebase.get_table(signature)
+    memo = {}
+    decided = 0
+    for queen in range(64):
+        for king in range(64):
+            if queen == king:
+                continue
+            for player in (0, 1):
+                value = table[HEADER_SIZE + position_index(signature, (queen, king), player)]
+                assert value != INVALID
+                bitboards = [0] * 12
+                bitboards[signature[0]] = 1 << queen
+                bitboards[signature[1]] = 1 << king
+                board = Bitboard()
+                board.set_pieces(bitboards)
+                found = search(board, player, SEARCH_DEPTH, memo)
+                if value and value <= SEARCH_DEPTH:
+                    assert found == value
+                    decided += 1
+                else:
+                    assert found == 0
+                    continue
+
+                game = ChessVar.from_bitboards(bitboards, player)
+                assert tablebase.probe(game) == ("WIN" if value % 2 else "LOSS", value)
+                move = tablebase.best_move(game)
+                captured = board.piece_at(move >> 6)
+                if captured == EMPTY:
+                    board.move_piece(move & 63, move >> 6)
+                    assert search(board, 1 - player, value - 1, memo) == value - 1
+                else:
+                    assert value == 1
+    tablebase.close()
+    assert decided > 1000
+
+
+def test_build_command_creates_the_directory(tmp_path):
+    """
+    Building a single table from the command line creates the directory it goes in
+    """
+    directory = tmp_path / "tables"
+    assert main(["build", str(directory), "--signature", "KvK"]) == 0
+    assert (directory / "KvK.cvtb").exists()
+    assert table_path(str(directory), parse_signature("KvK")) == str(directory / "KvK.cvtb")